@@ -2,10 +2,12 @@
 
 from . import agents  # noqa: F401
 from . import auth  # noqa: F401
+from . import changes  # noqa: F401
 from . import chat  # noqa: F401
 from . import dashboard  # noqa: F401
 from . import health  # noqa: F401
 from . import knowledge  # noqa: F401
+from . import llm_cache  # noqa: F401
 from . import projects  # noqa: F401
 from . import review  # noqa: F401
 from . import standup  # noqa: F401
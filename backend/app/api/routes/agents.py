@@ -1,14 +1,26 @@
 # backend/app/api/routes/agents.py
 
-from typing import Literal
+import asyncio
+import json
+from typing import Any, Dict, List, Literal
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
+from app.core.llm_gateway import LLMQueueFullError
+from app.schemas.job import BackgroundJob, BackgroundJobCreated
 from app.services.agents.sdlc_demo import sdlc_orchestrator
+from app.services.job_store import get_job, save_job_progress_async, start_background_job
 
 router = APIRouter()
 
+SDLC_JOB_KIND = "sdlc_demo"
+
+# Comment line sent when no event was emitted for this long, so proxies
+# do not close an idle stream while an agent is waiting for the LLM.
+SSE_KEEPALIVE_SECONDS = 15.0
+
 
 ModeLiteral = Literal["feature", "pr_review", "bug"]
 
@@ -16,23 +28,147 @@ ModeLiteral = Literal["feature", "pr_review", "bug"]
 class SdlcDemoRequest(BaseModel):
     mode: ModeLiteral = Field(..., description="feature | pr_review | bug")
     input: str = Field(..., description="Feature request, PR diff, or bug report")
+    execution: Literal["sequential", "dag"] = Field(
+        "sequential",
+        description="sequential: one agent at a time; dag: independent agents run concurrently",
+    )
+    context_policy: Literal["bounded", "full"] = Field(
+        "bounded",
+        description="bounded: each agent gets only its relevant artifacts within a token budget; full: all previous output",
+    )
     # Optional place for future: pr_diff, logs, etc.
 
 
 class SdlcDemoResponse(BaseModel):
     mode: ModeLiteral
+    execution: Literal["sequential", "dag"] = "sequential"
+    context_policy: Literal["bounded", "full"] = "bounded"
     transcript: list[dict]
     artifacts: dict
+    # total_ms (wall clock) and agents_ms (sum of per-agent durations)
+    timings: dict = {}
+    # Estimated prompt tokens sent across all agents
+    prompt_tokens: int = 0
 
 
-@router.post("/sdlc_demo", response_model=SdlcDemoResponse)
-async def run_sdlc_demo(req: SdlcDemoRequest):
+def _validate_input(req: SdlcDemoRequest) -> None:
     if not req.input.strip():
         raise HTTPException(status_code=400, detail="Input cannot be empty")
 
+
+def _sse(event: str, data: Dict[str, Any]) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+@router.post("/sdlc_demo", response_model=SdlcDemoResponse)
+async def run_sdlc_demo(req: SdlcDemoRequest):
+    _validate_input(req)
+
     result = await sdlc_orchestrator.run(
         mode=req.mode,
         user_input=req.input,
         extra_payload={},
+        execution=req.execution,
+        context_policy=req.context_policy,
     )
     return result
+
+
+@router.post("/sdlc_demo/stream")
+async def stream_sdlc_demo(req: SdlcDemoRequest):
+    """
+    Same pipeline as POST /sdlc_demo, streamed as Server-Sent Events:
+
+      agent_started   {agent, artifact, inputs}
+      token           {agent, artifact, delta}
+      agent_finished  {agent, artifact, message, inputs, prompt_tokens, ...}
+      done            {result}   same body as POST /sdlc_demo
+      error           {detail, retry_after?}
+
+    Keepalive comments are sent while waiting on the LLM. Closing the
+    connection cancels the run.
+    """
+    _validate_input(req)
+
+    queue: "asyncio.Queue[Dict[str, Any]]" = asyncio.Queue()
+
+    async def run_pipeline() -> None:
+        try:
+            result = await sdlc_orchestrator.run(
+                mode=req.mode,
+                user_input=req.input,
+                extra_payload={},
+                execution=req.execution,
+                context_policy=req.context_policy,
+                on_event=queue.put,
+                stream=True,
+            )
+        except LLMQueueFullError as e:
+            await queue.put(
+                {"event": "error", "detail": "LLM server is busy. Please retry shortly.", "retry_after": e.retry_after}
+            )
+        except Exception as e:
+            await queue.put({"event": "error", "detail": str(e) or type(e).__name__})
+        else:
+            await queue.put({"event": "done", "result": result})
+
+    async def events():
+        task = asyncio.create_task(run_pipeline())
+        try:
+            while True:
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=SSE_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+
+                name = event.pop("event")
+                yield _sse(name, event)
+                if name in ("done", "error"):
+                    break
+        finally:
+            task.cancel()
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.post("/sdlc_demo/jobs", response_model=BackgroundJobCreated, status_code=202)
+async def create_sdlc_demo_job(req: SdlcDemoRequest):
+    """
+    Run the pipeline as a background job. Poll GET /sdlc_demo/jobs/{job_id};
+    the transcript is saved after each agent and the full response when done.
+    """
+    _validate_input(req)
+
+    async def work(job_id: str) -> Dict[str, Any]:
+        transcript: List[Dict[str, Any]] = []
+
+        async def on_event(event: Dict[str, Any]) -> None:
+            if event["event"] == "agent_finished":
+                entry = {k: v for k, v in event.items() if k not in ("event", "artifact")}
+                transcript.append(entry)
+                await save_job_progress_async(job_id, {"mode": req.mode, "transcript": transcript})
+
+        return await sdlc_orchestrator.run(
+            mode=req.mode,
+            user_input=req.input,
+            extra_payload={},
+            execution=req.execution,
+            context_policy=req.context_policy,
+            on_event=on_event,
+        )
+
+    job = await start_background_job(SDLC_JOB_KIND, req.model_dump(), work)
+    return BackgroundJobCreated(job_id=job.id, status=job.status)
+
+
+@router.get("/sdlc_demo/jobs/{job_id}", response_model=BackgroundJob)
+def get_sdlc_demo_job(job_id: str):
+    job = get_job(job_id, kind=SDLC_JOB_KIND)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
@@ -2,6 +2,8 @@
 from fastapi import APIRouter, HTTPException, Depends, status
 from fastapi.security import HTTPAuthorizationCredentials
 
+from app.core.fast_json import FastJSONResponse
+
 from app.schemas.user import (
     UserCreate,
     UserPublic,
@@ -20,7 +22,7 @@ from app.services.user_store import (
     create_user,
     verify_user_credentials,
     create_session,
-    list_users,
+    list_user_dicts,
     # new store functions
     update_user_profile,
     change_user_password,
@@ -236,8 +238,8 @@ def get_users(_: UserPublic = Depends(require_admin)):
     """
     List all users (admin only).
     """
-    items = list_users()
-    return UserList(items=items)
+    items = list_user_dicts()
+    return FastJSONResponse({"items": items})
 
 
 @router.put("/users/{user_id}", response_model=UserPublic)
@@ -0,0 +1,124 @@
+# backend/app/api/routes/changes.py
+
+import time
+from typing import Any, Dict, Optional
+
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import StreamingResponse
+
+from app.core.config import settings
+from app.core.fast_json import dumps
+from app.db_async import run_db
+from app.schemas.user import UserPublic
+from app.services.auth_service import get_current_user_or_query_token
+from app.services.change_feed import ChangeFeedFilter
+from app.services.change_log import (
+    change_log_bounds,
+    read_changes,
+    subscribe,
+    unsubscribe,
+)
+
+router = APIRouter(prefix="/changes", tags=["changes"])
+
+# change_log rows read (and filtered) per query
+CHANGE_FEED_BATCH_SIZE = 500
+# EventSource reconnect delay sent to clients
+SSE_RETRY_MS = 3000
+
+
+def _sse(event: str, data: Dict[str, Any], event_id: Optional[int] = None) -> str:
+    head = f"id: {event_id}\n" if event_id is not None else ""
+    return f"{head}event: {event}\ndata: {dumps(data).decode('utf-8')}\n\n"
+
+
+def _resume_cursor(resume_from: Optional[int]) -> tuple:
+    """
+    (cursor, reset): where to start reading, and whether changes after
+    resume_from were already trimmed (or the id is from another database).
+    """
+    oldest, latest = change_log_bounds()
+    if resume_from is None:
+        return latest, False
+    if resume_from > latest:
+        return latest, True
+    if resume_from < latest and (oldest is None or oldest > resume_from + 1):
+        return latest, True
+    return resume_from, False
+
+
+@router.get("/stream")
+async def stream_changes(
+    request: Request,
+    last_event_id: Optional[int] = Query(
+        None,
+        ge=0,
+        description="Resume after this change id (the Last-Event-ID header takes precedence)",
+    ),
+    current_user: UserPublic = Depends(get_current_user_or_query_token),
+):
+    """
+    Server-Sent Events feed of task, standup, project and membership changes
+    visible to the current user:
+
+      ready   {last_event_id}              stream is live from this id
+      change  {entity, op, id, data}       data is the current row (as in the
+                                           list endpoints), null for deletes
+      reset   {last_event_id}              changes since the requested id were
+                                           trimmed; reload lists, then continue
+
+    Every change carries its change_log id as the SSE id, so browsers resume
+    with Last-Event-ID after a reconnect. Without one the stream starts at the
+    newest change. EventSource clients can pass the session token as ?token=.
+    """
+    header = request.headers.get("last-event-id", "").strip()
+    resume_from = int(header) if header.isdigit() else last_event_id
+
+    feed = await run_db(ChangeFeedFilter, current_user)
+    cursor, reset = await run_db(_resume_cursor, resume_from)
+
+    async def events():
+        nonlocal cursor
+        subscription = subscribe()
+        try:
+            yield f"retry: {SSE_RETRY_MS}\n\n"
+            if reset:
+                yield _sse("reset", {"last_event_id": cursor}, cursor)
+            yield _sse("ready", {"last_event_id": cursor}, cursor)
+
+            sent_id = cursor
+            last_write = time.monotonic()
+            while True:
+                rows = await run_db(read_changes, cursor, CHANGE_FEED_BATCH_SIZE)
+                if rows:
+                    for event in await run_db(feed.events, rows):
+                        change_id = event.pop("change_id")
+                        yield _sse("change", event, change_id)
+                        sent_id = change_id
+                        last_write = time.monotonic()
+                    cursor = rows[-1]["id"]
+                    if len(rows) == CHANGE_FEED_BATCH_SIZE:
+                        continue
+
+                # Woken by writes in this process; the timeout covers other workers
+                idle = time.monotonic() - last_write
+                timeout = min(
+                    settings.CHANGE_FEED_POLL_SECONDS,
+                    max(0.0, settings.CHANGE_FEED_KEEPALIVE_SECONDS - idle),
+                )
+                if await subscription.wait(timeout):
+                    continue
+                if time.monotonic() - last_write >= settings.CHANGE_FEED_KEEPALIVE_SECONDS:
+                    # An id-only message moves the client's Last-Event-ID past
+                    # changes it was not allowed to see
+                    yield f": keepalive\nid: {cursor}\n\n" if cursor != sent_id else ": keepalive\n\n"
+                    sent_id = cursor
+                    last_write = time.monotonic()
+        finally:
+            unsubscribe(subscription)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -1,4 +1,6 @@
 # filename: backend/app/api/routes/dashboard.py
+from typing import Optional
+
 from fastapi import APIRouter, Query, Depends
 
 from app.schemas.dashboard import DashboardSummary
@@ -20,6 +22,14 @@ async def get_summary(
     False,
     description="If true, enrich the dashboard summary using Knowledgebase (RAG).",
   ),
+  max_age: Optional[float] = Query(
+    None,
+    ge=0,
+    description=(
+      "Maximum age in seconds of a cached summary. Defaults to the server TTL; "
+      "0 forces a fresh generation."
+    ),
+  ),
   current_user: UserPublic = Depends(get_current_user),
 ):
   """
@@ -32,10 +42,14 @@ async def get_summary(
   - When use_rag = false (default): use the original summary prompt only.
   - When use_rag = true: call the unified chat/RAG pipeline to optionally
     pull in KB context as well.
+
+  Summaries are cached per visible context and invalidated by standup/project
+  writes; concurrent identical requests share one LLM call.
   """
   summary, standup_count, project_count, knowledge_docs = await summarize_dashboard(
     current_user=current_user,
     use_rag=use_rag,
+    max_age=max_age,
   )
   return DashboardSummary(
     summary=summary,
@@ -1,18 +1,35 @@
 # filename: backend/app/api/routes/health.py
-from typing import Literal
+from typing import Any, Dict, List, Literal
 
 from fastapi import APIRouter
 from pydantic import BaseModel
 
 from app.core.llm_client import llm_chat
+from app.core.llm_balancer import get_llm_balancer
+from app.core.llm_coalescer import get_llm_coalescer, is_llm_error_reply
+from app.core.llm_gateway import get_llm_gateway
+from app.core.loop_monitor import get_loop_monitor
 from app.services.knowledge import list_documents
 
 router = APIRouter(prefix="/health", tags=["health"])
 
 
+class LLMEndpointHealth(BaseModel):
+    url: str
+    state: Literal["healthy", "degraded", "ejected"]
+    outstanding: int
+    ewma_latency_ms: float | None = None
+    requests: int
+    failures: int
+    consecutive_failures: int
+    ejected_for_seconds: float
+    last_error: str | None = None
+
+
 class LLMHealth(BaseModel):
     status: Literal["ok", "error"]
     detail: str | None = None
+    endpoints: List[LLMEndpointHealth] = []
 
 
 class KnowledgeHealth(BaseModel):
@@ -24,8 +41,9 @@ class KnowledgeHealth(BaseModel):
 @router.get("/llm", response_model=LLMHealth)
 async def llm_health() -> LLMHealth:
     """
-    Lightweight health check for the local LLM server.
-    Calls llm_chat() with a tiny prompt and reports success/failure.
+    Lightweight health check for the local LLM server(s).
+    Calls llm_chat() with a tiny prompt and reports success/failure, plus the
+    passive health state of every configured endpoint (see llm_balancer.py).
     """
     messages = [
         {
@@ -39,13 +57,48 @@ async def llm_health() -> LLMHealth:
     ]
 
     try:
-        reply = await llm_chat(messages)
-        if reply:
+        reply = await llm_chat(messages, priority="interactive")
+        if not reply:
+            status, detail = "error", "Empty reply from LLM."
+        elif is_llm_error_reply(reply):
+            status, detail = "error", reply
+        else:
             # Do not leak full reply; we just care that it responded.
-            return LLMHealth(status="ok", detail=None)
-        return LLMHealth(status="error", detail="Empty reply from LLM.")
+            status, detail = "ok", None
     except Exception as e:  # pragma: no cover - defensive
-        return LLMHealth(status="error", detail=str(e))
+        status, detail = "error", str(e)
+
+    endpoints = [LLMEndpointHealth(**ep) for ep in get_llm_balancer().stats()]
+    return LLMHealth(status=status, detail=detail, endpoints=endpoints)
+
+
+@router.get("/llm/stats")
+def llm_coalescing_stats() -> Dict[str, Any]:
+    """
+    Coalescing counters for LLM calls that opted in, overall and per endpoint:
+    requests, upstream_calls, coalesced (joined an in-flight call) and
+    cache_hits (served from the short TTL response cache).
+    """
+    return get_llm_coalescer().stats()
+
+
+@router.get("/llm/queue")
+def llm_queue_stats() -> Dict[str, Any]:
+    """
+    LLM gateway state: active/queued requests and, per priority class,
+    admitted/rejected counts and recent queue wait times (ms).
+    """
+    return get_llm_gateway().stats()
+
+
+@router.get("/loop")
+def loop_lag_stats() -> Dict[str, Any]:
+    """
+    Event loop lag (loop_monitor.py): how late a periodic timer fires, as
+    recent p50/p99/max in ms, plus the number of stalls above
+    LOOP_MONITOR_STALL_MS. Sustained lag means something blocks the loop.
+    """
+    return get_loop_monitor().stats()
 
 
 @router.get("/knowledge", response_model=KnowledgeHealth)
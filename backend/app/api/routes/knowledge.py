@@ -1,4 +1,5 @@
-from typing import Optional, List
+import asyncio
+from typing import Any, Dict, Optional, List
 from pathlib import Path
 
 from fastapi import (
@@ -30,13 +31,17 @@ from app.services.knowledge import (
     index_files_in_knowledgebase,
 )
 from app.services.knowledge.client import get_collection
+from app.services.knowledge.embedder import get_embed_model_key
+from app.services.knowledge.embedding_cache import get_embedding_cache
 from app.services.knowledge.manifest import load_manifest, MANIFEST_PATH
 from app.services.knowledge.diagnostics import (
     debug_document_by_path,
     run_diagnostics,
 )
 from app.services.knowledge.paths import classify_doc_path
+from app.core.config import settings
 from app.core.llm_client import llm_chat
+from app.core.llm_gateway import LLMQueueFullError
 
 router = APIRouter(prefix="/knowledge", tags=["knowledge"])
 
@@ -56,6 +61,12 @@ def build_fallback_answer(sources: List[KnowledgeSourceChunk]) -> str:
     return "\n".join(lines).strip()
 
 
+def _save_upload(save_path: Path, content: bytes) -> None:
+    KNOWLEDGE_DIR.mkdir(parents=True, exist_ok=True)
+    with save_path.open("wb") as f:
+        f.write(content)
+
+
 @router.post("/query", response_model=KnowledgeQueryResponse)
 async def query_knowledge_endpoint(
     payload: KnowledgeQueryRequest,
@@ -70,8 +81,9 @@ async def query_knowledge_endpoint(
     3) Call the shared llm_chat() helper.
     4) If the LLM call fails or returns empty, fall back to stitched snippets.
     """
-    # 1) Retrieve relevant chunks from Chroma
-    sources: List[KnowledgeSourceChunk] = query_knowledge(
+    # 1) Retrieve relevant chunks from Chroma (embedding + disk: worker thread)
+    sources: List[KnowledgeSourceChunk] = await asyncio.to_thread(
+        query_knowledge,
         query=payload.query,
         top_k=payload.top_k,
     )
@@ -124,10 +136,19 @@ Instructions:
 
     # 4) Call the same LLM client as /api/chat, with safe fallback
     try:
-        llm_answer = await llm_chat(messages)
+        llm_answer = await llm_chat(
+            messages,
+            coalesce=True,
+            cache_ttl=settings.LLM_RESPONSE_CACHE_TTL_SECONDS,
+            endpoint="knowledge_query",
+            priority="interactive",
+        )
         answer = (llm_answer or "").strip()
         if not answer:
             answer = build_fallback_answer(sources)
+    except LLMQueueFullError:
+        # Let the app-level handler answer 503 with Retry-After
+        raise
     except Exception as e:  # pragma: no cover - defensive
         print(f"[knowledge] LLM call via llm_chat failed, using fallback: {e}")
         answer = build_fallback_answer(sources)
@@ -148,7 +169,8 @@ async def add_text_document_endpoint(
     if not payload.text.strip():
         raise HTTPException(status_code=400, detail="Text is required.")
 
-    add_text_document(
+    await asyncio.to_thread(
+        add_text_document,
         title=payload.title.strip(),
         text=payload.text,
     )
@@ -175,13 +197,11 @@ async def upload_file_to_knowledgebase(
             detail="Unsupported file type. Allowed: .pdf, .txt, .md",
         )
 
-    KNOWLEDGE_DIR.mkdir(parents=True, exist_ok=True)
     save_path = KNOWLEDGE_DIR / file.filename
 
     try:
-        with save_path.open("wb") as f:
-            content = await file.read()
-            f.write(content)
+        content = await file.read()
+        await asyncio.to_thread(_save_upload, save_path, content)
     except Exception as e:  # pragma: no cover - filesystem failure
         raise HTTPException(
             status_code=500,
@@ -190,7 +210,7 @@ async def upload_file_to_knowledgebase(
 
     # Index just this file
     try:
-        index_single_file(save_path)
+        await asyncio.to_thread(index_single_file, save_path)
     except Exception as e:  # pragma: no cover - indexing failure
         raise HTTPException(
             status_code=500,
@@ -207,7 +227,7 @@ async def list_knowledge_documents(
     """
     List documents currently indexed in the knowledgebase (from Chroma metadata).
     """
-    docs = list_documents()
+    docs = await asyncio.to_thread(list_documents)
     return docs
 
 
@@ -224,6 +244,7 @@ class KnowledgeHealth(BaseModel):
     documents_in_manifest: int
     files_in_knowledge_dir: int
     vector_count: Optional[int] = None
+    embedding_cache: Optional[Dict[str, Any]] = None
     notes: List[str] = []
 
 
@@ -271,7 +292,7 @@ async def delete_knowledge_document(
     if not title:
         raise HTTPException(status_code=400, detail="Title is required.")
 
-    delete_document(title=title, path=payload.path)
+    await asyncio.to_thread(delete_document, title=title, path=payload.path)
     return {"status": "ok"}
 
 
@@ -284,6 +305,7 @@ def _compute_knowledge_health() -> KnowledgeHealth:
     - chroma_store/
     - manifest file
     - Chroma collection vector count
+    - embedding cache size and hit ratio
     """
     notes: List[str] = []
 
@@ -316,6 +338,12 @@ def _compute_knowledge_health() -> KnowledgeHealth:
     except Exception as e:
         notes.append(f"Failed to query Chroma collection: {e}")
 
+    embedding_cache: Optional[Dict[str, Any]] = None
+    try:
+        embedding_cache = get_embedding_cache(get_embed_model_key()).stats()
+    except Exception as e:
+        notes.append(f"Failed to read embedding cache stats: {e}")
+
     # Basic status heuristic
     if not knowledge_dir_exists:
         status = "empty"
@@ -342,6 +370,7 @@ def _compute_knowledge_health() -> KnowledgeHealth:
         documents_in_manifest=documents_in_manifest,
         files_in_knowledge_dir=files_in_knowledge_dir,
         vector_count=vector_count,
+        embedding_cache=embedding_cache,
         notes=notes,
     )
 
@@ -359,7 +388,7 @@ async def get_knowledge_health(
     - Is the manifest present and populated?
     - How many files & vectors are present?
     """
-    return _compute_knowledge_health()
+    return await asyncio.to_thread(_compute_knowledge_health)
 
 
 @router.post("/reindex", response_model=KnowledgeHealth)
@@ -378,8 +407,8 @@ async def reindex_knowledge(
     """
     # In the future you can add RBAC checks here, e.g. only admins:
     # if not current_user.is_admin: raise HTTPException(...)
-    index_files_in_knowledgebase()
-    return _compute_knowledge_health()
+    await asyncio.to_thread(index_files_in_knowledgebase)
+    return await asyncio.to_thread(_compute_knowledge_health)
 
 
 @router.get("/debug_document", response_model=DocumentDebug)
@@ -393,7 +422,7 @@ async def debug_knowledge_document(
 
     This is intended for internal developer use when investigating RAG issues.
     """
-    raw = debug_document_by_path(path)
+    raw = await asyncio.to_thread(debug_document_by_path, path)
 
     return DocumentDebug(
         status=raw.get("status", "unknown"),
@@ -429,7 +458,7 @@ async def diagnostics_knowledge(
 
     'limit_files' bounds the number of files scanned on disk for performance.
     """
-    raw = run_diagnostics(limit_files=limit_files)
+    raw = await asyncio.to_thread(run_diagnostics, limit_files=limit_files)
 
     issues = [
         DiagnosticsIssue(
@@ -0,0 +1,65 @@
+# backend/app/api/routes/llm_cache.py
+
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+
+from app.schemas.llm_cache import LLMCacheEntryList, LLMCachePurgeResult, LLMCacheStats
+from app.schemas.user import UserPublic
+from app.services.auth_service import require_admin
+from app.services.llm_cache_store import (
+    delete_cache_entry,
+    get_cache_stats,
+    list_cache_entries,
+    purge_cache,
+)
+
+router = APIRouter(prefix="/llm_cache", tags=["llm_cache"])
+
+
+@router.get("/stats", response_model=LLMCacheStats)
+def llm_cache_stats(_: UserPublic = Depends(require_admin)):
+    """
+    Size, hit count and per-namespace breakdown of the persistent LLM cache.
+    Admin only.
+    """
+    return get_cache_stats()
+
+
+@router.get("/entries", response_model=LLMCacheEntryList)
+def llm_cache_entries(
+    namespace: Optional[str] = Query(None, description="Filter by namespace (e.g. 'review')"),
+    limit: int = Query(50, ge=1, le=500),
+    _: UserPublic = Depends(require_admin),
+):
+    """
+    Most recently used cache entries with prompt/response previews. Admin only.
+    """
+    return LLMCacheEntryList(items=list_cache_entries(namespace=namespace, limit=limit))
+
+
+@router.delete("", response_model=LLMCachePurgeResult)
+def llm_cache_purge(
+    namespace: Optional[str] = Query(None, description="Only purge this namespace"),
+    _: UserPublic = Depends(require_admin),
+):
+    """
+    Purge the whole cache, or one namespace. Admin only.
+    """
+    return LLMCachePurgeResult(deleted=purge_cache(namespace=namespace))
+
+
+@router.delete("/{cache_key}", response_model=LLMCachePurgeResult)
+def llm_cache_delete_entry(
+    cache_key: str,
+    _: UserPublic = Depends(require_admin),
+):
+    """
+    Delete a single cache entry. Admin only.
+    """
+    if not delete_cache_entry(cache_key):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Cache entry not found",
+        )
+    return LLMCachePurgeResult(deleted=1)
@@ -1,6 +1,6 @@
 # backend/app/api/routes/projects.py
 
-from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi import APIRouter, HTTPException, Depends, Query, Request
 from pydantic import BaseModel
 
 from app.schemas.project import (
@@ -14,7 +14,7 @@ from app.schemas.project import (
 )
 from app.services.projects import (
     add_project,
-    list_projects,
+    list_project_dicts,
     get_project_by_id,
     delete_project,
     update_project,
@@ -23,16 +23,14 @@ from app.services.projects.members import (
     add_project_member,
     list_project_members,
     remove_project_member,
-    list_projects_for_user,
+    list_project_dicts_for_user,
     get_user_role_for_project,
 )
-from app.services.project_permissions import (
-    require_project_view,
-    require_project_membership,
-    require_project_owner,
-)
+from app.services.project_permissions import ProjectAccess, get_project_access
 from app.services.project_summary import summarize_project_today
 from app.services.auth_service import get_current_user, require_admin
+from app.services.change_versions import conditional_list_response
+from app.db_async import run_db
 from app.schemas.user import UserPublic
 
 
@@ -53,6 +51,7 @@ def status():
 
 @router.get("", response_model=ProjectList)
 def get_projects(
+    request: Request,
     all: bool = Query(False, description="If true, admin sees all projects"),
     current_user: UserPublic = Depends(get_current_user),
 ):
@@ -62,6 +61,8 @@ def get_projects(
     Behavior:
     - If all=false (default): return only projects where the user is owner or member.
     - If all=true: requires admin, returns all projects.
+
+    Conditional (ETag / 304), like GET /api/projects/mine.
     """
     if all:
         # Admin-only global view
@@ -70,24 +71,41 @@ def get_projects(
                 status_code=403,
                 detail="Admin privileges required to list all projects",
             )
-        items = list_projects()
-    else:
-        items = list_projects_for_user(current_user.username)
+        return conditional_list_response(
+            request,
+            ["projects"],
+            lambda: {"items": list_project_dicts()},
+        )
 
-    return ProjectList(items=items)
+    return _my_projects_response(request, current_user.username)
 
 
 @router.get("/mine", response_model=ProjectList)
-def get_my_projects(current_user: UserPublic = Depends(get_current_user)):
+def get_my_projects(
+    request: Request,
+    current_user: UserPublic = Depends(get_current_user),
+):
     """
     List projects for the current user.
 
     Includes projects where:
     - the user is the project.owner, OR
     - the user is present in project_members with any role.
+
+    Responds with an ETag; a matching If-None-Match gets 304 without
+    running the query.
     """
-    items = list_projects_for_user(current_user.username)
-    return ProjectList(items=items)
+    return _my_projects_response(request, current_user.username)
+
+
+def _my_projects_response(request: Request, username: str):
+    # Any project write, or a membership change for this user, changes the list
+    return conditional_list_response(
+        request,
+        ["projects", f"project_members:{username}"],
+        lambda: {"items": list_project_dicts_for_user(username)},
+        username,
+    )
 
 
 @router.post("", response_model=Project)
@@ -116,7 +134,7 @@ def create_project(
 @router.get("/{project_id}/summary", response_model=ProjectSummary)
 async def project_summary(
     project_id: int,
-    current_user: UserPublic = Depends(get_current_user),
+    access: ProjectAccess = Depends(get_project_access),
 ):
     """
     View a project's summary.
@@ -126,7 +144,8 @@ async def project_summary(
     - user is project.owner, OR
     - user has any membership on the project (owner/member/viewer).
     """
-    proj = require_project_view(project_id, current_user)
+    # Permission checks hit SQLite; keep them off the event loop
+    await run_db(access.require_view, project_id)
 
     summary, count, project_name = await summarize_project_today(project_id)
     return ProjectSummary(
@@ -140,7 +159,7 @@ async def project_summary(
 @router.get("/{project_id}/members", response_model=ProjectMemberList)
 def get_project_members(
     project_id: int,
-    current_user: UserPublic = Depends(get_current_user),
+    access: ProjectAccess = Depends(get_project_access),
 ):
     """
     List members for a project.
@@ -150,7 +169,7 @@ def get_project_members(
     - current user is project.owner, OR
     - current user has any membership row on this project (owner/member/viewer).
     """
-    project = require_project_membership(project_id, current_user)
+    project = access.require_membership(project_id)
 
     items = list_project_members(project_id)
     return ProjectMemberList(items=items)
@@ -160,7 +179,7 @@ def get_project_members(
 def add_project_member_route(
     project_id: int,
     payload: ProjectMemberCreate,
-    current_user: UserPublic = Depends(get_current_user),
+    access: ProjectAccess = Depends(get_project_access),
 ):
     """
     Add or update a member for a project.
@@ -169,7 +188,7 @@ def add_project_member_route(
     - current user is admin, OR
     - current user is project.owner
     """
-    project = require_project_owner(project_id, current_user)
+    project = access.require_owner(project_id)
 
     member = add_project_member(
         project_id=project_id,
@@ -183,7 +202,7 @@ def add_project_member_route(
 def remove_project_member_route(
     project_id: int,
     username: str,
-    current_user: UserPublic = Depends(get_current_user),
+    access: ProjectAccess = Depends(get_project_access),
 ):
     """
     Remove a member from a project.
@@ -196,7 +215,7 @@ def remove_project_member_route(
     - The canonical owner (project.owner) cannot be removed from membership;
       ownership must be transferred or the project deleted instead.
     """
-    project = require_project_owner(project_id, current_user)
+    project = access.require_owner(project_id)
 
     if username == project.owner:
         raise HTTPException(
@@ -212,7 +231,7 @@ def remove_project_member_route(
 @router.delete("/{project_id}", status_code=204)
 def remove_project(
     project_id: int,
-    current_user: UserPublic = Depends(get_current_user),
+    access: ProjectAccess = Depends(get_project_access),
 ):
     """
     Delete a project.
@@ -220,7 +239,7 @@ def remove_project(
     - current user is admin, or
     - current user username matches project.owner
     """
-    require_project_owner(project_id, current_user)
+    access.require_owner(project_id)
 
     delete_project(project_id)
     return
@@ -230,7 +249,7 @@ def remove_project(
 def edit_project(
     project_id: int,
     payload: ProjectUpdate,
-    current_user: UserPublic = Depends(get_current_user),
+    access: ProjectAccess = Depends(get_project_access),
 ):
     """
     Edit a project.
@@ -239,7 +258,7 @@ def edit_project(
     - current user username matches project.owner
     """
     # Ensure user has permission and project exists
-    require_project_owner(project_id, current_user)
+    access.require_owner(project_id)
 
     updated = update_project(project_id, payload)
     if updated is None:
@@ -1,25 +1,29 @@
 from datetime import date as date_cls
-from typing import List, Optional, Literal
+from typing import Dict, List, Optional, Literal
 
-from fastapi import APIRouter, HTTPException, Query, Depends, status
+from fastapi import APIRouter, HTTPException, Query, Depends, Request, status
 from pydantic import BaseModel, Field
 
+from app.core.config import settings
+from app.services.project_permissions import ProjectAccess, get_project_access
 from app.services.standup.conversion import convert_standup_to_tasks
 from app.schemas.standup import StandupCreate, StandupEntry, StandupList, StandupUpdate
 from app.schemas.task import TaskList
 from app.services.standup_store import (
     add_standup,
-    get_today_standups,
-    get_standups_for_date,
     get_standup_by_id,
     delete_standup,
+    list_standup_dicts_for_date,
 )
 from app.services.standup_summary import (
     summarize_today_standups,
     summarize_standups_for_date,
+    summarize_standups_batch,
 )
 from app.services.task_store import list_tasks_for_standup
 from app.services.auth_service import get_current_user
+from app.services.change_versions import conditional_list_response
+from app.db_async import run_db
 from app.schemas.user import UserPublic
 
 router = APIRouter(prefix="/standup", tags=["standup"])
@@ -30,6 +34,33 @@ class StandupSummary(BaseModel):
     count: int
 
 
+class StandupBatchSummaryRequest(BaseModel):
+    start_date: date_cls
+    end_date: date_cls
+    project_ids: List[int] = Field(
+        default_factory=list,
+        description="Projects to summarize separately for each date",
+    )
+    include_overall: bool = Field(True, description="Include the team-wide summary per date")
+
+
+class StandupProjectDaySummary(BaseModel):
+    project_id: int
+    project_name: str
+    summary: str
+    count: int
+
+
+class StandupBatchDay(BaseModel):
+    overall: Optional[StandupSummary] = None
+    projects: Dict[int, StandupProjectDaySummary] = {}
+
+
+class StandupBatchSummaryResponse(BaseModel):
+    # Keyed by date (YYYY-MM-DD)
+    days: Dict[str, StandupBatchDay]
+
+
 class StandupTaskConversionItem(BaseModel):
     section: Literal["yesterday", "today", "blockers"]
     text: str = Field(..., min_length=1)
@@ -67,17 +98,43 @@ def submit_standup(
     return entry
 
 
+def _standups_for_date_response(request: Request, target: date_cls, name: Optional[str] = None):
+    """
+    Conditional (ETag / 304) list of standups for one date, optionally only
+    those authored by `name`. project_name is joined in, hence 'projects'.
+    """
+
+    def build() -> dict:
+        items = list_standup_dicts_for_date(target)
+        if name is not None:
+            items = [s for s in items if s["name"] == name]
+        return {"items": items}
+
+    return conditional_list_response(
+        request,
+        [f"standups:{target.isoformat()}", "projects"],
+        build,
+        target.isoformat(),
+        name,
+    )
+
+
 @router.get("/today", response_model=StandupList)
-def list_today():
+def list_today(request: Request):
     """
     Get all standup entries for today.
+
+    Responds with an ETag; a matching If-None-Match gets 304 without
+    running the query.
     """
-    items = get_today_standups()
-    return StandupList(items=items)
+    return _standups_for_date_response(request, date_cls.today())
 
 
 @router.get("/by-date", response_model=StandupList)
-def list_by_date(date: str = Query(..., description="Date in YYYY-MM-DD format")):
+def list_by_date(
+    request: Request,
+    date: str = Query(..., description="Date in YYYY-MM-DD format"),
+):
     """
     Get all standup entries for a specific date (YYYY-MM-DD).
     """
@@ -86,8 +143,7 @@ def list_by_date(date: str = Query(..., description="Date in YYYY-MM-DD format")
     except ValueError:
         raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD.")
 
-    items = get_standups_for_date(target)
-    return StandupList(items=items)
+    return _standups_for_date_response(request, target)
 
 
 @router.get("/summary", response_model=StandupSummary)
@@ -115,6 +171,48 @@ async def standup_summary(
     return StandupSummary(summary=summary, count=count)
 
 
+@router.post("/summary/batch", response_model=StandupBatchSummaryResponse)
+async def standup_summary_batch(
+    payload: StandupBatchSummaryRequest,
+    access: ProjectAccess = Depends(get_project_access),
+):
+    """
+    Generate standup summaries for a date range in one request: the team
+    summary per date and/or one summary per requested project per date.
+
+    Data is loaded in a few queries and the LLM calls run concurrently
+    (bounded by STANDUP_BATCH_CONCURRENCY). Past dates that were already
+    summarized are served from the persistent LLM cache.
+    """
+    if payload.end_date < payload.start_date:
+        raise HTTPException(status_code=400, detail="end_date must not be before start_date.")
+
+    span = (payload.end_date - payload.start_date).days + 1
+    if span > settings.STANDUP_BATCH_MAX_DAYS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Date range is limited to {settings.STANDUP_BATCH_MAX_DAYS} days.",
+        )
+
+    if not payload.include_overall and not payload.project_ids:
+        raise HTTPException(
+            status_code=400,
+            detail="Nothing to summarize: set include_overall or project_ids.",
+        )
+
+    # Permission checks hit SQLite; keep them off the event loop
+    for project_id in payload.project_ids:
+        await run_db(access.require_view, project_id)
+
+    days = await summarize_standups_batch(
+        payload.start_date,
+        payload.end_date,
+        project_ids=payload.project_ids,
+        include_overall=payload.include_overall,
+    )
+    return StandupBatchSummaryResponse(days=days)
+
+
 @router.delete("/{standup_id}", status_code=204)
 def remove_standup(
     standup_id: int,
@@ -173,6 +271,7 @@ def edit_standup(
 
 @router.get("", response_model=StandupList)
 def list_standups(
+    request: Request,
     date: str = Query(..., description="Date in YYYY-MM-DD"),
     mine: bool = Query(
         False,
@@ -194,11 +293,11 @@ def list_standups(
             detail="Invalid date format. Use YYYY-MM-DD.",
         )
 
-    items = get_standups_for_date(target_date)
-    if mine:
-        items = [s for s in items if s.name == current_user.username]
-
-    return StandupList(items=items)
+    return _standups_for_date_response(
+        request,
+        target_date,
+        current_user.username if mine else None,
+    )
 
 
 @router.get("/{standup_id}/tasks", response_model=TaskList)
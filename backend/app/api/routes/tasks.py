@@ -3,27 +3,31 @@
 from __future__ import annotations
 
 from datetime import date
-from typing import Optional, List
+from typing import Literal, Optional, List
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 
+from app.core.config import settings
 from app.schemas.task import (
+    TaskBulkCreateRequest,
     TaskBulkUpdateRequest,
     TaskCreate,
     TaskEntry,
     TaskList,
+    TaskStatsResponse,
     TaskUpdate,
 )
 from app.schemas.user import UserPublic
 from app.services.auth_service import get_current_user
-from app.services.project_permissions import (
-    require_project_view,
-    require_project_edit,
-)
+from app.services.change_versions import conditional_list_response
+from app.services.project_permissions import ProjectAccess, get_project_access
 from app.services.task_store import (
     add_task,
+    add_tasks_bulk,
+    bulk_update_tasks,
     get_task_by_id,
-    list_tasks,
+    get_task_stats,
+    list_task_dicts,
     update_task,
     delete_task,
 )
@@ -33,6 +37,7 @@ router = APIRouter(prefix="/tasks", tags=["tasks"])
 
 @router.get("", response_model=TaskList)
 def list_tasks_endpoint(
+    request: Request,
     mine: bool = Query(False, description="If true, limit to current user's tasks"),
     owner: Optional[str] = Query(
         None,
@@ -64,7 +69,8 @@ def list_tasks_endpoint(
         description="Deprecated; use is_active instead.",
     ),
     current_user: UserPublic = Depends(get_current_user),
-) -> TaskList:
+    access: ProjectAccess = Depends(get_project_access),
+) -> Response:
     """
     List tasks.
 
@@ -81,6 +87,9 @@ def list_tasks_endpoint(
       - If `owner` is provided, that user's tasks are returned.
       - If neither is provided, all tasks are returned.
       - Admins may query any `project_id`.
+
+    Conditional: responds with an ETag and answers a matching
+    If-None-Match with 304 without running the query.
     """
     effective_owner: Optional[str] = None
     is_admin = current_user.role == "admin"
@@ -107,7 +116,7 @@ def list_tasks_endpoint(
 
     # Project-scoped queries must respect project membership.
     if project_id is not None:
-        require_project_view(project_id, current_user)
+        access.require_view(project_id)
 
     # Normalize active-only semantics:
     # - is_active takes precedence if provided
@@ -119,23 +128,83 @@ def list_tasks_endpoint(
     else:
         effective_active_only = True
 
-    items = list_tasks(
-        owner=effective_owner,
+    # Rows come straight from our own table: skip per-row model validation
+    def build() -> dict:
+        items = list_task_dicts(
+            owner=effective_owner,
+            project_id=project_id,
+            status=status,
+            active_only=effective_active_only,
+            origin_standup_id=None,
+            search=search,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        return {"items": items}
+
+    # project_name is joined in, so project renames change the list too
+    task_scope = "tasks" if effective_owner is None else f"tasks:owner:{effective_owner}"
+    return conditional_list_response(
+        request,
+        [task_scope, "projects"],
+        build,
+        current_user.username,
+        effective_owner,
+    )
+
+
+@router.get("/stats", response_model=TaskStatsResponse)
+def task_stats_endpoint(
+    group_by: Literal["project", "owner"] = Query(
+        "project",
+        description="Group counts per project or per owner",
+    ),
+    owner: Optional[str] = Query(
+        None,
+        description="Only this owner's tasks; only admins may query other users.",
+    ),
+    project_id: Optional[int] = Query(None, description="Only this project's tasks"),
+    current_user: UserPublic = Depends(get_current_user),
+    access: ProjectAccess = Depends(get_project_access),
+) -> TaskStatsResponse:
+    """
+    Task counts by status, overdue counts and average progress, read from
+    the precomputed task aggregates (cost independent of task volume).
+
+    - group_by=project: one entry per project (project_id=null for personal
+      tasks). Non-admins see the projects they can view (all owners' tasks)
+      plus their own personal tasks.
+    - group_by=owner: one entry per owner. Non-admins only see themselves.
+    - project_id requires view permission on that project.
+    """
+    is_admin = current_user.role == "admin"
+
+    if owner is not None and not is_admin and owner != current_user.username:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not allowed to view task stats for other users.",
+        )
+    if group_by == "owner" and not is_admin:
+        owner = current_user.username
+
+    if project_id is not None:
+        access.require_view(project_id)
+
+    items, totals = get_task_stats(
+        group_by=group_by,
+        owner=owner,
         project_id=project_id,
-        status=status,
-        active_only=effective_active_only,
-        origin_standup_id=None,
-        search=search,
-        start_date=start_date,
-        end_date=end_date,
+        visible_project_ids=None if is_admin else access.viewable_project_ids(),
+        viewer=current_user.username,
     )
-    return TaskList(items=items)
+    return TaskStatsResponse(group_by=group_by, items=items, totals=totals)
 
 
 @router.get("/{task_id}", response_model=TaskEntry)
 def get_task_endpoint(
     task_id: int,
     current_user: UserPublic = Depends(get_current_user),
+    access: ProjectAccess = Depends(get_project_access),
 ) -> TaskEntry:
     """
     Retrieve a single task, enforcing project-scoped permissions.
@@ -153,7 +222,7 @@ def get_task_endpoint(
     is_admin = current_user.role == "admin"
 
     if task.project_id is not None:
-        require_project_view(task.project_id, current_user)
+        access.require_view(task.project_id)
     else:
         if not is_admin and task.owner != current_user.username:
             raise HTTPException(
@@ -168,6 +237,7 @@ def get_task_endpoint(
 def create_task_endpoint(
     payload: TaskCreate,
     current_user: UserPublic = Depends(get_current_user),
+    access: ProjectAccess = Depends(get_project_access),
 ) -> TaskEntry:
     """
     Create a task owned by the current user.
@@ -176,16 +246,42 @@ def create_task_endpoint(
     (owner/member or admin).
     """
     if payload.project_id is not None:
-        require_project_edit(payload.project_id, current_user)
+        access.require_edit(payload.project_id)
 
     return add_task(current_user.username, payload)
 
 
+@router.post("/bulk", response_model=TaskList, status_code=status.HTTP_201_CREATED)
+def create_tasks_bulk_endpoint(
+    payload: TaskBulkCreateRequest,
+    current_user: UserPublic = Depends(get_current_user),
+    access: ProjectAccess = Depends(get_project_access),
+) -> TaskList:
+    """
+    Create many tasks owned by the current user in one transaction.
+
+    Every referenced project_id must be editable by the user (same rule as
+    POST /tasks); otherwise nothing is created. At most TASK_BULK_MAX_ITEMS
+    items per request.
+    """
+    if len(payload.items) > settings.TASK_BULK_MAX_ITEMS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {settings.TASK_BULK_MAX_ITEMS} tasks per request.",
+        )
+
+    for project_id in {i.project_id for i in payload.items if i.project_id is not None}:
+        access.require_edit(project_id)
+
+    return TaskList(items=add_tasks_bulk(current_user.username, payload.items))
+
+
 @router.put("/{task_id}", response_model=TaskEntry)
 def update_task_endpoint(
     task_id: int,
     payload: TaskUpdate,
     current_user: UserPublic = Depends(get_current_user),
+    access: ProjectAccess = Depends(get_project_access),
 ) -> TaskEntry:
     """
     Update a task.
@@ -212,7 +308,7 @@ def update_task_endpoint(
     # personal-task ownership/admin.
     if existing.project_id is not None:
         # Must be able to edit the existing project
-        require_project_edit(existing.project_id, current_user)
+        access.require_edit(existing.project_id)
     else:
         # Personal task: only owner or admin
         if not is_admin and existing.owner != current_user.username:
@@ -229,7 +325,7 @@ def update_task_endpoint(
 
     # If moving into a different project, enforce permission there as well.
     if new_project_id is not None and new_project_id != existing.project_id:
-        require_project_edit(new_project_id, current_user)
+        access.require_edit(new_project_id)
 
     updated = update_task(task_id, payload)
     if updated is None:
@@ -246,19 +342,26 @@ def patch_task_endpoint(
     task_id: int,
     payload: TaskUpdate,
     current_user: UserPublic = Depends(get_current_user),
+    access: ProjectAccess = Depends(get_project_access),
 ) -> TaskEntry:
     """
     PATCH variant of task update, for API compatibility with docs.
 
     Delegates to the same logic as PUT /tasks/{task_id}.
     """
-    return update_task_endpoint(task_id=task_id, payload=payload, current_user=current_user)
+    return update_task_endpoint(
+        task_id=task_id,
+        payload=payload,
+        current_user=current_user,
+        access=access,
+    )
 
 
 @router.delete("/{task_id}", response_model=dict, status_code=status.HTTP_200_OK)
 def delete_task_endpoint(
     task_id: int,
     current_user: UserPublic = Depends(get_current_user),
+    access: ProjectAccess = Depends(get_project_access),
 ) -> dict:
     """
     Archive (soft-delete) a task.
@@ -282,7 +385,7 @@ def delete_task_endpoint(
     is_admin = current_user.role == "admin"
 
     if existing.project_id is not None:
-        require_project_edit(existing.project_id, current_user)
+        access.require_edit(existing.project_id)
     else:
         if not is_admin and existing.owner != current_user.username:
             raise HTTPException(
@@ -305,36 +408,29 @@ def delete_task_endpoint(
 def bulk_update_tasks_endpoint(
     payload: TaskBulkUpdateRequest,
     current_user: UserPublic = Depends(get_current_user),
+    access: ProjectAccess = Depends(get_project_access),
 ) -> dict:
     """
     Bulk update multiple tasks with a single TaskUpdate payload.
 
-    - Only tasks the user can edit are modified.
-    - Tasks the user cannot edit are silently skipped.
+    - Only tasks the user can edit are modified; others are skipped.
+    - If the update moves tasks to another project, the user must be allowed
+      to edit that project (403/404 otherwise, as for PUT /tasks/{id}).
+    - Tasks and permissions are loaded once and all changes are written in
+      one transaction.
+
+    Returns {"updated": count, "results": {task_id: "updated" | "not_found" | "forbidden"}}.
     """
-    is_admin = current_user.role == "admin"
-    updated_count = 0
-
-    for task_id in payload.task_ids:
-        existing = get_task_by_id(task_id)
-        if existing is None:
-            continue
-
-        # Permission checks per task
-        try:
-            if existing.project_id is not None:
-                # Project-scoped task: must be able to edit the project
-                require_project_edit(existing.project_id, current_user)
-            else:
-                # Personal task: only owner or admin
-                if not is_admin and existing.owner != current_user.username:
-                    continue
-        except HTTPException:
-            # Not allowed to edit this task; skip silently
-            continue
-
-        updated = update_task(task_id, payload.update)
-        if updated is not None:
-            updated_count += 1
-
-    return {"updated": updated_count}
+    if payload.update.project_id is not None:
+        access.require_edit(payload.update.project_id)
+
+    results = bulk_update_tasks(
+        payload.task_ids,
+        payload.update,
+        is_allowed=access.can_edit_task,
+    )
+
+    return {
+        "updated": sum(1 for outcome in results.values() if outcome == "updated"),
+        "results": results,
+    }
@@ -2,27 +2,47 @@
 
 from __future__ import annotations
 
+import asyncio
+import os
+import tempfile
 from datetime import date, timedelta   # 👈 add this
-from typing import List
+from pathlib import Path
+from typing import Any, Dict, List, Literal, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile, status
 
+from app.schemas.job import BackgroundJob, BackgroundJobCreated
 from app.schemas.training import (
     MalwareTrainingWeek,
     MalwareTrainingSyllabus,
+    SeedTasksBatchRequest,
+    SeedTasksBatchResponse,
     SeedTasksRequest,
+    SeedWeekStatus,
 )
 from app.schemas.task import TaskCreate, TaskList
 from app.schemas.user import UserPublic
 from app.services.auth_service import get_current_user
-from app.services.task_store import add_task
+from app.services.job_store import get_job, save_job_progress, start_background_job
+from app.services.project_permissions import ProjectAccess, get_project_access
+from app.services.task_store import add_tasks_bulk_async
+from app.services.training_import import (
+    TRAINING_TASKS_PATH,
+    detect_seed_format,
+    import_training_file,
+)
 from app.services.training.malware_seed_tasks import (
     MALWARE_TRAINING_SYLLABUS,
+    SeedTaskDraft,
+    generate_seed_drafts_for_weeks,
     generate_seed_tasks_for_week,
 )
 
 router = APIRouter(prefix="/training", tags=["training"])
 
+IMPORT_JOB_KIND = "training_import"
+_UPLOAD_CHUNK_BYTES = 1024 * 1024
+
 
 @router.get(
     "/malware/syllabus",
@@ -53,27 +73,82 @@ async def create_malware_seed_tasks(
     Generate benign lab-only seed tasks for a given week and persist them
     into the existing /api/tasks store as tasks owned by the current user.
     """
+    _validate_seed_request([payload.week], payload.task_count)
+
+    drafts = await generate_seed_tasks_for_week(
+        week=payload.week,
+        task_count=payload.task_count,
+    )
+
+    return TaskList(items=await add_tasks_bulk_async(current_user.username, _drafts_to_tasks(drafts)))
+
+
+@router.post(
+    "/malware/seed_tasks/batch",
+    response_model=SeedTasksBatchResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_malware_seed_tasks_batch(
+    payload: SeedTasksBatchRequest,
+    current_user: UserPublic = Depends(get_current_user),
+) -> SeedTasksBatchResponse:
+    """
+    Seed tasks for several weeks (default: the whole track) in one request.
+
+    Weeks are generated concurrently (TRAINING_SEED_CONCURRENCY) with
+    retries; a week whose attempts all fail gets the static fallback tasks
+    and reports the error. Drafts are cached per (week, task_count,
+    syllabus hash), so repeating a request skips the LLM unless `refresh`
+    is set. All tasks are inserted in one transaction.
+    """
+    weeks = list(dict.fromkeys(payload.weeks or [w.week for w in MALWARE_TRAINING_SYLLABUS]))
+    _validate_seed_request(weeks, payload.task_count)
+
+    results = await generate_seed_drafts_for_weeks(
+        weeks,
+        payload.task_count,
+        refresh=payload.refresh,
+    )
+
+    tasks = await add_tasks_bulk_async(
+        current_user.username,
+        [task for r in results for task in _drafts_to_tasks(r.drafts)],
+    )
+
+    return SeedTasksBatchResponse(
+        items=tasks,
+        weeks=[
+            SeedWeekStatus(
+                week=r.week,
+                source=r.source,
+                attempts=r.attempts,
+                error=r.error,
+                created=len(r.drafts),
+            )
+            for r in results
+        ],
+    )
+
+
+def _validate_seed_request(weeks: List[int], task_count: int) -> None:
     max_week = max((w.week for w in MALWARE_TRAINING_SYLLABUS), default=0)
-    if payload.week < 1 or payload.week > max_week:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Week must be between 1 and {max_week}.",
-        )
+    for week in weeks:
+        if week < 1 or week > max_week:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Week must be between 1 and {max_week}.",
+            )
 
-    if payload.task_count < 1 or payload.task_count > 10:
+    if task_count < 1 or task_count > 10:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="task_count must be between 1 and 10.",
         )
 
-    drafts = await generate_seed_tasks_for_week(
-        week=payload.week,
-        task_count=payload.task_count,
-    )
 
-    created = []
-    for d in drafts:
-        task_payload = TaskCreate(
+def _drafts_to_tasks(drafts: List[SeedTaskDraft]) -> List[TaskCreate]:
+    return [
+        TaskCreate(
             title=d.title,
             description=d.description,
             status="todo",
@@ -87,6 +162,98 @@ async def create_malware_seed_tasks(
             is_active=True,
             origin_standup_id=None,
         )
-        created.append(add_task(current_user.username, task_payload))
+        for d in drafts
+    ]
+
 
-    return TaskList(items=created)
+@router.post(
+    "/import/jobs",
+    response_model=BackgroundJobCreated,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def create_training_import_job(
+    file: Optional[UploadFile] = File(None),
+    format: Optional[Literal["json", "jsonl"]] = Form(None),
+    current_user: UserPublic = Depends(get_current_user),
+    access: ProjectAccess = Depends(get_project_access),
+) -> BackgroundJobCreated:
+    """
+    Import seed tasks into the current user's task list as a background job.
+
+    Imports the uploaded file, or the configured TRAINING_SEED_PATH when no
+    file is sent. The format is {"items": [...]} JSON or JSON Lines
+    (detected from the .jsonl/.ndjson suffix unless `format` is given). The
+    file is parsed incrementally and inserted in batches. Re-importing the
+    same items creates no duplicates. Poll GET /training/import/jobs/{job_id}
+    for progress counts.
+    """
+    cleanup: Optional[Path] = None
+
+    if file is not None:
+        source = file.filename or "upload"
+        fd, tmp_name = tempfile.mkstemp(prefix="devcell-import-", suffix=Path(source).suffix)
+        cleanup = Path(tmp_name)
+        try:
+            with os.fdopen(fd, "wb") as out:
+                while chunk := await file.read(_UPLOAD_CHUNK_BYTES):
+                    await asyncio.to_thread(out.write, chunk)
+        except Exception:
+            cleanup.unlink(missing_ok=True)
+            raise
+        path = cleanup
+    else:
+        path = TRAINING_TASKS_PATH
+        source = str(path)
+        if not await asyncio.to_thread(path.exists):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Seed tasks file not found at {path}",
+            )
+
+    fmt = format or detect_seed_format(source)
+    owner = current_user.username
+
+    async def work(job_id: str) -> Dict[str, Any]:
+        def on_progress(report: Dict[str, Any]) -> None:
+            save_job_progress(job_id, {"source": source, **report})
+
+        def run() -> Dict[str, Any]:
+            with path.open("rb") as fh:
+                return import_training_file(
+                    owner,
+                    fh,
+                    fmt,
+                    total_bytes=path.stat().st_size,
+                    can_use_project=access.can_edit,
+                    on_progress=on_progress,
+                )
+
+        try:
+            report = await asyncio.to_thread(run)
+        finally:
+            if cleanup is not None:
+                cleanup.unlink(missing_ok=True)
+        return {"source": source, **report}
+
+    job = await start_background_job(
+        IMPORT_JOB_KIND,
+        {"owner": owner, "source": source, "format": fmt},
+        work,
+    )
+    return BackgroundJobCreated(job_id=job.id, status=job.status)
+
+
+@router.get("/import/jobs/{job_id}", response_model=BackgroundJob)
+def get_training_import_job(
+    job_id: str,
+    current_user: UserPublic = Depends(get_current_user),
+) -> BackgroundJob:
+    """
+    Status and progress counts of an import job (owner or admin only).
+    """
+    job = get_job(job_id, kind=IMPORT_JOB_KIND)
+    if job is None or (
+        current_user.role != "admin" and job.request.get("owner") != current_user.username
+    ):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
+    return job
@@ -15,6 +15,86 @@ class Settings(BaseSettings):
     LLM_BASE_URL: str = "http://localhost:8000"
     LLM_DEFAULT_MODEL: str = "Qwen/Qwen2.5-Coder-7B-Instruct"
 
+    # Optional replicas of the LLM server (llm_balancer.py). Empty = LLM_BASE_URL only.
+    #   LLM_ENDPOINTS='["http://gpu-a:8000","http://gpu-b:8000"]'
+    LLM_ENDPOINTS: list[str] = []
+    # "least_outstanding" | "ewma"
+    LLM_BALANCING: str = "least_outstanding"
+    # Passive health: eject a replica after N consecutive failures for S seconds
+    LLM_EJECT_AFTER_FAILURES: int = 3
+    LLM_EJECT_SECONDS: float = 30.0
+    # Total tries per request, each on a different replica
+    LLM_MAX_ATTEMPTS: int = 2
+
+    # LLM admission control (llm_gateway.py): upstream requests in flight at
+    # once (per endpoint), and how many may wait before new ones are rejected
+    # with 503.
+    LLM_MAX_CONCURRENCY: int = 4
+    LLM_MAX_QUEUE: int = 64
+
+    # LLM request coalescing (llm_coalescer.py): endpoints that opt in reuse a
+    # successful reply to an identical prompt for this many seconds (0 = only
+    # share in-flight calls).
+    LLM_RESPONSE_CACHE_TTL_SECONDS: int = 60
+    LLM_RESPONSE_CACHE_MAX_ENTRIES: int = 512
+
+    # Persistent (SQLite) LLM response cache for deterministic prompts such as
+    # past-date standup summaries and code reviews. Least recently used entries
+    # are evicted beyond LLM_CACHE_MAX_ENTRIES.
+    LLM_CACHE_ENABLED: bool = True
+    LLM_CACHE_MAX_ENTRIES: int = 2000
+
+    # Dashboard summary cache: how long a generated summary is reused (seconds)
+    # when the underlying standups/projects have not changed.
+    DASHBOARD_CACHE_TTL_SECONDS: int = 300
+
+    # Maximum tasks per POST /api/tasks/bulk request
+    TASK_BULK_MAX_ITEMS: int = 1000
+
+    # Change feed (GET /api/changes/stream): change_log rows older than the
+    # retention window, or beyond the newest MAX_ROWS, are trimmed at startup
+    # and every TRIM_INTERVAL_SECONDS. Writes from other worker processes are
+    # picked up every POLL_SECONDS.
+    CHANGE_FEED_RETENTION_HOURS: int = 24
+    CHANGE_FEED_MAX_ROWS: int = 200_000
+    CHANGE_FEED_TRIM_INTERVAL_SECONDS: float = 300.0
+    CHANGE_FEED_POLL_SECONDS: float = 2.0
+    CHANGE_FEED_KEEPALIVE_SECONDS: float = 15.0
+
+    # Training seed import: default seed file (tasks_seed.json or .jsonl) and
+    # items validated/inserted per transaction by the streaming importer
+    TRAINING_SEED_PATH: str = "/home/llm/devcell-training/export/tasks_seed.json"
+    TRAINING_IMPORT_BATCH_SIZE: int = 500
+
+    # Multi-week malware seed task generation: concurrent LLM calls, and
+    # attempts per week (exponential backoff) before the static fallback
+    TRAINING_SEED_CONCURRENCY: int = 4
+    TRAINING_SEED_MAX_ATTEMPTS: int = 3
+    TRAINING_SEED_RETRY_BACKOFF_SECONDS: float = 1.0
+
+    # Batch standup summaries: longest date range per request, and how many
+    # summary LLM calls one batch may have in flight
+    STANDUP_BATCH_MAX_DAYS: int = 31
+    STANDUP_BATCH_CONCURRENCY: int = 4
+
+    # SDLC demo context budget (context_policy="bounded"): estimated tokens of
+    # previous-agent output passed to each agent, and how much of the original
+    # input is re-sent to agents that only need its gist (the reporter).
+    SDLC_CONTEXT_TOKEN_BUDGET: int = 1500
+    SDLC_SUMMARY_INPUT_TOKENS: int = 300
+
+    # Finished background jobs (job_store.py) are deleted after this many days
+    BACKGROUND_JOB_RETENTION_DAYS: int = 7
+
+    # Async routes run SQLite store calls on this many dedicated threads
+    # (app/db_async.py), so disk I/O never blocks the event loop
+    DB_ASYNC_THREADS: int = 4
+
+    # Event loop lag monitor (app/core/loop_monitor.py): sampling interval and
+    # the lag above which a stall is counted and logged
+    LOOP_MONITOR_INTERVAL_SECONDS: float = 0.1
+    LOOP_MONITOR_STALL_MS: float = 100.0
+
     # Auth / session configuration
     # Fixed lifetime for opaque session tokens (in hours)
     SESSION_TTL_HOURS: int = 8
@@ -0,0 +1,59 @@
+# backend/app/core/fast_json.py
+"""
+Fast JSON responses for large list endpoints.
+
+List endpoints can return thousands of rows from our own SQLite tables. On
+the default path each row becomes a Pydantic model, and FastAPI then dumps,
+re-validates and encodes the response model again. With 10k rows that is
+most of the request time. The fast path builds plain dicts from the rows
+(see the *_dicts store functions) and encodes them once with orjson, or
+with the stdlib json module if orjson is not installed.
+
+The output matches what the response models produce: datetimes in ISO 8601,
+with UTC written as "Z".
+"""
+
+from __future__ import annotations
+
+import json
+from datetime import date, datetime, timezone
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, (datetime, date)):
+        text = obj.isoformat()
+        if isinstance(obj, datetime) and obj.utcoffset() == timezone.utc.utcoffset(None):
+            text = text[: -len("+00:00")] + "Z"
+        return text
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(content, option=orjson.OPT_UTC_Z)
+    return json.dumps(
+        content,
+        default=_default,
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSONResponse encoded with dumps(). Return it from a route to skip
+    response_model validation; keep response_model on the decorator for the
+    OpenAPI schema.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -0,0 +1,153 @@
+# backend/app/core/llm_balancer.py
+"""
+Client-side load balancing across several LLM server replicas.
+
+LLM_ENDPOINTS lists the replicas (falls back to LLM_BASE_URL). Each request
+is routed to the healthy replica with the lowest score:
+
+  least_outstanding  fewest requests in flight, latency EWMA as tie-breaker
+  ewma               latency EWMA weighted by (in-flight + 1), so a slow
+                     replica gets less traffic
+
+Health is tracked passively from real traffic. After
+LLM_EJECT_AFTER_FAILURES consecutive failures (connection errors, timeouts,
+5xx), a replica is ejected for LLM_EJECT_SECONDS. When that time is up it
+gets one trial request: a success restores it, a failure ejects it again.
+llm_chat retries a failed request on a different replica (LLM_MAX_ATTEMPTS).
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional
+
+from .config import settings
+
+
+@dataclass
+class LLMEndpoint:
+    url: str
+    outstanding: int = 0
+    ewma_latency_s: Optional[float] = None
+    consecutive_failures: int = 0
+    ejected_until: float = 0.0
+    requests: int = 0
+    failures: int = 0
+    last_error: Optional[str] = None
+
+    def is_ejected(self, now: float) -> bool:
+        return self.ejected_until > now
+
+    def state(self, now: float) -> str:
+        if self.is_ejected(now):
+            return "ejected"
+        if self.consecutive_failures > 0:
+            return "degraded"
+        return "healthy"
+
+
+class LLMBalancer:
+    def __init__(
+        self,
+        urls: Iterable[str],
+        strategy: str = "least_outstanding",
+        eject_after_failures: int = 3,
+        eject_seconds: float = 30.0,
+        ewma_alpha: float = 0.3,
+    ):
+        unique = list(dict.fromkeys(u.rstrip("/") for u in urls if u and u.strip()))
+        if not unique:
+            raise ValueError("At least one LLM endpoint is required")
+
+        self.endpoints: List[LLMEndpoint] = [LLMEndpoint(url=u) for u in unique]
+        self.strategy = strategy
+        self.eject_after_failures = max(1, eject_after_failures)
+        self.eject_seconds = eject_seconds
+        self.ewma_alpha = ewma_alpha
+
+    def _score(self, ep: LLMEndpoint) -> tuple:
+        # Unknown latency scores as 0 so new/restored replicas get traffic.
+        latency = ep.ewma_latency_s or 0.0
+        if self.strategy == "ewma":
+            return (latency * (ep.outstanding + 1), ep.outstanding, random.random())
+        return (ep.outstanding, latency, random.random())
+
+    def acquire(self, exclude: Iterable[str] = ()) -> LLMEndpoint:
+        """
+        Pick a replica for one request and count it as outstanding.
+        Callers must release() it when the request ends.
+        """
+        now = time.monotonic()
+        excluded = set(exclude)
+        candidates = [ep for ep in self.endpoints if ep.url not in excluded] or self.endpoints
+
+        healthy = [ep for ep in candidates if not ep.is_ejected(now)]
+        if healthy:
+            chosen = min(healthy, key=self._score)
+        else:
+            # Everything is ejected: try the one that comes back soonest
+            # rather than failing without a request.
+            chosen = min(candidates, key=lambda ep: ep.ejected_until)
+
+        chosen.outstanding += 1
+        chosen.requests += 1
+        return chosen
+
+    def release(self, ep: LLMEndpoint) -> None:
+        ep.outstanding = max(0, ep.outstanding - 1)
+
+    def record_success(self, ep: LLMEndpoint, latency_s: float) -> None:
+        ep.consecutive_failures = 0
+        ep.ejected_until = 0.0
+        if ep.ewma_latency_s is None:
+            ep.ewma_latency_s = latency_s
+        else:
+            ep.ewma_latency_s = (
+                self.ewma_alpha * latency_s + (1 - self.ewma_alpha) * ep.ewma_latency_s
+            )
+
+    def record_failure(self, ep: LLMEndpoint, error: str) -> None:
+        ep.failures += 1
+        ep.consecutive_failures += 1
+        ep.last_error = error[:300]
+        if ep.consecutive_failures >= self.eject_after_failures:
+            ep.ejected_until = time.monotonic() + self.eject_seconds
+            print(f"[llm] Ejecting {ep.url} for {self.eject_seconds:.0f}s: {ep.last_error}")
+
+    def stats(self) -> List[Dict[str, Any]]:
+        now = time.monotonic()
+        return [
+            {
+                "url": ep.url,
+                "state": ep.state(now),
+                "outstanding": ep.outstanding,
+                "ewma_latency_ms": round(ep.ewma_latency_s * 1000, 1) if ep.ewma_latency_s is not None else None,
+                "requests": ep.requests,
+                "failures": ep.failures,
+                "consecutive_failures": ep.consecutive_failures,
+                "ejected_for_seconds": round(ep.ejected_until - now, 1) if ep.is_ejected(now) else 0,
+                "last_error": ep.last_error,
+            }
+            for ep in self.endpoints
+        ]
+
+
+def configured_llm_endpoints() -> List[str]:
+    return list(settings.LLM_ENDPOINTS) or [settings.LLM_BASE_URL]
+
+
+_balancer: Optional[LLMBalancer] = None
+
+
+def get_llm_balancer() -> LLMBalancer:
+    global _balancer
+    if _balancer is None:
+        _balancer = LLMBalancer(
+            configured_llm_endpoints(),
+            strategy=settings.LLM_BALANCING,
+            eject_after_failures=settings.LLM_EJECT_AFTER_FAILURES,
+            eject_seconds=settings.LLM_EJECT_SECONDS,
+        )
+    return _balancer
@@ -1,16 +1,85 @@
+import json
+import time
+from typing import AsyncIterator
+
 import httpx
 from .config import settings
+from .llm_balancer import get_llm_balancer
+from .llm_coalescer import get_llm_coalescer, make_llm_request_key
+from .llm_gateway import LLMPriority, get_llm_gateway
+
 
+async def _llm_chat_raw(payload: dict, priority: LLMPriority = "default") -> str:
+    """
+    POST one chat completion request and return the reply text.
 
-async def llm_chat(messages: list[dict], model: str | None = None):
+    Waits for a gateway slot first; raises LLMQueueFullError when the queue
+    is full. The request goes to the best LLM replica (llm_balancer.py) and
+    is retried on another replica after a connection error, timeout or 5xx.
+    """
+    balancer = get_llm_balancer()
+    attempts = max(1, min(settings.LLM_MAX_ATTEMPTS, len(balancer.endpoints)))
+    tried: list[str] = []
+    last_error: Exception | None = None
+
+    async with get_llm_gateway().slot(priority):
+        for _ in range(attempts):
+            endpoint = balancer.acquire(exclude=tried)
+            tried.append(endpoint.url)
+            url = f"{endpoint.url}/v1/chat/completions"
+            started = time.perf_counter()
+
+            try:
+                async with httpx.AsyncClient(timeout=60.0) as client:
+                    resp = await client.post(url, json=payload)
+                    resp.raise_for_status()
+                    data = resp.json()
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code < 500:
+                    # Our request is bad, not the replica; do not retry.
+                    balancer.record_success(endpoint, time.perf_counter() - started)
+                    return f"[LLM server error: {e}]"
+                balancer.record_failure(endpoint, str(e))
+                last_error = e
+                continue
+            except httpx.HTTPError as e:
+                balancer.record_failure(endpoint, str(e) or type(e).__name__)
+                last_error = e
+                continue
+            finally:
+                balancer.release(endpoint)
+
+            balancer.record_success(endpoint, time.perf_counter() - started)
+            # vLLM / OpenAI-style response
+            return data["choices"][0]["message"]["content"]
+
+    return f"[LLM server error: {last_error}]"
+
+
+async def llm_chat(
+    messages: list[dict],
+    model: str | None = None,
+    *,
+    coalesce: bool = False,
+    cache_ttl: float | None = None,
+    endpoint: str = "default",
+    priority: LLMPriority = "default",
+):
     """
     Wrapper around your LLM server (OpenAI-compatible).
 
     - Uses /v1/chat/completions
     - Uses the default model from settings if none is provided
     - Returns a readable error string if the LLM call fails
+
+    Opt-in coalescing (see llm_coalescer.py):
+    - coalesce=True: identical concurrent requests share one upstream call
+    - cache_ttl: also reuse a successful reply for this many seconds
+    - endpoint: label for the per-endpoint coalescing stats
+
+    priority ("interactive" | "default" | "background") orders requests
+    waiting for an upstream slot (see llm_gateway.py).
     """
-    url = f"{settings.LLM_BASE_URL}/v1/chat/completions"
     model_name = model or settings.LLM_DEFAULT_MODEL
 
     payload = {
@@ -18,12 +87,83 @@ async def llm_chat(messages: list[dict], model: str | None = None):
         "messages": messages,
     }
 
-    try:
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            resp = await client.post(url, json=payload)
-            resp.raise_for_status()
-            data = resp.json()
-            # vLLM / OpenAI-style response
-            return data["choices"][0]["message"]["content"]
-    except httpx.HTTPError as e:
-        return f"[LLM server error: {e}]"
+    if not coalesce and not cache_ttl:
+        return await _llm_chat_raw(payload, priority)
+
+    return await get_llm_coalescer().run(
+        make_llm_request_key(payload),
+        lambda: _llm_chat_raw(payload, priority),
+        endpoint=endpoint,
+        cache_ttl=cache_ttl,
+    )
+
+
+async def llm_chat_stream(
+    messages: list[dict],
+    model: str | None = None,
+    *,
+    priority: LLMPriority = "default",
+) -> AsyncIterator[str]:
+    """
+    Streaming variant of llm_chat: yields reply text deltas as the server
+    produces them (OpenAI-style `stream: true` SSE).
+
+    Failover to another replica is only possible before the first delta.
+    After that, an error is yielded as a final "[LLM server error: ...]"
+    chunk, the same readable string llm_chat returns.
+    """
+    payload = {
+        "model": model or settings.LLM_DEFAULT_MODEL,
+        "messages": messages,
+        "stream": True,
+    }
+
+    balancer = get_llm_balancer()
+    attempts = max(1, min(settings.LLM_MAX_ATTEMPTS, len(balancer.endpoints)))
+    tried: list[str] = []
+    last_error: Exception | None = None
+
+    async with get_llm_gateway().slot(priority):
+        for _ in range(attempts):
+            endpoint = balancer.acquire(exclude=tried)
+            tried.append(endpoint.url)
+            url = f"{endpoint.url}/v1/chat/completions"
+            started = time.perf_counter()
+            streamed = False
+
+            try:
+                async with httpx.AsyncClient(timeout=60.0) as client:
+                    async with client.stream("POST", url, json=payload) as resp:
+                        resp.raise_for_status()
+                        async for line in resp.aiter_lines():
+                            if not line.startswith("data:"):
+                                continue
+                            data = line[len("data:"):].strip()
+                            if data == "[DONE]":
+                                break
+                            delta = json.loads(data)["choices"][0].get("delta", {}).get("content")
+                            if delta:
+                                streamed = True
+                                yield delta
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code < 500:
+                    balancer.record_success(endpoint, time.perf_counter() - started)
+                    yield f"[LLM server error: {e}]"
+                    return
+                balancer.record_failure(endpoint, str(e))
+                last_error = e
+                continue
+            except (httpx.HTTPError, ValueError, KeyError, IndexError) as e:
+                balancer.record_failure(endpoint, str(e) or type(e).__name__)
+                if streamed:
+                    yield f"[LLM server error: {e}]"
+                    return
+                last_error = e
+                continue
+            finally:
+                balancer.release(endpoint)
+
+            balancer.record_success(endpoint, time.perf_counter() - started)
+            return
+
+    yield f"[LLM server error: {last_error}]"
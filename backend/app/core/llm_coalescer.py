@@ -0,0 +1,129 @@
+# backend/app/core/llm_coalescer.py
+"""
+Single-flight request coalescing (plus an optional short TTL response cache)
+for LLM calls.
+
+Identical concurrent requests (same model, messages and parameters) share one
+upstream call: the first caller starts it and everyone else awaits the same
+task. Completed replies can be kept for a few seconds so a burst of identical
+requests arriving just after the first one finishes is served from memory.
+
+Callers opt in per call through llm_chat(..., coalesce=True, endpoint="...");
+counters are kept per endpoint and exposed by GET /api/health/llm/stats.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from .config import settings
+
+
+def make_llm_request_key(payload: Dict[str, Any]) -> str:
+    """
+    Stable hash of the exact request body (model, messages, parameters).
+    """
+    raw = json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def is_llm_error_reply(reply: Any) -> bool:
+    # llm_chat() reports transport failures as "[LLM server error: ...]" strings.
+    return isinstance(reply, str) and reply.lstrip().startswith("[LLM")
+
+
+class LLMCoalescer:
+    def __init__(self, max_cache_entries: int = 512):
+        self.max_cache_entries = max_cache_entries
+        self._inflight: Dict[str, "asyncio.Task[str]"] = {}
+        # key -> (expires_at, reply), oldest first
+        self._cache: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    def _bump(self, endpoint: str, counter: str) -> None:
+        stats = self._stats.setdefault(
+            endpoint,
+            {"requests": 0, "upstream_calls": 0, "coalesced": 0, "cache_hits": 0},
+        )
+        stats[counter] += 1
+
+    def _cache_get(self, key: str) -> Optional[str]:
+        item = self._cache.get(key)
+        if item is None:
+            return None
+        expires_at, reply = item
+        if expires_at < time.monotonic():
+            self._cache.pop(key, None)
+            return None
+        self._cache.move_to_end(key)
+        return reply
+
+    def _cache_put(self, key: str, reply: str, ttl: float) -> None:
+        if ttl <= 0 or is_llm_error_reply(reply):
+            return
+        self._cache[key] = (time.monotonic() + ttl, reply)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.max_cache_entries:
+            self._cache.popitem(last=False)
+
+    async def run(
+        self,
+        key: str,
+        call: Callable[[], Awaitable[str]],
+        endpoint: str = "default",
+        cache_ttl: Optional[float] = None,
+    ) -> str:
+        """
+        Return call()'s reply, sharing it with identical in-flight requests
+        and (when cache_ttl > 0) with identical requests for cache_ttl seconds.
+        """
+        self._bump(endpoint, "requests")
+        ttl = cache_ttl or 0
+
+        if ttl > 0:
+            cached = self._cache_get(key)
+            if cached is not None:
+                self._bump(endpoint, "cache_hits")
+                return cached
+
+        task = self._inflight.get(key)
+        if task is not None:
+            self._bump(endpoint, "coalesced")
+        else:
+            self._bump(endpoint, "upstream_calls")
+            task = asyncio.ensure_future(call())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _t: self._inflight.pop(key, None))
+
+        # shield: a cancelled caller must not cancel the call others are waiting on
+        reply = await asyncio.shield(task)
+        if ttl > 0:
+            self._cache_put(key, reply, ttl)
+        return reply
+
+    def stats(self) -> Dict[str, Any]:
+        totals = {"requests": 0, "upstream_calls": 0, "coalesced": 0, "cache_hits": 0}
+        for counters in self._stats.values():
+            for name, value in counters.items():
+                totals[name] += value
+        return {
+            "inflight": len(self._inflight),
+            "cache_entries": len(self._cache),
+            "totals": totals,
+            "endpoints": {name: dict(counters) for name, counters in self._stats.items()},
+        }
+
+
+_coalescer: Optional[LLMCoalescer] = None
+
+
+def get_llm_coalescer() -> LLMCoalescer:
+    global _coalescer
+    if _coalescer is None:
+        _coalescer = LLMCoalescer(max_cache_entries=settings.LLM_RESPONSE_CACHE_MAX_ENTRIES)
+    return _coalescer
@@ -0,0 +1,191 @@
+# backend/app/core/llm_gateway.py
+"""
+Admission control in front of the local LLM server.
+
+A single vLLM instance degrades badly when flooded: every request slows
+down until they all hit the client timeout. The gateway caps the number of
+upstream requests in flight (LLM_MAX_CONCURRENCY per endpoint) and queues the rest by
+priority class, so interactive work (chat, knowledge Q&A, review) is served
+before background summaries and agent runs.
+
+When LLM_MAX_QUEUE callers are already waiting, new requests are rejected at
+once with LLMQueueFullError, which the API turns into
+503 + Retry-After, instead of waiting until they time out.
+
+Queue-time metrics are exposed via GET /api/health/llm/queue.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import math
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Deque, Dict, List, Literal, Optional, Tuple
+
+from .config import settings
+
+
+LLMPriority = Literal["interactive", "default", "background"]
+
+# Lower value is served first
+PRIORITY_ORDER: Dict[str, int] = {
+    "interactive": 0,
+    "default": 1,
+    "background": 2,
+}
+
+_RECENT_WAITS = 500
+
+
+class LLMQueueFullError(Exception):
+    """
+    Raised when the LLM queue is full; carries a Retry-After hint in seconds.
+    """
+
+    def __init__(self, retry_after: int):
+        super().__init__(f"LLM queue is full; retry after {retry_after}s")
+        self.retry_after = retry_after
+
+
+class LLMGateway:
+    def __init__(self, max_concurrency: int, max_queue: int):
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_queue = max(0, max_queue)
+
+        self._active = 0
+        self._queued = 0
+        self._seq = itertools.count()
+        # (priority, seq, future): FIFO within a priority class
+        self._heap: List[Tuple[int, int, "asyncio.Future[None]"]] = []
+
+        # EWMA of upstream call duration, used for Retry-After estimates
+        self._avg_service_s = 5.0
+
+        self._admitted: Dict[str, int] = {p: 0 for p in PRIORITY_ORDER}
+        self._rejected: Dict[str, int] = {p: 0 for p in PRIORITY_ORDER}
+        self._waits_ms: Dict[str, Deque[float]] = {
+            p: deque(maxlen=_RECENT_WAITS) for p in PRIORITY_ORDER
+        }
+        self._max_wait_ms: Dict[str, float] = {p: 0.0 for p in PRIORITY_ORDER}
+
+    # ------------------------------------------------------------------
+    # Slot handling
+    # ------------------------------------------------------------------
+
+    def _retry_after(self) -> int:
+        backlog = self._queued + self._active
+        return max(1, math.ceil(backlog * self._avg_service_s / self.max_concurrency))
+
+    def _release_slot(self) -> None:
+        # Hand the slot straight to the best waiter; skip ones that gave up.
+        while self._heap:
+            _, _, fut = heapq.heappop(self._heap)
+            if not fut.done():
+                self._queued -= 1
+                fut.set_result(None)
+                return
+        self._active -= 1
+
+    async def _acquire(self, priority: str) -> float:
+        """
+        Wait for a slot and return the time spent queued (seconds).
+        """
+        if self._active < self.max_concurrency and self._queued == 0:
+            self._active += 1
+            return 0.0
+
+        if self._queued >= self.max_queue:
+            self._rejected[priority] += 1
+            raise LLMQueueFullError(self._retry_after())
+
+        fut: "asyncio.Future[None]" = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._heap, (PRIORITY_ORDER[priority], next(self._seq), fut))
+        self._queued += 1
+        started = time.perf_counter()
+
+        try:
+            await fut
+        except asyncio.CancelledError:
+            if fut.done() and not fut.cancelled():
+                # Slot was handed to us just as we were cancelled: pass it on.
+                self._release_slot()
+            else:
+                fut.cancel()
+                self._queued -= 1
+            raise
+
+        return time.perf_counter() - started
+
+    @asynccontextmanager
+    async def slot(self, priority: LLMPriority = "default") -> AsyncIterator[None]:
+        """
+        Hold one upstream LLM slot for the duration of the block.
+        """
+        if priority not in PRIORITY_ORDER:
+            priority = "default"
+
+        waited = await self._acquire(priority)
+        wait_ms = waited * 1000.0
+        self._admitted[priority] += 1
+        self._waits_ms[priority].append(wait_ms)
+        self._max_wait_ms[priority] = max(self._max_wait_ms[priority], wait_ms)
+
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            self._avg_service_s = 0.8 * self._avg_service_s + 0.2 * elapsed
+            self._release_slot()
+
+    # ------------------------------------------------------------------
+    # Metrics
+    # ------------------------------------------------------------------
+
+    def stats(self) -> Dict[str, Any]:
+        classes: Dict[str, Any] = {}
+        for priority in PRIORITY_ORDER:
+            waits = sorted(self._waits_ms[priority])
+            p95: Optional[float] = None
+            if waits:
+                p95 = round(waits[min(len(waits) - 1, int(0.95 * len(waits)))], 1)
+            classes[priority] = {
+                "admitted": self._admitted[priority],
+                "rejected": self._rejected[priority],
+                "queued": sum(
+                    1
+                    for prio, _, fut in self._heap
+                    if prio == PRIORITY_ORDER[priority] and not fut.done()
+                ),
+                "wait_ms_mean": round(sum(waits) / len(waits), 1) if waits else None,
+                "wait_ms_p95": p95,
+                "wait_ms_max": round(self._max_wait_ms[priority], 1),
+            }
+
+        return {
+            "max_concurrency": self.max_concurrency,
+            "max_queue": self.max_queue,
+            "active": self._active,
+            "queued": self._queued,
+            "avg_service_seconds": round(self._avg_service_s, 3),
+            "priorities": classes,
+        }
+
+
+_gateway: Optional[LLMGateway] = None
+
+
+def get_llm_gateway() -> LLMGateway:
+    global _gateway
+    if _gateway is None:
+        # The limit is per LLM server; replicas add capacity.
+        replicas = len(list(settings.LLM_ENDPOINTS)) or 1
+        _gateway = LLMGateway(
+            max_concurrency=settings.LLM_MAX_CONCURRENCY * replicas,
+            max_queue=settings.LLM_MAX_QUEUE,
+        )
+    return _gateway
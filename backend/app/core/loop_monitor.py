@@ -0,0 +1,109 @@
+# backend/app/core/loop_monitor.py
+"""
+Event loop lag monitor.
+
+A background task sleeps for LOOP_MONITOR_INTERVAL_SECONDS and measures how
+late it wakes up. Anything beyond the interval is time the loop spent
+running something else without yielding: blocking I/O or CPU work in an
+async route. Lag above LOOP_MONITOR_STALL_MS counts as a stall and is logged
+with its size.
+
+Stats (recent percentiles, max, stall count) are served at
+GET /api/health/loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+from app.core.config import settings
+
+# Recent samples kept for percentiles (~100s at the default interval)
+_WINDOW = 1000
+
+
+def _percentile(sorted_values: list, q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(q * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+class LoopLagMonitor:
+    def __init__(self, interval: float, stall_ms: float):
+        self.interval = interval
+        self.stall_ms = stall_ms
+        self._samples: Deque[float] = deque(maxlen=_WINDOW)
+        self._task: Optional["asyncio.Task[None]"] = None
+        self._started_at: Optional[float] = None
+        self._max_ms = 0.0
+        self._stalls = 0
+        self._last_stall_ms: Optional[float] = None
+        self._last_stall_at: Optional[float] = None
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._started_at = time.time()
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            await asyncio.sleep(self.interval)
+            self.record((loop.time() - started - self.interval) * 1000.0)
+
+    def record(self, lag_ms: float) -> None:
+        lag_ms = max(0.0, lag_ms)
+        self._samples.append(lag_ms)
+        self._max_ms = max(self._max_ms, lag_ms)
+        if lag_ms >= self.stall_ms:
+            self._stalls += 1
+            self._last_stall_ms = lag_ms
+            self._last_stall_at = time.time()
+            print(f"[loop_monitor] Event loop blocked for {lag_ms:.0f} ms")
+
+    def stats(self) -> Dict[str, Any]:
+        values = sorted(self._samples)
+        return {
+            "running": self._task is not None and not self._task.done(),
+            "interval_ms": self.interval * 1000.0,
+            "stall_threshold_ms": self.stall_ms,
+            "samples": len(values),
+            "lag_ms": {
+                "last": round(self._samples[-1], 2) if self._samples else 0.0,
+                "p50": round(_percentile(values, 0.50), 2),
+                "p99": round(_percentile(values, 0.99), 2),
+                "max_recent": round(values[-1], 2) if values else 0.0,
+                "max": round(self._max_ms, 2),
+            },
+            "stalls": self._stalls,
+            "last_stall_ms": round(self._last_stall_ms, 2) if self._last_stall_ms is not None else None,
+            "last_stall_at": self._last_stall_at,
+            "started_at": self._started_at,
+        }
+
+
+_monitor: Optional[LoopLagMonitor] = None
+
+
+def get_loop_monitor() -> LoopLagMonitor:
+    global _monitor
+    if _monitor is None:
+        _monitor = LoopLagMonitor(
+            interval=settings.LOOP_MONITOR_INTERVAL_SECONDS,
+            stall_ms=settings.LOOP_MONITOR_STALL_MS,
+        )
+    return _monitor
@@ -1,14 +1,16 @@
 # backend/app/db.py
 
 from pathlib import Path
+import os
 import sqlite3
 
 
 # Base directory for the backend package (…/backend)
 BASE_DIR = Path(__file__).resolve().parents[1]
 
-# SQLite DB path: backend/devcell.db
-DB_PATH = BASE_DIR / "devcell.db"
+# SQLite DB path: backend/devcell.db (override with DEVCELL_DB_PATH, e.g. for
+# scratch databases in benchmarks)
+DB_PATH = Path(os.environ.get("DEVCELL_DB_PATH") or BASE_DIR / "devcell.db")
 
 
 def get_connection() -> sqlite3.Connection:
@@ -22,6 +24,275 @@ def get_connection() -> sqlite3.Connection:
     return conn
 
 
+
+# ----------------------------------------------------------------------
+# Task aggregates (maintained by triggers on `tasks`)
+# ----------------------------------------------------------------------
+
+# Columns whose changes move a task between aggregate buckets
+_AGGREGATED_TASK_COLUMNS = "owner, project_id, status, progress, is_active, due_date"
+
+
+def _task_aggregate_statements(row: str, sign: str) -> str:
+    """
+    Trigger body that adds (sign '+') or removes (sign '-') one task row
+    (NEW or OLD) from task_aggregates and task_due_aggregates.
+    Personal tasks use project_key 0.
+    """
+    active = f"({row}.is_active = 1)"
+    # Drop due-date buckets that reach zero so past dates do not pile up
+    cleanup = f"""
+            DELETE FROM task_due_aggregates
+            WHERE owner = {row}.owner AND project_key = COALESCE({row}.project_id, 0)
+              AND due_date = {row}.due_date AND open_count <= 0;
+""" if sign == "-" else ""
+    return f"""
+            INSERT INTO task_aggregates (
+                owner, project_key, total, active, todo, in_progress, done, blocked, progress_sum
+            )
+            VALUES (
+                {row}.owner,
+                COALESCE({row}.project_id, 0),
+                {sign}1,
+                {sign}{active},
+                {sign}({active} AND {row}.status = 'todo'),
+                {sign}({active} AND {row}.status = 'in_progress'),
+                {sign}({active} AND {row}.status = 'done'),
+                {sign}({active} AND {row}.status = 'blocked'),
+                {sign}(CASE WHEN {active} THEN {row}.progress ELSE 0 END)
+            )
+            ON CONFLICT (owner, project_key) DO UPDATE SET
+                total = total + excluded.total,
+                active = active + excluded.active,
+                todo = todo + excluded.todo,
+                in_progress = in_progress + excluded.in_progress,
+                done = done + excluded.done,
+                blocked = blocked + excluded.blocked,
+                progress_sum = progress_sum + excluded.progress_sum;
+
+            INSERT INTO task_due_aggregates (owner, project_key, due_date, open_count)
+            SELECT {row}.owner, COALESCE({row}.project_id, 0), {row}.due_date, {sign}1
+            WHERE {active} AND {row}.status != 'done' AND {row}.due_date IS NOT NULL
+            ON CONFLICT (owner, project_key, due_date) DO UPDATE SET
+                open_count = open_count + excluded.open_count;
+{cleanup}"""
+
+
+def _install_task_aggregates(cur: sqlite3.Cursor) -> None:
+    """
+    Create the aggregate tables and triggers, then rebuild the aggregates
+    from `tasks`. Triggers are recreated on every start so definition
+    changes apply to existing databases, and the rebuild repairs any drift
+    (e.g. rows written before the triggers existed).
+    """
+    cur.execute(
+        """
+        CREATE TABLE IF NOT EXISTS task_aggregates (
+            owner TEXT NOT NULL,
+            project_key INTEGER NOT NULL,        -- project_id, 0 for personal tasks
+            total INTEGER NOT NULL DEFAULT 0,    -- including archived
+            active INTEGER NOT NULL DEFAULT 0,
+            todo INTEGER NOT NULL DEFAULT 0,     -- status counts: active tasks only
+            in_progress INTEGER NOT NULL DEFAULT 0,
+            done INTEGER NOT NULL DEFAULT 0,
+            blocked INTEGER NOT NULL DEFAULT 0,
+            progress_sum INTEGER NOT NULL DEFAULT 0,  -- active tasks only
+            PRIMARY KEY (owner, project_key)
+        );
+        """
+    )
+    # Open (active, not done) tasks per due date; overdue = due_date < today
+    cur.execute(
+        """
+        CREATE TABLE IF NOT EXISTS task_due_aggregates (
+            owner TEXT NOT NULL,
+            project_key INTEGER NOT NULL,
+            due_date TEXT NOT NULL,
+            open_count INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (owner, project_key, due_date)
+        );
+        """
+    )
+
+    for name in ("tasks_aggregate_insert", "tasks_aggregate_update", "tasks_aggregate_delete"):
+        cur.execute(f"DROP TRIGGER IF EXISTS {name}")
+
+    cur.execute(
+        f"""
+        CREATE TRIGGER tasks_aggregate_insert AFTER INSERT ON tasks
+        BEGIN
+            {_task_aggregate_statements("NEW", "+")}
+        END;
+        """
+    )
+    cur.execute(
+        f"""
+        CREATE TRIGGER tasks_aggregate_update
+        AFTER UPDATE OF {_AGGREGATED_TASK_COLUMNS} ON tasks
+        BEGIN
+            {_task_aggregate_statements("OLD", "-")}
+            {_task_aggregate_statements("NEW", "+")}
+        END;
+        """
+    )
+    cur.execute(
+        f"""
+        CREATE TRIGGER tasks_aggregate_delete AFTER DELETE ON tasks
+        BEGIN
+            {_task_aggregate_statements("OLD", "-")}
+        END;
+        """
+    )
+
+    cur.execute("DELETE FROM task_aggregates")
+    cur.execute(
+        """
+        INSERT INTO task_aggregates (
+            owner, project_key, total, active, todo, in_progress, done, blocked, progress_sum
+        )
+        SELECT
+            owner,
+            COALESCE(project_id, 0),
+            COUNT(*),
+            SUM(is_active = 1),
+            SUM(is_active = 1 AND status = 'todo'),
+            SUM(is_active = 1 AND status = 'in_progress'),
+            SUM(is_active = 1 AND status = 'done'),
+            SUM(is_active = 1 AND status = 'blocked'),
+            SUM(CASE WHEN is_active = 1 THEN progress ELSE 0 END)
+        FROM tasks
+        GROUP BY owner, COALESCE(project_id, 0)
+        """
+    )
+    cur.execute("DELETE FROM task_due_aggregates")
+    cur.execute(
+        """
+        INSERT INTO task_due_aggregates (owner, project_key, due_date, open_count)
+        SELECT owner, COALESCE(project_id, 0), due_date, COUNT(*)
+        FROM tasks
+        WHERE is_active = 1 AND status != 'done' AND due_date IS NOT NULL
+        GROUP BY owner, COALESCE(project_id, 0), due_date
+        """
+    )
+
+
+# ----------------------------------------------------------------------
+# Change versions (conditional GET): per-scope counters bumped by triggers
+# ----------------------------------------------------------------------
+
+# table -> scope expressions (SQL, using {row} for NEW/OLD) bumped on any write
+_CHANGE_VERSION_SCOPES = {
+    "tasks": ("'tasks'", "'tasks:owner:' || {row}.owner"),
+    "projects": ("'projects'",),
+    "project_members": ("'project_members:' || {row}.username",),
+    "standups": ("'standups:' || date({row}.created_at)",),
+}
+
+
+def _bump_versions_sql(table: str, row: str) -> str:
+    return "".join(
+        f"""
+            INSERT INTO change_versions (scope, version, updated_at)
+            VALUES ({scope.format(row=row)}, 1, strftime('%Y-%m-%dT%H:%M:%f', 'now'))
+            ON CONFLICT (scope) DO UPDATE SET
+                version = version + 1,
+                updated_at = excluded.updated_at;
+"""
+        for scope in _CHANGE_VERSION_SCOPES[table]
+    )
+
+
+def _install_change_versions(cur: sqlite3.Cursor) -> None:
+    """
+    Create change_versions and its triggers (recreated on every start).
+    Every INSERT/UPDATE/DELETE on a tracked table bumps the scopes of the
+    old and new row, whichever store function or script made the write.
+    """
+    cur.execute(
+        """
+        CREATE TABLE IF NOT EXISTS change_versions (
+            scope TEXT PRIMARY KEY,              -- e.g. 'tasks:owner:alice', 'standups:2025-12-08'
+            version INTEGER NOT NULL,
+            updated_at TEXT NOT NULL             -- UTC, ISO 8601
+        );
+        """
+    )
+
+    for table in _CHANGE_VERSION_SCOPES:
+        for event, rows in (("INSERT", ("NEW",)), ("UPDATE", ("OLD", "NEW")), ("DELETE", ("OLD",))):
+            name = f"{table}_change_version_{event.lower()}"
+            cur.execute(f"DROP TRIGGER IF EXISTS {name}")
+            body = "".join(_bump_versions_sql(table, row) for row in rows)
+            cur.execute(
+                f"""
+                CREATE TRIGGER {name} AFTER {event} ON {table}
+                BEGIN
+                    {body}
+                END;
+                """
+            )
+
+
+# ----------------------------------------------------------------------
+# Change log (SSE change feed): one row per write, filled by triggers
+# ----------------------------------------------------------------------
+
+# table -> (entity, id column, owner column, project column)
+_CHANGE_LOG_ENTITIES = {
+    "tasks": ("task", "id", "owner", "project_id"),
+    "standups": ("standup", "id", "name", "project_id"),
+    "projects": ("project", "id", "owner", "id"),
+    "project_members": ("project_member", "project_id", "username", "project_id"),
+}
+
+
+def _install_change_log(cur: sqlite3.Cursor) -> None:
+    """
+    Create change_log and its triggers (recreated on every start).
+
+    Rows hold keys only (entity, id, owner/project before and after); the
+    change feed loads current rows when it sends events. AUTOINCREMENT keeps
+    ids increasing after old rows are trimmed, so they work as SSE event ids.
+    """
+    cur.execute(
+        """
+        CREATE TABLE IF NOT EXISTS change_log (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            entity TEXT NOT NULL,            -- task | standup | project | project_member
+            op TEXT NOT NULL,                -- insert | update | delete
+            entity_id INTEGER NOT NULL,      -- project_id for project_member
+            owner TEXT,                      -- task owner, standup author, project owner, member username
+            project_id INTEGER,
+            old_owner TEXT,                  -- updates: values before the write
+            old_project_id INTEGER,
+            created_at TEXT NOT NULL         -- UTC, ISO 8601
+        );
+        """
+    )
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_change_log_created_at ON change_log(created_at);")
+
+    for table, (entity, id_col, owner_col, project_col) in _CHANGE_LOG_ENTITIES.items():
+        for event, row, old in (("INSERT", "NEW", None), ("UPDATE", "NEW", "OLD"), ("DELETE", "OLD", None)):
+            name = f"{table}_change_log_{event.lower()}"
+            old_values = f"{old}.{owner_col}, {old}.{project_col}" if old else "NULL, NULL"
+            cur.execute(f"DROP TRIGGER IF EXISTS {name}")
+            cur.execute(
+                f"""
+                CREATE TRIGGER {name} AFTER {event} ON {table}
+                BEGIN
+                    INSERT INTO change_log (
+                        entity, op, entity_id, owner, project_id,
+                        old_owner, old_project_id, created_at
+                    )
+                    VALUES (
+                        '{entity}', '{event.lower()}', {row}.{id_col}, {row}.{owner_col}, {row}.{project_col},
+                        {old_values}, strftime('%Y-%m-%dT%H:%M:%f', 'now')
+                    );
+                END;
+                """
+            )
+
+
 def init_db() -> None:
     """
     Create tables if they do not exist.
@@ -136,6 +407,83 @@ def init_db() -> None:
         # Column already exists or table did not exist prior to CREATE TABLE above.
         pass
 
+    # Persistent LLM response cache (see services/llm_cache_store.py)
+    cur.execute(
+        """
+        CREATE TABLE IF NOT EXISTS llm_cache (
+            cache_key TEXT PRIMARY KEY,          -- sha256 of the request payload
+            namespace TEXT NOT NULL,             -- e.g. 'standup_summary', 'review'
+            model TEXT NOT NULL,
+            prompt_text TEXT NOT NULL,
+            response TEXT NOT NULL,
+            hit_count INTEGER NOT NULL DEFAULT 0,
+            created_at TEXT NOT NULL,
+            last_used_at TEXT NOT NULL
+        );
+        """
+    )
+    try:
+        # Prompt vectors of the removed semantic lookup
+        cur.execute("ALTER TABLE llm_cache DROP COLUMN embedding")
+    except Exception:
+        # Column never existed (or SQLite < 3.35)
+        pass
+    cur.execute(
+        "CREATE INDEX IF NOT EXISTS idx_llm_cache_last_used ON llm_cache (last_used_at)"
+    )
+    cur.execute(
+        "CREATE INDEX IF NOT EXISTS idx_llm_cache_namespace ON llm_cache (namespace, model)"
+    )
+
+    # Long-running work executed in the background (see services/job_store.py)
+    cur.execute(
+        """
+        CREATE TABLE IF NOT EXISTS background_jobs (
+            id TEXT PRIMARY KEY,                 -- uuid4 hex
+            kind TEXT NOT NULL,                  -- e.g. 'sdlc_demo'
+            status TEXT NOT NULL,                -- queued | running | succeeded | failed
+            request_json TEXT NOT NULL,
+            result_json TEXT,                    -- partial while running, final when done
+            error TEXT,
+            created_at TEXT NOT NULL,
+            updated_at TEXT NOT NULL,
+            finished_at TEXT
+        );
+        """
+    )
+    cur.execute(
+        "CREATE INDEX IF NOT EXISTS idx_background_jobs_kind ON background_jobs (kind, created_at)"
+    )
+    try:
+        # Process running the job ("<boot id>:<pid>:<start time>", see job_store)
+        cur.execute("ALTER TABLE background_jobs ADD COLUMN owner TEXT")
+    except Exception:
+        # Column already exists
+        pass
+
+    # Import dedupe keys: one row per imported item (content hash) per owner,
+    # so re-running a seed import does not duplicate tasks
+    cur.execute(
+        """
+        CREATE TABLE IF NOT EXISTS task_import_keys (
+            owner TEXT NOT NULL,
+            import_key TEXT NOT NULL,            -- sha256 of the normalized item
+            task_id INTEGER NOT NULL,
+            created_at TEXT NOT NULL,
+            PRIMARY KEY (owner, import_key)
+        );
+        """
+    )
+
+    # Per-owner/per-project task counts for GET /api/tasks/stats
+    _install_task_aggregates(cur)
+
+    # Version counters behind ETag / 304 on list endpoints
+    _install_change_versions(cur)
+
+    # Write log behind the SSE change feed (GET /api/changes/stream)
+    _install_change_log(cur)
+
     conn.commit()
     conn.close()
 
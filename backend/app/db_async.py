@@ -0,0 +1,58 @@
+# backend/app/db_async.py
+"""
+Async access to the SQLite store functions.
+
+sqlite3 calls block, and async routes run on the event loop, so one slow
+query (or a write waiting on the database lock) stalls every other request.
+run_db() runs a store function on a small dedicated thread pool
+(DB_ASYNC_THREADS) and awaits the result. The pool is separate from the
+default executor, so embedding or file work in asyncio.to_thread cannot
+starve database calls, and it caps how many connections the loop opens at
+once.
+
+Store modules expose `<name>_async` wrappers for the functions async code
+calls; sync (def) routes already run in FastAPI's threadpool and keep using
+the plain functions.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+from app.core.config import settings
+
+T = TypeVar("T")
+
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=max(1, settings.DB_ASYNC_THREADS),
+            thread_name_prefix="devcell-db",
+        )
+    return _executor
+
+
+async def run_db(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Run a blocking store function on the DB thread pool and return its
+    result (exceptions, including HTTPException, propagate to the caller).
+    """
+    loop = asyncio.get_running_loop()
+    # Like asyncio.to_thread: keep context variables visible in the worker
+    call = functools.partial(contextvars.copy_context().run, fn, *args, **kwargs)
+    return await loop.run_in_executor(_get_executor(), call)
+
+
+def shutdown_db_executor() -> None:
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=True)
+        _executor = None
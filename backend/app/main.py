@@ -1,11 +1,15 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 
 from app.core.config import settings
+from app.core.llm_gateway import LLMQueueFullError
+from app.core.loop_monitor import get_loop_monitor
 from app.api.routes import (
     health,
     chat,
     knowledge,
+    llm_cache,
     standup,
     projects,
     review,
@@ -14,9 +18,17 @@ from app.api.routes import (
     tasks,
     training,
     agents,
+    changes,
 )
 
 from app.db import init_db
+from app.db_async import shutdown_db_executor
+from app.services.change_log import (
+    start_change_log_trimmer,
+    stop_change_log_trimmer,
+    trim_change_log,
+)
+from app.services.job_store import fail_interrupted_jobs, purge_finished_jobs
 from app.services.knowledge import index_files_in_knowledgebase
 from app.services.user_store import ensure_default_admin  # 👈 NEW import
 
@@ -35,6 +47,18 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
+    # -------------------------
+    # ERROR HANDLERS
+    # -------------------------
+    @app.exception_handler(LLMQueueFullError)
+    async def llm_queue_full_handler(request: Request, exc: LLMQueueFullError):
+        # Fail fast instead of letting the request time out behind the queue.
+        return JSONResponse(
+            status_code=503,
+            content={"detail": "LLM server is busy. Please retry shortly."},
+            headers={"Retry-After": str(exc.retry_after)},
+        )
+
     # -------------------------
     # ROUTERS
     # -------------------------
@@ -42,6 +66,7 @@ def create_app() -> FastAPI:
     app.include_router(health.router, prefix=api_prefix)
     app.include_router(chat.router, prefix=api_prefix)
     app.include_router(knowledge.router, prefix=api_prefix)
+    app.include_router(llm_cache.router, prefix=api_prefix)
     app.include_router(standup.router, prefix=api_prefix)
     app.include_router(projects.router, prefix=api_prefix)
     app.include_router(review.router, prefix=api_prefix)
@@ -49,6 +74,7 @@ def create_app() -> FastAPI:
     app.include_router(auth.router, prefix=api_prefix)
     app.include_router(tasks.router, prefix=api_prefix)
     app.include_router(training.router, prefix=api_prefix)
+    app.include_router(changes.router, prefix=api_prefix)
     app.include_router(agents.router, prefix=f"{api_prefix}/agents", tags=["agents"])
 
 
@@ -64,10 +90,32 @@ def create_app() -> FastAPI:
         # If no admin exists, creates: username=admin, password=password
         ensure_default_admin()
 
+        # Jobs whose worker process exited cannot resume (other workers' jobs
+        # are left running); expire old results
+        fail_interrupted_jobs()
+        purge_finished_jobs(settings.BACKGROUND_JOB_RETENTION_DAYS)
+        trim_change_log()
+
         # Initialize RAG system (Chroma + embeddings + file indexing)
-        index_files_in_knowledgebase()
-        
-        print("✔ Knowledgebase indexed and ready.")
+        stats = index_files_in_knowledgebase()
+
+        print(
+            "✔ Knowledgebase indexed and ready. "
+            f"({stats['files']} files, {stats['chunks']} chunks, {stats['embedded']} upserted)"
+        )
+
+        # Keep change_log bounded without trimming on user writes
+        start_change_log_trimmer()
+
+        # Watch for blocking calls on the event loop (GET /api/health/loop).
+        # Started last: the blocking startup work above is not a stall.
+        get_loop_monitor().start()
+
+    @app.on_event("shutdown")
+    async def shutdown_event():
+        await get_loop_monitor().stop()
+        await stop_change_log_trimmer()
+        shutdown_db_executor()
 
     return app
 
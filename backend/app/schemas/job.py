@@ -0,0 +1,29 @@
+# backend/app/schemas/job.py
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Dict, Literal, Optional
+
+from pydantic import BaseModel
+
+
+JobStatus = Literal["queued", "running", "succeeded", "failed"]
+
+
+class BackgroundJob(BaseModel):
+    id: str
+    kind: str
+    status: JobStatus
+    request: Dict[str, Any]
+    # Partial result while running (e.g. the transcript so far), final when done
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
+    finished_at: Optional[datetime] = None
+
+
+class BackgroundJobCreated(BaseModel):
+    job_id: str
+    status: JobStatus
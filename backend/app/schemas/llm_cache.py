@@ -0,0 +1,35 @@
+# backend/app/schemas/llm_cache.py
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Dict, List
+
+from pydantic import BaseModel
+
+
+class LLMCacheEntry(BaseModel):
+    cache_key: str
+    namespace: str
+    model: str
+    prompt_preview: str
+    response_preview: str
+    hit_count: int
+    created_at: datetime
+    last_used_at: datetime
+
+
+class LLMCacheEntryList(BaseModel):
+    items: List[LLMCacheEntry]
+
+
+class LLMCacheStats(BaseModel):
+    enabled: bool
+    entries: int
+    max_entries: int
+    total_hits: int
+    by_namespace: Dict[str, int]
+
+
+class LLMCachePurgeResult(BaseModel):
+    deleted: int
@@ -58,3 +58,35 @@ class TaskList(BaseModel):
 class TaskBulkUpdateRequest(BaseModel):
     task_ids: List[int]
     update: TaskUpdate
+
+
+class TaskBulkCreateRequest(BaseModel):
+    items: List[TaskCreate] = Field(..., min_length=1)
+
+
+class TaskStatusCounts(BaseModel):
+    todo: int = 0
+    in_progress: int = 0
+    done: int = 0
+    blocked: int = 0
+
+
+class TaskStats(BaseModel):
+    """
+    Task counts for one group (project or owner). Status counts, overdue and
+    avg_progress cover active tasks only.
+    """
+    project_id: Optional[int] = None
+    project_name: Optional[str] = None
+    owner: Optional[str] = None
+    active: int = 0
+    archived: int = 0
+    by_status: TaskStatusCounts = Field(default_factory=TaskStatusCounts)
+    overdue: int = 0
+    avg_progress: float = 0.0
+
+
+class TaskStatsResponse(BaseModel):
+    group_by: Literal["project", "owner"]
+    items: List[TaskStats]
+    totals: TaskStats
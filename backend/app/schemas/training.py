@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
-from typing import List
+from typing import List, Literal, Optional
 from pydantic import BaseModel
 
+from app.schemas.task import TaskEntry
+
 
 class MalwareTrainingWeek(BaseModel):
     week: int
@@ -22,3 +24,22 @@ class MalwareTrainingSyllabus(BaseModel):
 class SeedTasksRequest(BaseModel):
     week: int
     task_count: int = 4  # default seed tasks per week
+
+
+class SeedTasksBatchRequest(BaseModel):
+    weeks: Optional[List[int]] = None  # default: every syllabus week
+    task_count: int = 4
+    refresh: bool = False  # ignore cached drafts and regenerate
+
+
+class SeedWeekStatus(BaseModel):
+    week: int
+    source: Literal["cache", "llm", "fallback"]
+    attempts: int = 0
+    error: Optional[str] = None
+    created: int
+
+
+class SeedTasksBatchResponse(BaseModel):
+    items: List[TaskEntry]
+    weeks: List[SeedWeekStatus]
@@ -0,0 +1,85 @@
+# backend/app/services/agents/context_budget.py
+"""
+Token budgeting for context passed between SDLC demo agents.
+
+Without a budget every agent re-sends all previous outputs, so prompt size
+grows quadratically over the pipeline. ContextBudget builds an agent's
+context from only the artifacts it declares, and shares a fixed token budget
+between them. Short artifacts are kept whole; the rest are cut down to an
+equal share.
+
+Token counts are estimates (~4 characters per token, the usual ratio for
+English text and code with BPE tokenizers). That is good enough for
+budgeting, and no model-specific tokenizer is needed.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import List, Optional, Sequence, Tuple
+
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    if not text:
+        return 0
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """
+    Keep the head of text within max_tokens. Agent outputs put headings and
+    key points first, so the head is the useful part.
+    """
+    if estimate_tokens(text) <= max_tokens:
+        return text
+    keep_chars = max(0, max_tokens * CHARS_PER_TOKEN)
+    # Prefer cutting at a line break so we do not end mid-bullet
+    cut = text.rfind("\n", 0, keep_chars)
+    if cut < keep_chars // 2:
+        cut = keep_chars
+    dropped = estimate_tokens(text[cut:])
+    return text[:cut].rstrip() + f"\n[... truncated ~{dropped} tokens]"
+
+
+class ContextBudget:
+    def __init__(self, max_context_tokens: int, max_input_tokens: Optional[int] = None):
+        self.max_context_tokens = max_context_tokens
+        self.max_input_tokens = max_input_tokens
+
+    def allocate(self, sizes: Sequence[int]) -> List[int]:
+        """
+        Split the budget across artifacts of the given token sizes
+        (max-min fair): small artifacts get what they need, and the rest is
+        shared equally by the larger ones.
+        """
+        allocation = [0] * len(sizes)
+        remaining = self.max_context_tokens
+        pending = sorted(range(len(sizes)), key=lambda i: sizes[i])
+
+        while pending:
+            share = remaining // len(pending)
+            i = pending.pop(0)
+            allocation[i] = min(sizes[i], share)
+            remaining -= allocation[i]
+
+        return allocation
+
+    def build(self, artifacts: Sequence[Tuple[str, str]]) -> str:
+        """
+        Render [(agent, text), ...] in the orchestrator's context format,
+        truncated to fit the budget.
+        """
+        sizes = [estimate_tokens(text) for _, text in artifacts]
+        allocation = self.allocate(sizes)
+        return "".join(
+            f"\n[{agent}]\n{truncate_to_tokens(text, budget)}\n"
+            for (agent, text), budget in zip(artifacts, allocation)
+        )
+
+    def clip_input(self, user_input: str, max_tokens: Optional[int] = None) -> str:
+        limit = max_tokens if max_tokens is not None else self.max_input_tokens
+        if limit is None:
+            return user_input
+        return truncate_to_tokens(user_input, limit)
@@ -1,13 +1,23 @@
 # backend/app/services/agents/sdlc_demo.py
 
 from __future__ import annotations
+import asyncio
+import time
 from dataclasses import dataclass
-from typing import Any, Dict, List, Literal, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Literal, Optional, Tuple
 
-from app.core.llm_client import llm_chat
+from app.core.config import settings
+from app.core.llm_client import llm_chat, llm_chat_stream
+from app.core.llm_gateway import LLMQueueFullError
+from app.services.agents.context_budget import ContextBudget, estimate_tokens
 
 
 Mode = Literal["feature", "pr_review", "bug"]
+Execution = Literal["sequential", "dag"]
+ContextPolicy = Literal["bounded", "full"]
+
+# Progress callback: receives agent_started / token / agent_finished events
+EventCallback = Callable[[Dict[str, Any]], Awaitable[None]]
 
 
 @dataclass
@@ -27,10 +37,12 @@ class Agent:
         user_input: str,
         context: Dict[str, Any],
         instructions: str = "",
+        on_token: Optional[Callable[[str], Awaitable[None]]] = None,
     ) -> AgentResult:
         """
         Call the LLM with a system prompt + context + user_input.
-        Uses the llm_chat function from app.core.llm_client.
+        Uses the llm_chat function from app.core.llm_client, or
+        llm_chat_stream when on_token is given (called with each text delta).
         """
         messages = [
             {
@@ -63,9 +75,21 @@ class Agent:
         # Treat the original input as user message
         messages.append({"role": "user", "content": user_input})
 
+        prompt_tokens = sum(estimate_tokens(m["content"]) for m in messages)
+
         # Call the LLM via llm_chat
         try:
-            response_text = await llm_chat(messages)
+            if on_token is None:
+                response_text = await llm_chat(messages, priority="background")
+            else:
+                parts: List[str] = []
+                async for delta in llm_chat_stream(messages, priority="background"):
+                    parts.append(delta)
+                    await on_token(delta)
+                response_text = "".join(parts)
+        except LLMQueueFullError:
+            # Overload is not an LLM failure: callers answer 503 + Retry-After
+            raise
         except Exception as e:
             # Hard failure talking to LLM server — present a clean message
             response_text = (
@@ -95,7 +119,7 @@ class Agent:
         return AgentResult(
             agent=self.name,
             message=response_text,
-            data={"raw": response_text},
+            data={"raw": response_text, "prompt_tokens": prompt_tokens},
         )
 
 
@@ -249,9 +273,83 @@ Your goal is to brief a commander, not a developer.
 """
 
 
+@dataclass(frozen=True)
+class PipelineStep:
+    """
+    One agent hop. `artifact` is the key its output is stored under and
+    `inputs` are the artifacts it reads. In DAG mode, and with the bounded
+    context policy, only those are passed as context; in DAG mode steps whose
+    inputs are ready run concurrently. `needs_input=False` marks steps that
+    only need the gist of the original input, which is then clipped.
+    """
+
+    agent: str
+    artifact: str
+    inputs: Tuple[str, ...] = ()
+    needs_input: bool = True
+
+
+# Steps are listed in a valid sequential order (dependencies first).
+PIPELINES: Dict[str, List[PipelineStep]] = {
+    "feature": [
+        PipelineStep("product_owner", "user_story"),
+        PipelineStep("architect", "design", ("user_story",)),
+        PipelineStep("impl_planner", "tasks", ("user_story", "design")),
+        PipelineStep("test_engineer", "test_plan", ("user_story", "design")),
+        PipelineStep(
+            "reporter",
+            "summary",
+            ("user_story", "design", "tasks", "test_plan"),
+            needs_input=False,
+        ),
+    ],
+    "pr_review": [
+        # Both reviewers only need the diff (user_input)
+        PipelineStep("code_reviewer", "review_findings"),
+        PipelineStep("security_reviewer", "security_findings"),
+        PipelineStep("test_engineer", "test_plan", ("review_findings", "security_findings")),
+        # Implementation planner doubles as refactor planner
+        PipelineStep("impl_planner", "refactor_plan", ("review_findings", "security_findings")),
+        PipelineStep(
+            "reporter",
+            "summary",
+            ("review_findings", "security_findings", "test_plan", "refactor_plan"),
+            needs_input=False,
+        ),
+    ],
+    "bug": [
+        PipelineStep("bug_triage", "triage"),
+        PipelineStep("root_cause", "root_cause", ("triage",)),
+        PipelineStep("fix_planner", "fix_plan", ("triage", "root_cause")),
+        PipelineStep("regression_tester", "regression_tests", ("triage", "root_cause")),
+        PipelineStep(
+            "reporter",
+            "summary",
+            ("triage", "root_cause", "fix_plan", "regression_tests"),
+            needs_input=False,
+        ),
+    ],
+}
+
+
 class SdlcMultiAgentOrchestrator:
     """
     Multi-agent SDLC orchestrator for demo purposes.
+
+    execution="sequential" runs the pipeline one agent at a time, each agent
+    seeing everything before it. execution="dag" runs agents as soon as their
+    declared inputs are available, so independent agents (e.g. the two PR
+    reviewers) overlap.
+
+    context_policy="bounded" passes each agent only its declared input
+    artifacts, truncated to SDLC_CONTEXT_TOKEN_BUDGET (see context_budget.py),
+    so prompts stay flat instead of growing with every hop.
+    context_policy="full" keeps the unbounded behaviour (in sequential mode,
+    every previous output).
+
+    If on_event is given, progress is reported as agent_started and
+    agent_finished events; with stream=True agent replies are streamed from
+    the LLM and each text delta is also reported as a token event.
     """
 
     def __init__(self):
@@ -279,84 +377,125 @@ class SdlcMultiAgentOrchestrator:
         mode: Mode,
         user_input: str,
         extra_payload: Optional[Dict[str, Any]] = None,
+        execution: Execution = "sequential",
+        context_policy: ContextPolicy = "bounded",
+        on_event: Optional[EventCallback] = None,
+        stream: bool = False,
     ) -> Dict[str, Any]:
-        context: Dict[str, Any] = {"summary": ""}
-        transcript: List[Dict[str, Any]] = []
+        pipeline = PIPELINES.get(mode)
+        if pipeline is None:
+            raise ValueError(f"Unsupported mode: {mode}")
+        if execution not in ("sequential", "dag"):
+            raise ValueError(f"Unsupported execution: {execution}")
+        if context_policy not in ("bounded", "full"):
+            raise ValueError(f"Unsupported context_policy: {context_policy}")
+
+        budget = ContextBudget(
+            max_context_tokens=settings.SDLC_CONTEXT_TOKEN_BUDGET,
+            max_input_tokens=settings.SDLC_SUMMARY_INPUT_TOKENS,
+        )
 
-        async def step(agent: Agent, instructions: str = ""):
-            nonlocal context
-            result = await agent.run(
-                user_input=user_input,
-                context=context,
-                instructions=instructions,
-            )
-            # Append to transcript
-            transcript.append(
-                {
-                    "agent": result.agent,
-                    "message": result.message,
-                }
-            )
-            # Update running summary
-            context["summary"] += f"\n[{result.agent}]\n{result.message}\n"
+        # Whether agents see only their declared inputs
+        bounded_inputs = execution == "dag" or context_policy == "bounded"
+
+        run_started = time.perf_counter()
+        results: Dict[str, AgentResult] = {}
+        entries: Dict[str, Dict[str, Any]] = {}
+
+        async def step(spec: PipelineStep, context_summary: str) -> AgentResult:
+            agent: Agent = getattr(self, spec.agent)
+            agent_input = user_input
+            if context_policy == "bounded" and not spec.needs_input:
+                agent_input = budget.clip_input(user_input)
+
+            if on_event is not None:
+                await on_event(
+                    {
+                        "event": "agent_started",
+                        "agent": agent.name,
+                        "artifact": spec.artifact,
+                        "inputs": list(spec.inputs) if bounded_inputs else [],
+                    }
+                )
 
-            return result
+            on_token = None
+            if on_event is not None and stream:
 
-        # === Mode: feature ====================================
-        if mode == "feature":
-            r1 = await step(self.product_owner)
-            r2 = await step(self.architect)
-            r3 = await step(self.impl_planner)
-            r4 = await step(self.test_engineer)
-            r5 = await step(self.reporter)
-
-            artifacts = {
-                "user_story": r1.message,
-                "design": r2.message,
-                "tasks": r3.message,
-                "test_plan": r4.message,
-                "summary": r5.message,
-            }
+                async def on_token(delta: str) -> None:
+                    await on_event(
+                        {
+                            "event": "token",
+                            "agent": agent.name,
+                            "artifact": spec.artifact,
+                            "delta": delta,
+                        }
+                    )
 
-        # === Mode: pr_review ==================================
-        elif mode == "pr_review":
-            # user_input should contain PR description + diff
-            r1 = await step(self.code_reviewer)
-            r2 = await step(self.security_reviewer)
-            r3 = await step(self.test_engineer)
-            r4 = await step(self.impl_planner)  # as refactor planner
-            r5 = await step(self.reporter)
-
-            artifacts = {
-                "review_findings": r1.message,
-                "security_findings": r2.message,
-                "test_plan": r3.message,
-                "refactor_plan": r4.message,
-                "summary": r5.message,
+            started = time.perf_counter()
+            result = await agent.run(
+                user_input=agent_input,
+                context={"summary": context_summary},
+                on_token=on_token,
+            )
+            finished = time.perf_counter()
+
+            results[spec.artifact] = result
+            entries[spec.artifact] = {
+                "agent": result.agent,
+                "message": result.message,
+                "inputs": list(spec.inputs) if bounded_inputs else [],
+                "prompt_tokens": result.data.get("prompt_tokens", 0),
+                "started_ms": round((started - run_started) * 1000, 1),
+                "duration_ms": round((finished - started) * 1000, 1),
             }
+            if on_event is not None:
+                await on_event(
+                    {"event": "agent_finished", "artifact": spec.artifact, **entries[spec.artifact]}
+                )
+            return result
 
-        # === Mode: bug ========================================
-        elif mode == "bug":
-            r1 = await step(self.bug_triage)
-            r2 = await step(self.root_cause)
-            r3 = await step(self.fix_planner)
-            r4 = await step(self.regression_tester)
-            r5 = await step(self.reporter)
-
-            artifacts = {
-                "triage": r1.message,
-                "root_cause": r2.message,
-                "fix_plan": r3.message,
-                "regression_tests": r4.message,
-                "summary": r5.message,
-            }
+        def summarize(artifacts: List[str]) -> str:
+            # Same running-summary format for all modes
+            pairs = [(results[a].agent, results[a].message) for a in artifacts]
+            if context_policy == "bounded":
+                return budget.build(pairs)
+            return "".join(f"\n[{agent}]\n{message}\n" for agent, message in pairs)
+
+        if execution == "sequential":
+            done: List[str] = []
+            for spec in pipeline:
+                await step(spec, summarize(list(spec.inputs) if bounded_inputs else done))
+                done.append(spec.artifact)
         else:
-            raise ValueError(f"Unsupported mode: {mode}")
+            node_tasks: Dict[str, "asyncio.Task[AgentResult]"] = {}
+
+            async def run_node(spec: PipelineStep) -> AgentResult:
+                await asyncio.gather(*(node_tasks[i] for i in spec.inputs))
+                return await step(spec, summarize(list(spec.inputs)))
+
+            # Pipeline order guarantees inputs are scheduled before dependents
+            for spec in pipeline:
+                node_tasks[spec.artifact] = asyncio.create_task(run_node(spec))
+            try:
+                await asyncio.gather(*node_tasks.values())
+            finally:
+                for task in node_tasks.values():
+                    task.cancel()
+
+        total_ms = round((time.perf_counter() - run_started) * 1000, 1)
 
         return {
             "mode": mode,
-            "transcript": transcript,
-            "artifacts": artifacts,
+            "execution": execution,
+            "context_policy": context_policy,
+            # Transcript in pipeline order regardless of completion order
+            "transcript": [entries[spec.artifact] for spec in pipeline],
+            "artifacts": {spec.artifact: results[spec.artifact].message for spec in pipeline},
+            "timings": {
+                "total_ms": total_ms,
+                "agents_ms": round(sum(e["duration_ms"] for e in entries.values()), 1),
+            },
+            "prompt_tokens": sum(e["prompt_tokens"] for e in entries.values()),
         }
 
 
@@ -1,11 +1,11 @@
 # backend/app/services/auth_service.py
 from typing import Optional
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Query, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
 from app.schemas.user import UserPublic
-from app.services.user_store import get_user_by_token
+from app.services.user_store import get_user_by_token_async
 
 # HTTP Bearer authentication.
 # We use opaque random tokens stored in the sessions table (not JWTs).
@@ -28,8 +28,13 @@ async def get_current_user(
             detail="Not authenticated",
         )
 
-    token = credentials.credentials
-    user = get_user_by_token(token)
+    return await _user_for_token(credentials.credentials)
+
+
+async def _user_for_token(token: str) -> UserPublic:
+    # Session lookup runs on the DB thread pool: this dependency runs on the
+    # event loop for every authenticated request, sync routes included
+    user = await get_user_by_token_async(token)
 
     if user is None:
         raise HTTPException(
@@ -47,6 +52,27 @@ async def get_current_user(
     return user
 
 
+async def get_current_user_or_query_token(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
+    token: Optional[str] = Query(
+        None,
+        description="Session token, for clients that cannot set headers (EventSource)",
+    ),
+) -> UserPublic:
+    """
+    Like get_current_user, but also accepts the token as ?token=. Only for
+    streaming endpoints: query strings end up in access logs.
+    """
+    if credentials is not None and credentials.scheme.lower() == "bearer":
+        return await _user_for_token(credentials.credentials)
+    if token:
+        return await _user_for_token(token)
+    raise HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Not authenticated",
+    )
+
+
 def require_admin(user: UserPublic = Depends(get_current_user)) -> UserPublic:
     """
     Dependency that ensures the current user has admin privileges.
@@ -0,0 +1,121 @@
+# backend/app/services/change_feed.py
+"""
+Per-user view of change_log for the SSE change feed.
+
+Rows are turned into events with the *current* state of the row, loaded in
+one query per entity type, so clients can patch their lists in place:
+
+    {"entity": "task", "op": "update", "id": 12, "data": {...TaskEntry...}}
+
+Visibility follows the read endpoints:
+
+- task: admins; the owner for personal tasks; project viewers for project
+  tasks (as GET /api/tasks/{id})
+- standup: every user (as GET /api/standup/today)
+- project: admins and project owners/members
+- project_member: the member and everyone who can view the project
+  (keys only: {"project_id", "username"})
+
+A row the user could see before the write but not now (task moved to a
+project they cannot view, membership removed, row deleted) is sent as a
+"delete" with data null. Rows the user never saw are skipped.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional
+
+from app.schemas.user import UserPublic
+from app.services.project_permissions import ProjectAccess
+from app.services.projects import list_project_dicts_by_ids
+from app.services.standup_store import list_standup_dicts_by_ids
+from app.services.task_store import list_task_dicts_by_ids
+
+
+_PROJECT_ENTITIES = ("project", "project_member")
+
+
+class ChangeFeedFilter:
+    """
+    Stream-scoped filter. Project access is reloaded whenever a batch
+    contains project or membership changes; for those rows both the access
+    before and after the batch count, so a removed member still sees the
+    removal.
+    """
+
+    def __init__(self, user: UserPublic):
+        self.user = user
+        self.access = self._load_access()
+
+    def _load_access(self) -> ProjectAccess:
+        access = ProjectAccess(self.user)
+        access.viewable_project_ids()  # load now, not at the first check
+        return access
+
+    def _can_see_task(self, access: ProjectAccess, owner: Optional[str], project_id: Optional[int]) -> bool:
+        if access.is_admin:
+            return True
+        if project_id is not None:
+            return access.can_view(project_id)
+        return owner == self.user.username
+
+    def _can_see(self, entity: str, owner: Optional[str], project_id: Optional[int], accesses) -> bool:
+        if entity == "standup":
+            return True
+        if entity == "task":
+            return any(self._can_see_task(a, owner, project_id) for a in accesses)
+        if entity == "project_member" and owner == self.user.username:
+            return True
+        return project_id is not None and any(a.can_view(project_id) for a in accesses)
+
+    def events(self, rows: List[dict]) -> List[Dict[str, Any]]:
+        """
+        Events for the change_log rows this user may see, in log order, each
+        with its change_log id under "change_id".
+        """
+        before = self.access
+        if any(r["entity"] in _PROJECT_ENTITIES for r in rows):
+            self.access = self._load_access()
+        after = self.access
+
+        current = self._current_rows(rows)
+        events: List[Dict[str, Any]] = []
+        for row in rows:
+            entity, op, entity_id = row["entity"], row["op"], row["entity_id"]
+
+            if entity == "project_member":
+                # Keys only; clients reload GET /api/projects/{id}/members
+                if not self._can_see(entity, row["owner"], row["project_id"], (before, after)):
+                    continue
+                data = None if op == "delete" else {"project_id": entity_id, "username": row["owner"]}
+            else:
+                accesses = (before, after) if entity == "project" else (after,)
+                data = current[entity].get(entity_id)
+                if data is not None and self._can_see(
+                    entity, data.get("owner"), data.get("project_id", entity_id), (after,)
+                ):
+                    # Still exists (an id reused after a delete reads as an update)
+                    op = "update" if op == "delete" else op
+                elif self._can_see(entity, row["owner"], row["project_id"], accesses) or (
+                    op == "update"
+                    and self._can_see(entity, row["old_owner"], row["old_project_id"], accesses)
+                ):
+                    op, data = "delete", None
+                else:
+                    continue
+
+            events.append(
+                {"change_id": row["id"], "entity": entity, "op": op, "id": entity_id, "data": data}
+            )
+        return events
+
+    def _current_rows(self, rows: List[dict]) -> Dict[str, Dict[int, dict]]:
+        ids: Dict[str, set] = {"task": set(), "standup": set(), "project": set()}
+        for row in rows:
+            if row["entity"] in ids:
+                ids[row["entity"]].add(row["entity_id"])
+        return {
+            "task": {d["id"]: d for d in list_task_dicts_by_ids(ids["task"])},
+            "standup": {d["id"]: d for d in list_standup_dicts_by_ids(ids["standup"])},
+            "project": {d["id"]: d for d in list_project_dicts_by_ids(ids["project"])},
+        }
@@ -0,0 +1,180 @@
+# backend/app/services/change_log.py
+"""
+In-process change bus over the change_log table.
+
+Triggers on tasks, standups, projects and project_members append a row to
+change_log for every write (see app.db._install_change_log), so the log is
+complete whichever code path wrote. The stores then call publish_changes()
+after committing, which wakes every change feed subscriber in this process
+immediately. Subscribers also re-read the log every CHANGE_FEED_POLL_SECONDS
+to pick up writes made by other worker processes.
+
+The bus only says "something changed"; subscribers read the rows after
+their last seen id. This module deliberately imports nothing from the stores
+so that they can import it without cycles.
+
+The log is trimmed at startup and by a background task
+(start_change_log_trimmer), never on a user's write.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from datetime import datetime, timedelta
+from typing import List, Optional, Set, Tuple
+
+from app.core.config import settings
+from app.db import get_connection
+from app.db_async import run_db
+
+
+class ChangeSubscription:
+    """
+    Wake-up handle for one change feed stream. Create it inside the event
+    loop that will wait on it.
+    """
+
+    def __init__(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._event = asyncio.Event()
+
+    def _notify(self) -> None:
+        self._loop.call_soon_threadsafe(self._event.set)
+
+    async def wait(self, timeout: float) -> bool:
+        """
+        Wait until a change is published or timeout seconds pass. Returns
+        True if woken by a change.
+        """
+        try:
+            await asyncio.wait_for(self._event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return False
+        self._event.clear()
+        return True
+
+
+_subscribers: Set[ChangeSubscription] = set()
+# publish_changes() runs in threadpool (sync) routes as well as on the loop
+_lock = threading.Lock()
+_trimmer: Optional["asyncio.Task[None]"] = None
+
+
+def subscribe() -> ChangeSubscription:
+    subscription = ChangeSubscription()
+    with _lock:
+        _subscribers.add(subscription)
+    return subscription
+
+
+def unsubscribe(subscription: ChangeSubscription) -> None:
+    with _lock:
+        _subscribers.discard(subscription)
+
+
+def publish_changes() -> None:
+    """
+    Wake all subscribers in this process. Called by stores after a write
+    has committed; does no database work and does not raise.
+    """
+    with _lock:
+        subscribers = list(_subscribers)
+
+    for subscription in subscribers:
+        try:
+            subscription._notify()
+        except RuntimeError:
+            # Loop already closed; the stream's finally block will unsubscribe
+            pass
+
+
+def read_changes(after_id: int, limit: int = 500) -> List[dict]:
+    """
+    change_log rows with id > after_id, oldest first, as dicts.
+    """
+    conn = get_connection()
+    cur = conn.cursor()
+    cur.execute(
+        """
+        SELECT *
+        FROM change_log
+        WHERE id > ?
+        ORDER BY id ASC
+        LIMIT ?
+        """,
+        (after_id, limit),
+    )
+    rows = [dict(r) for r in cur.fetchall()]
+    conn.close()
+    return rows
+
+
+def change_log_bounds() -> Tuple[Optional[int], int]:
+    """
+    (oldest retained id or None if the log is empty, latest id ever issued).
+    """
+    conn = get_connection()
+    cur = conn.cursor()
+    cur.execute("SELECT MIN(id) AS oldest FROM change_log")
+    oldest = cur.fetchone()["oldest"]
+    cur.execute("SELECT seq FROM sqlite_sequence WHERE name = 'change_log'")
+    row = cur.fetchone()
+    conn.close()
+    return oldest, (row["seq"] if row else 0)
+
+
+def trim_change_log() -> int:
+    """
+    Delete rows older than CHANGE_FEED_RETENTION_HOURS or beyond the newest
+    CHANGE_FEED_MAX_ROWS. Returns the number of rows deleted.
+    """
+    cutoff = (
+        datetime.utcnow() - timedelta(hours=settings.CHANGE_FEED_RETENTION_HOURS)
+    ).isoformat()
+
+    conn = get_connection()
+    cur = conn.cursor()
+    cur.execute(
+        """
+        DELETE FROM change_log
+        WHERE created_at < ?
+           OR id <= (SELECT MAX(id) FROM change_log) - ?
+        """,
+        (cutoff, settings.CHANGE_FEED_MAX_ROWS),
+    )
+    deleted = cur.rowcount
+    conn.commit()
+    conn.close()
+    return deleted
+
+
+async def _trim_periodically() -> None:
+    while True:
+        await asyncio.sleep(settings.CHANGE_FEED_TRIM_INTERVAL_SECONDS)
+        try:
+            await run_db(trim_change_log)
+        except Exception as e:
+            # e.g. database locked by a long write; try again next interval
+            print(f"[change_log] Trim failed: {e}")
+
+
+def start_change_log_trimmer() -> None:
+    """
+    Trim the log every CHANGE_FEED_TRIM_INTERVAL_SECONDS in the background.
+    Call from the running event loop (app startup).
+    """
+    global _trimmer
+    if _trimmer is None or _trimmer.done():
+        _trimmer = asyncio.get_running_loop().create_task(_trim_periodically())
+
+
+async def stop_change_log_trimmer() -> None:
+    global _trimmer
+    if _trimmer is not None:
+        _trimmer.cancel()
+        try:
+            await _trimmer
+        except asyncio.CancelledError:
+            pass
+        _trimmer = None
@@ -0,0 +1,117 @@
+# backend/app/services/change_versions.py
+"""
+Conditional GET for list endpoints.
+
+Every write to tasks, projects, project_members and standups bumps a version
+counter in change_versions (SQLite triggers, see app.db._install_change_versions):
+
+- tasks:            'tasks' and 'tasks:owner:<owner>'
+- projects:         'projects'
+- project_members:  'project_members:<username>'
+- standups:         'standups:<YYYY-MM-DD>' (date of created_at)
+
+A list endpoint names the scopes its response depends on. The ETag is a
+hash of those versions plus whatever else shapes the response (path, query,
+viewer), so it changes exactly when the response can. Counters live in the
+database, so they are shared by all worker processes.
+
+Versions are read *before* the list query: a write landing in between makes
+the body newer than its ETag, which only costs the client one extra full
+response, never a stale 304.
+
+Only If-None-Match is answered. There is no Last-Modified: HTTP dates have
+one-second resolution and cannot carry the key parts (viewer, resolved
+date), so If-Modified-Since could match a list that has since changed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import Any, Callable, Dict, Iterable, Optional, Sequence, Tuple
+
+from fastapi import Request, Response, status
+
+from app.core.fast_json import FastJSONResponse
+from app.db import get_connection
+
+
+# scope -> (version, updated_at ISO string or None)
+Versions = Dict[str, Tuple[int, Optional[str]]]
+
+# Clients must revalidate every time; private because lists are per-user
+_CACHE_CONTROL = "private, no-cache"
+
+
+def get_versions(scopes: Iterable[str]) -> Versions:
+    """
+    Current (version, updated_at) for each scope, in one query. Scopes that
+    have never been written are (0, None).
+    """
+    scopes = list(dict.fromkeys(scopes))
+    versions: Versions = {scope: (0, None) for scope in scopes}
+    if not scopes:
+        return versions
+
+    conn = get_connection()
+    cur = conn.cursor()
+    cur.execute(
+        f"""
+        SELECT scope, version, updated_at
+        FROM change_versions
+        WHERE scope IN ({", ".join("?" for _ in scopes)})
+        """,
+        scopes,
+    )
+    for row in cur.fetchall():
+        versions[row["scope"]] = (row["version"], row["updated_at"])
+    conn.close()
+    return versions
+
+
+def make_etag(versions: Versions, *key_parts: Any) -> str:
+    content = json.dumps(
+        [sorted((scope, v[0]) for scope, v in versions.items()), key_parts],
+        default=str,
+        separators=(",", ":"),
+    )
+    return '"' + hashlib.sha1(content.encode("utf-8")).hexdigest()[:24] + '"'
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def conditional_list_response(
+    request: Request,
+    scopes: Sequence[str],
+    build: Callable[[], Any],
+    *key_parts: Any,
+) -> Response:
+    """
+    Answer a list GET from the change versions of `scopes`.
+
+    Returns 304 Not Modified (without calling build) when If-None-Match
+    matches the current ETag. Otherwise returns FastJSONResponse(build())
+    with the ETag set.
+
+    key_parts are mixed into the ETag alongside the request path and query;
+    pass anything else the response depends on (e.g. viewer, resolved date).
+    Permission checks must run before this call.
+    """
+    versions = get_versions(scopes)
+    etag = make_etag(versions, request.url.path, str(request.url.query), *key_parts)
+    headers = {"ETag": etag, "Cache-Control": _CACHE_CONTROL}
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None and _etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return FastJSONResponse(build(), headers=headers)
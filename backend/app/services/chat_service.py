@@ -1,9 +1,11 @@
 # filename: backend/app/services/chat_service.py
 from __future__ import annotations
 
+import asyncio
 from typing import Any, Dict, List, Literal, Optional, TypedDict
 
 from app.core.llm_client import llm_chat
+from app.core.llm_gateway import LLMPriority
 from app.schemas.knowledge import KnowledgeSourceChunk
 from app.services.knowledge import query_knowledge as kb_query_knowledge
 
@@ -132,6 +134,7 @@ async def chat_with_optional_rag(
     use_rag: bool = False,
     mode: Optional[str] = None,
     notes: Optional[str] = None,
+    priority: LLMPriority = "interactive",
 ) -> ChatResult:
     """
     Main entrypoint for /api/chat.
@@ -140,6 +143,9 @@ async def chat_with_optional_rag(
     - Optionally performs KB retrieval
     - Calls local LLM via llm_chat(...)
     - Returns reply + mode_used + used_rag + KB sources (if any)
+
+    priority is the LLM queue class; interactive chat is served before
+    background work (see app.core.llm_gateway).
     """
     text = message.strip()
     if not text:
@@ -155,7 +161,8 @@ async def chat_with_optional_rag(
     actually_used_rag = False
 
     if use_rag:
-        kb_chunks = kb_query_knowledge(query=text, top_k=4)
+        # Embedding + Chroma lookup block; run them off the event loop
+        kb_chunks = await asyncio.to_thread(kb_query_knowledge, query=text, top_k=4)
         if kb_chunks:
             actually_used_rag = True
 
@@ -211,7 +218,7 @@ async def chat_with_optional_rag(
         },
     ]
 
-    reply_text = await llm_chat(messages)
+    reply_text = await llm_chat(messages, priority=priority)
 
     sources: List[ChatSource] = []
     if actually_used_rag and kb_chunks:
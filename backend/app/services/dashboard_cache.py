@@ -0,0 +1,159 @@
+# backend/app/services/dashboard_cache.py
+"""
+In-process cache for dashboard summaries.
+
+Everyone opening the dashboard at the start of the day asks for the same
+summary. Entries are keyed by what the LLM actually sees (see
+make_dashboard_cache_key), so users with the same visible projects share one
+generation, and concurrent requests for the same key wait on a single
+in-flight LLM call instead of starting their own.
+
+Store writes (standups, projects, memberships) call invalidate_dashboard_cache()
+so the next request regenerates instead of waiting for the TTL. The key is
+content-derived, so other worker processes never serve a summary for data
+that has changed; invalidation just drops entries early. Task edits are
+covered by the key alone.
+
+This module deliberately imports nothing from the stores so that they can
+import it without cycles.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Tuple
+
+from app.core.config import settings
+
+
+# (summary, standup_count, project_count, knowledge_docs)
+DashboardResult = Tuple[str, int, int, int]
+CacheKey = Tuple[Any, ...]
+
+_MAX_ENTRIES = 256
+
+
+@dataclass
+class _Entry:
+    value: DashboardResult
+    created_at: float
+    generation: int
+
+
+_entries: Dict[CacheKey, _Entry] = {}
+_inflight: Dict[CacheKey, "asyncio.Task[DashboardResult]"] = {}
+
+# Bumped by every relevant store write; entries from older generations are stale.
+# Writes can come from threadpool (sync) routes, hence the lock.
+_generation = 0
+_generation_lock = threading.Lock()
+
+
+def _hash_rows(rows: Iterable[Iterable[Any]]) -> str:
+    sha = hashlib.sha1()
+    for row in rows:
+        sha.update(json.dumps(list(row), default=str).encode("utf-8"))
+        sha.update(b"\n")
+    return sha.hexdigest()
+
+
+def make_dashboard_cache_key(
+    day: str,
+    projects: Iterable[Any],
+    standups: Iterable[Any],
+    knowledge_docs: int,
+    use_rag: bool,
+    tasks: Iterable[Any] = (),
+) -> CacheKey:
+    """
+    Build the cache key: (day, visible-project-set hash, standup set hash,
+    active-task hash, KB doc count, use_rag). Only fields that end up in the
+    prompt are hashed.
+    """
+    project_hash = _hash_rows(
+        sorted(
+            (p.id, p.name, p.status, p.owner, p.description)
+            for p in projects
+        )
+    )
+    standup_hash = _hash_rows(
+        (s.id, s.name, s.yesterday, s.today, s.blockers)
+        for s in standups
+    )
+    task_hash = _hash_rows(
+        (t.id, t.owner, t.title, t.status, t.progress, t.project_name)
+        for t in tasks
+    )
+    return (day, project_hash, standup_hash, task_hash, knowledge_docs, bool(use_rag))
+
+
+def invalidate_dashboard_cache() -> None:
+    """
+    Mark every cached summary stale. Called by store writes.
+    """
+    global _generation
+    with _generation_lock:
+        _generation += 1
+
+
+def _is_cacheable(value: DashboardResult) -> bool:
+    # Never pin an LLM failure for the whole TTL.
+    summary = value[0] or ""
+    return not summary.lstrip().startswith("[LLM")
+
+
+def _store(key: CacheKey, value: DashboardResult, generation: int) -> None:
+    if not _is_cacheable(value):
+        return
+    if len(_entries) >= _MAX_ENTRIES and key not in _entries:
+        oldest = min(_entries, key=lambda k: _entries[k].created_at)
+        _entries.pop(oldest, None)
+    _entries[key] = _Entry(value=value, created_at=time.monotonic(), generation=generation)
+
+
+async def get_or_compute_dashboard(
+    key: CacheKey,
+    compute: Callable[[], Awaitable[DashboardResult]],
+    max_age: Optional[float] = None,
+) -> DashboardResult:
+    """
+    Return a cached summary for key if it is younger than max_age seconds
+    (default DASHBOARD_CACHE_TTL_SECONDS) and not invalidated; otherwise run
+    compute(), sharing a single in-flight call between concurrent requests.
+
+    max_age=0 skips the cached entry but still joins an in-flight generation
+    rather than starting a second one.
+    """
+    ttl = settings.DASHBOARD_CACHE_TTL_SECONDS if max_age is None else max_age
+
+    entry = _entries.get(key)
+    if (
+        entry is not None
+        and entry.generation == _generation
+        and time.monotonic() - entry.created_at <= ttl
+    ):
+        return entry.value
+
+    task = _inflight.get(key)
+    if task is None:
+        generation = _generation
+
+        async def _run() -> DashboardResult:
+            value = await compute()
+            # Tagged with the generation seen at start: a write during the
+            # LLM call leaves this result already stale.
+            _store(key, value, generation)
+            return value
+
+        task = asyncio.ensure_future(_run())
+        _inflight[key] = task
+        task.add_done_callback(lambda _t: _inflight.pop(key, None))
+
+    # shield: one client disconnecting must not cancel the shared generation
+    return await asyncio.shield(task)
+
@@ -1,11 +1,17 @@
 # filename: backend/app/services/dashboard_service.py
-from pathlib import Path
-from typing import Tuple
+import asyncio
+from datetime import date
+from typing import Dict, List, Optional, Set, Tuple
 
+from app.schemas.project import Project
+from app.schemas.standup import StandupEntry
+from app.schemas.task import TaskEntry
 from app.schemas.user import UserPublic
-from app.services.standup_store import get_today_standups
-from app.services.projects import list_projects
-from app.services.projects.members import list_projects_for_user
+from app.services.dashboard_cache import get_or_compute_dashboard, make_dashboard_cache_key
+from app.services.standup_store import get_today_standups_async
+from app.services.task_store import list_tasks_for_owners_async
+from app.services.projects import list_projects_async
+from app.services.projects.members import list_projects_for_user_async
 from app.services.chat_service import chat_with_optional_rag
 from app.core.llm_client import llm_chat
 from app.services.knowledge import KNOWLEDGE_DIR
@@ -27,49 +33,109 @@ def _count_knowledge_docs() -> int:
     return count
 
 
+def _visible_tasks(
+    tasks_by_owner: Dict[str, List[TaskEntry]],
+    project_ids: Set[int],
+) -> Dict[str, List[TaskEntry]]:
+    """
+    Keep personal tasks and tasks in projects the viewer can see, so the
+    prompt (and the cache key) never carry other projects' task titles.
+    """
+    visible: Dict[str, List[TaskEntry]] = {}
+    for owner, tasks in tasks_by_owner.items():
+        kept = [t for t in tasks if t.project_id is None or t.project_id in project_ids]
+        if kept:
+            visible[owner] = kept
+    return visible
+
+
 async def summarize_dashboard(
     current_user: UserPublic,
     use_rag: bool = False,
+    max_age: Optional[float] = None,
 ) -> Tuple[str, int, int, int]:
     """
     Build a high-level summary of today's activity:
     - standups
+    - active tasks of today's standup authors
     - projects
     - knowledgebase size
 
     Returns (summary, standup_count, project_count, knowledge_docs).
 
     Permission model:
-    - If current_user.role == 'admin': include all projects.
-    - Otherwise: include only projects the user is a member/owner of.
+    - If current_user.role == 'admin': include all projects and tasks.
+    - Otherwise: include only projects the user is a member/owner of, and
+      only personal tasks or tasks in those projects.
 
     Behavior:
     - If use_rag = False: use the original standalone llm_chat prompt.
     - If use_rag = True: call the unified chat_with_optional_rag(...) helper,
       which may also pull Knowledgebase context.
+
+    Caching:
+    - Summaries are cached by (visible projects, today's standups, their
+      authors' active tasks, KB doc count, use_rag) and shared between users
+      who see the same context.
+    - max_age (seconds) bounds how old a cached summary may be; None uses
+      DASHBOARD_CACHE_TTL_SECONDS and 0 forces regeneration.
     """
-    standups = get_today_standups()
+    # Store reads run on the DB thread pool, the directory scan on a worker
+    # thread: nothing here blocks the event loop.
+    standups = await get_today_standups_async()
 
     # Project visibility depends on the current user.
-    if getattr(current_user, "role", None) == "admin":
-        projects = list_projects()
+    is_admin = getattr(current_user, "role", None) == "admin"
+    if is_admin:
+        projects = await list_projects_async()
     else:
-        projects = list_projects_for_user(current_user.username)
+        projects = await list_projects_for_user_async(current_user.username)
 
-    knowledge_docs = _count_knowledge_docs()
+    knowledge_docs = await asyncio.to_thread(_count_knowledge_docs)
 
-    standup_count = len(standups)
-    project_count = len(projects)
+    tasks_by_owner = await list_tasks_for_owners_async({s.name for s in standups if s.name})
+    if not is_admin:
+        tasks_by_owner = _visible_tasks(tasks_by_owner, {p.id for p in projects})
 
     # If nothing at all, no need to bother the LLM
-    if standup_count == 0 and project_count == 0 and knowledge_docs == 0:
+    if not standups and not projects and knowledge_docs == 0:
         return (
             "No activity yet: no standups, no projects, and an empty knowledgebase.",
-            standup_count,
-            project_count,
+            0,
+            0,
             knowledge_docs,
         )
 
+    key = make_dashboard_cache_key(
+        day=date.today().isoformat(),
+        projects=projects,
+        standups=standups,
+        knowledge_docs=knowledge_docs,
+        use_rag=use_rag,
+        tasks=[t for owner in sorted(tasks_by_owner) for t in tasks_by_owner[owner]],
+    )
+
+    async def _compute() -> Tuple[str, int, int, int]:
+        return await _generate_dashboard_summary(
+            standups, tasks_by_owner, projects, knowledge_docs, use_rag
+        )
+
+    return await get_or_compute_dashboard(key, _compute, max_age=max_age)
+
+
+async def _generate_dashboard_summary(
+    standups: List[StandupEntry],
+    tasks_by_owner: Dict[str, List[TaskEntry]],
+    projects: List[Project],
+    knowledge_docs: int,
+    use_rag: bool,
+) -> Tuple[str, int, int, int]:
+    """
+    Run the LLM for one dashboard context (uncached).
+    """
+    standup_count = len(standups)
+    project_count = len(projects)
+
     # Build text summary for the LLM as context
     lines = []
 
@@ -84,6 +150,18 @@ async def summarize_dashboard(
                 lines.append(f"    Blockers: {s.blockers}")
         lines.append("")
 
+    task_lines = []
+    for owner in sorted(tasks_by_owner):
+        for t in tasks_by_owner[owner]:
+            task_lines.append(
+                f"- {owner}: [{t.status}][{t.progress}%] {t.title} "
+                f"(project: {t.project_name or 'n/a'})"
+            )
+    if task_lines:
+        lines.append("ACTIVE TASKS:")
+        lines.extend(task_lines)
+        lines.append("")
+
     if project_count > 0:
         lines.append("PROJECTS:")
         for p in projects:
@@ -101,7 +179,7 @@ async def summarize_dashboard(
     if not use_rag:
         system_prompt = (
             "You are a technical lead in a small developer unit.\n"
-            "You will be given today's standups, current projects, and knowledgebase size.\n"
+            "You will be given today's standups, active tasks, current projects, and knowledgebase size.\n"
             "Write a short dashboard summary that could be used as a SITREP / status update.\n"
             "Include:\n"
             "- Overall status in a few bullet points\n"
@@ -119,7 +197,12 @@ async def summarize_dashboard(
             },
         ]
 
-        summary_text = await llm_chat(messages)
+        summary_text = await llm_chat(
+            messages,
+            coalesce=True,
+            endpoint="dashboard",
+            priority="background",
+        )
         return summary_text, standup_count, project_count, knowledge_docs
 
     # -------------------------------------------------------------------------
@@ -136,7 +219,7 @@ async def summarize_dashboard(
     )
 
     notes = (
-        "Here is the current DevCell context (standups, projects, knowledgebase):\n\n"
+        "Here is the current DevCell context (standups, tasks, projects, knowledgebase):\n\n"
         f"{context_text}\n\n"
         "Use this context as ground truth. If Knowledgebase RAG adds additional "
         "relevant information, you may incorporate it, but do not hallucinate "
@@ -148,6 +231,7 @@ async def summarize_dashboard(
         use_rag=True,
         mode="docs",
         notes=notes,
+        priority="background",
     )
 
     summary_text = result["reply"]
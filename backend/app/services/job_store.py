@@ -0,0 +1,250 @@
+# backend/app/services/job_store.py
+"""
+Background jobs (SQLite table `background_jobs`).
+
+Long-running work, such as an SDLC demo run that can take minutes, runs
+outside the HTTP request. The client gets a job id at once and polls for the
+stored result. start_background_job() creates the row and runs the work on
+the event loop. The work can save partial results while it runs.
+
+Jobs live in the API process that started them, recorded in the `owner`
+column as "<boot id>:<pid>:<process start time>". At startup, each worker
+marks failed only the queued or running jobs whose owner process is gone
+(fail_interrupted_jobs). Jobs of other live workers are left alone.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import socket
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional, Set
+
+from app.db import get_connection
+from app.db_async import run_db
+from app.schemas.job import BackgroundJob
+
+# Work receives the job id (for save_job_progress) and returns the result
+JobWork = Callable[[str], Awaitable[Dict[str, Any]]]
+
+# Strong references so running jobs are not garbage collected
+_running: Set["asyncio.Task[None]"] = set()
+
+
+def _boot_id() -> str:
+    try:
+        return Path("/proc/sys/kernel/random/boot_id").read_text().strip()
+    except OSError:
+        # Non-Linux: the host name at least separates machines
+        return socket.gethostname()
+
+
+def _process_start(pid: int) -> str:
+    """
+    Start time of a process (clock ticks since boot), so a reused pid is not
+    mistaken for the process that owned a job. Empty if unknown.
+    """
+    try:
+        stat = Path(f"/proc/{pid}/stat").read_text()
+        # Field 22; fields after the ")" closing the command name start at 3
+        return stat.rsplit(")", 1)[1].split()[19]
+    except (OSError, IndexError):
+        return ""
+
+
+_BOOT_ID = _boot_id()
+_OWNER = f"{_BOOT_ID}:{os.getpid()}:{_process_start(os.getpid())}"
+
+
+def _owner_alive(owner: Optional[str]) -> bool:
+    if not owner:
+        # Rows written before owners were recorded
+        return False
+    try:
+        boot_id, pid_str, started = owner.rsplit(":", 2)
+        pid = int(pid_str)
+    except ValueError:
+        return False
+    if boot_id != _BOOT_ID:
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        # Exists, owned by another user
+        pass
+    return not started or _process_start(pid) == started
+
+
+def _now() -> str:
+    return datetime.utcnow().isoformat(timespec="seconds")
+
+
+def _row_to_job(row) -> BackgroundJob:
+    return BackgroundJob(
+        id=row["id"],
+        kind=row["kind"],
+        status=row["status"],
+        request=json.loads(row["request_json"]),
+        result=json.loads(row["result_json"]) if row["result_json"] else None,
+        error=row["error"],
+        created_at=datetime.fromisoformat(row["created_at"]),
+        updated_at=datetime.fromisoformat(row["updated_at"]),
+        finished_at=datetime.fromisoformat(row["finished_at"]) if row["finished_at"] else None,
+    )
+
+
+def create_job(kind: str, request: Dict[str, Any]) -> BackgroundJob:
+    job_id = uuid.uuid4().hex
+    now_str = _now()
+
+    conn = get_connection()
+    cur = conn.cursor()
+    cur.execute(
+        """
+        INSERT INTO background_jobs (id, kind, status, request_json, created_at, updated_at, owner)
+        VALUES (?, ?, 'queued', ?, ?, ?, ?)
+        """,
+        (job_id, kind, json.dumps(request), now_str, now_str, _OWNER),
+    )
+    conn.commit()
+
+    cur.execute("SELECT * FROM background_jobs WHERE id = ?", (job_id,))
+    row = cur.fetchone()
+    conn.close()
+    return _row_to_job(row)
+
+
+def get_job(job_id: str, kind: Optional[str] = None) -> Optional[BackgroundJob]:
+    conn = get_connection()
+    cur = conn.cursor()
+    if kind is None:
+        cur.execute("SELECT * FROM background_jobs WHERE id = ?", (job_id,))
+    else:
+        cur.execute(
+            "SELECT * FROM background_jobs WHERE id = ? AND kind = ?",
+            (job_id, kind),
+        )
+    row = cur.fetchone()
+    conn.close()
+    return _row_to_job(row) if row else None
+
+
+def _update_job(
+    job_id: str,
+    status: str,
+    result: Optional[Dict[str, Any]] = None,
+    error: Optional[str] = None,
+) -> None:
+    now_str = _now()
+    finished = now_str if status in ("succeeded", "failed") else None
+
+    conn = get_connection()
+    cur = conn.cursor()
+    cur.execute(
+        """
+        UPDATE background_jobs
+        SET status = ?,
+            result_json = COALESCE(?, result_json),
+            error = ?,
+            updated_at = ?,
+            finished_at = COALESCE(?, finished_at)
+        WHERE id = ?
+        """,
+        (
+            status,
+            json.dumps(result) if result is not None else None,
+            error,
+            now_str,
+            finished,
+            job_id,
+        ),
+    )
+    conn.commit()
+    conn.close()
+
+
+def save_job_progress(job_id: str, partial_result: Dict[str, Any]) -> None:
+    """
+    Store a partial result for a running job so pollers can see progress.
+    """
+    _update_job(job_id, "running", result=partial_result)
+
+
+async def save_job_progress_async(job_id: str, partial_result: Dict[str, Any]) -> None:
+    """
+    save_job_progress() for async code (runs on the DB thread pool).
+    """
+    await run_db(save_job_progress, job_id, partial_result)
+
+
+def fail_interrupted_jobs() -> int:
+    """
+    Mark queued/running jobs whose owner process has exited as failed.
+    Safe to call from every worker at startup: jobs of live workers are kept.
+    """
+    conn = get_connection()
+    cur = conn.cursor()
+    cur.execute("SELECT id, owner FROM background_jobs WHERE status IN ('queued', 'running')")
+    orphaned = [row["id"] for row in cur.fetchall() if not _owner_alive(row["owner"])]
+
+    if orphaned:
+        now_str = _now()
+        # Status re-checked: a job may have finished since the SELECT
+        cur.executemany(
+            """
+            UPDATE background_jobs
+            SET status = 'failed', error = 'Interrupted by server restart',
+                updated_at = ?, finished_at = ?
+            WHERE id = ? AND status IN ('queued', 'running')
+            """,
+            [(now_str, now_str, job_id) for job_id in orphaned],
+        )
+        conn.commit()
+    conn.close()
+    return len(orphaned)
+
+
+def purge_finished_jobs(older_than_days: int) -> int:
+    cutoff = (datetime.utcnow() - timedelta(days=older_than_days)).isoformat(timespec="seconds")
+    conn = get_connection()
+    cur = conn.cursor()
+    cur.execute(
+        "DELETE FROM background_jobs WHERE finished_at IS NOT NULL AND finished_at < ?",
+        (cutoff,),
+    )
+    count = cur.rowcount
+    conn.commit()
+    conn.close()
+    return count
+
+
+async def start_background_job(kind: str, request: Dict[str, Any], work: JobWork) -> BackgroundJob:
+    """
+    Create a job row and run `work(job_id)` in the background.
+    The returned dict is stored as the final result; an exception fails the job.
+    Job rows are written on the DB thread pool (app.db_async).
+    """
+    job = await run_db(create_job, kind, request)
+
+    async def runner() -> None:
+        await run_db(_update_job, job.id, "running")
+        try:
+            result = await work(job.id)
+        except asyncio.CancelledError:
+            await run_db(_update_job, job.id, "failed", error="Cancelled")
+            raise
+        except Exception as e:
+            await run_db(_update_job, job.id, "failed", error=str(e) or type(e).__name__)
+            return
+        await run_db(_update_job, job.id, "succeeded", result=result)
+
+    task = asyncio.get_running_loop().create_task(runner())
+    _running.add(task)
+    task.add_done_callback(_running.discard)
+    return job
@@ -0,0 +1,180 @@
+# backend/app/services/knowledge/chunking.py
+
+from __future__ import annotations
+
+import hashlib
+import re
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from .config import CHUNKER_BY_FOLDER, DEFAULT_CHUNKER, KNOWLEDGE_DIR
+
+
+Chunker = Callable[[str], List[str]]
+
+
+def _normalize(text: str) -> str:
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+def _split_sentences(text: str) -> List[str]:
+    # Very simple sentence segmentation: split on punctuation + space/newline
+    # This is intentionally light to avoid extra dependencies.
+    raw_sentences = re.split(r"(?<=[\.!?])\s+", text)
+    return [s.strip() for s in raw_sentences if s.strip()]
+
+
+def chunk_text_window(text: str, max_chars: int = 800, overlap: int = 200) -> List[str]:
+    """
+    Chunk text into overlapping windows of ~max_chars, trying to cut on sentence boundaries.
+
+    - First split into sentences using a lightweight regex.
+    - Then pack sentences into windows with overlap between chunks.
+
+    Boundaries depend on everything before them, so an insertion near the top
+    of a document shifts every later chunk.
+    """
+    normalized = _normalize(text)
+    sentences = _split_sentences(normalized)
+
+    if not sentences:
+        return [normalized[:max_chars]]
+
+    chunks: List[str] = []
+    current: List[str] = []
+    current_len = 0
+
+    for sent in sentences:
+        sent_len = len(sent)
+        if current and current_len + sent_len + 1 > max_chars:
+            # finalize current chunk
+            chunk_text = " ".join(current).strip()
+            if chunk_text:
+                chunks.append(chunk_text)
+
+            # start new chunk with overlap from the end of previous
+            if overlap > 0 and chunks:
+                # take last chunk and keep the last 'overlap' characters worth of sentences
+                last_chunk = chunks[-1]
+                # crude overlap: take tail substring
+                tail = last_chunk[-overlap:]
+                current = [tail, sent]
+                current_len = len(tail) + 1 + sent_len
+            else:
+                current = [sent]
+                current_len = sent_len
+        else:
+            current.append(sent)
+            current_len += sent_len + (1 if current_len > 0 else 0)
+
+    if current:
+        chunk_text = " ".join(current).strip()
+        if chunk_text:
+            chunks.append(chunk_text)
+
+    return chunks or [normalized[:max_chars]]
+
+
+def _is_anchor(sentence: str, divisor: int) -> bool:
+    """
+    Decide from the sentence content alone whether a chunk may end after it.
+
+    Uses a stable hash (not Python's salted hash()) so boundaries are the
+    same across processes and restarts.
+    """
+    digest = hashlib.sha1(sentence.encode("utf-8", errors="ignore")).hexdigest()
+    return int(digest[:8], 16) % divisor == 0
+
+
+def chunk_text_anchored(
+    text: str,
+    min_chars: int = 300,
+    max_chars: int = 1000,
+    divisor: int = 4,
+) -> List[str]:
+    """
+    Content-defined chunking: cut points are chosen by the sentences themselves.
+
+    - A chunk ends after an "anchor" sentence (stable hash % divisor == 0)
+      once it holds at least min_chars.
+    - A markdown heading always starts a new chunk (once min_chars is reached).
+    - max_chars is a hard cap so a long run without anchors still gets split.
+
+    Because a boundary only depends on nearby sentences, inserting or editing
+    a sentence only changes the chunk(s) around it; later chunks keep their
+    hashes and therefore their ids and vectors. No tail overlap is added:
+    the query layer already stitches +/- 1 neighbor chunk into each snippet.
+    """
+    normalized = _normalize(text)
+
+    # Paragraphs first so headings and list items stay separate units.
+    units: List[str] = []
+    for paragraph in re.split(r"\n\s*\n", normalized):
+        units.extend(_split_sentences(paragraph))
+
+    if not units:
+        return [normalized[:max_chars]]
+
+    chunks: List[str] = []
+    current: List[str] = []
+    current_len = 0
+
+    def _flush() -> None:
+        nonlocal current, current_len
+        chunk_text = " ".join(current).strip()
+        if chunk_text:
+            chunks.append(chunk_text)
+        current = []
+        current_len = 0
+
+    for unit in units:
+        unit_len = len(unit)
+
+        if current and (
+            current_len + unit_len + 1 > max_chars
+            or (unit.startswith("#") and current_len >= min_chars)
+        ):
+            _flush()
+
+        current.append(unit)
+        current_len += unit_len + (1 if len(current) > 1 else 0)
+
+        if current_len >= min_chars and _is_anchor(unit, divisor):
+            _flush()
+
+    if current:
+        _flush()
+
+    return chunks or [normalized[:max_chars]]
+
+
+CHUNKERS: Dict[str, Chunker] = {
+    "window": chunk_text_window,
+    "anchored": chunk_text_anchored,
+}
+
+
+def get_chunker_name_for_path(path: Path) -> str:
+    """
+    Resolve the chunking strategy for a file from its folder under knowledgebase/.
+
+    The longest matching folder prefix in CHUNKER_BY_FOLDER wins, e.g.
+    "notes/training" beats "notes". Files outside knowledgebase/ (or in
+    folders without an override) use DEFAULT_CHUNKER.
+    """
+    try:
+        rel_parts = path.resolve().relative_to(KNOWLEDGE_DIR.resolve()).parts[:-1]
+    except ValueError:
+        rel_parts = ()
+
+    for depth in range(len(rel_parts), 0, -1):
+        folder = "/".join(rel_parts[:depth]).lower()
+        name = CHUNKER_BY_FOLDER.get(folder)
+        if name in CHUNKERS:
+            return name
+
+    return DEFAULT_CHUNKER if DEFAULT_CHUNKER in CHUNKERS else "window"
+
+
+def chunk_text_for_path(path: Path, text: str) -> List[str]:
+    return CHUNKERS[get_chunker_name_for_path(path)](text)
@@ -5,15 +5,14 @@ from chromadb.config import Settings
 
 from .config import CHROMA_DIR
 
+COLLECTION_NAME = "devcell_knowledge"
+
 _client: Optional[chromadb.Client] = None
 _collection: Optional[chromadb.Collection] = None
 
 
-def get_collection() -> chromadb.Collection:
-    """
-    Return the singleton Chroma collection for DevCell knowledge.
-    """
-    global _client, _collection
+def _get_client() -> chromadb.Client:
+    global _client
 
     if _client is None:
         CHROMA_DIR.mkdir(parents=True, exist_ok=True)
@@ -21,8 +20,39 @@ def get_collection() -> chromadb.Collection:
             path=str(CHROMA_DIR),
             settings=Settings(allow_reset=False),
         )
+    return _client
+
+
+def get_collection() -> chromadb.Collection:
+    """
+    Return the singleton Chroma collection for DevCell knowledge.
+    """
+    global _collection
 
     if _collection is None:
-        _collection = _client.get_or_create_collection("devcell_knowledge")
+        # Vectors are always supplied by our own embedder (embedder.py), so
+        # Chroma's default embedding function is disabled and never loaded.
+        _collection = _get_client().get_or_create_collection(
+            COLLECTION_NAME,
+            embedding_function=None,
+        )
 
     return _collection
+
+
+def reset_collection() -> chromadb.Collection:
+    """
+    Drop all vectors and return a new, empty collection.
+
+    Used when the embedding model changes: vectors from different models
+    (possibly of different dimensions) cannot share one collection.
+    """
+    global _collection
+
+    try:
+        _get_client().delete_collection(COLLECTION_NAME)
+    except Exception:
+        # Did not exist yet
+        pass
+    _collection = None
+    return get_collection()
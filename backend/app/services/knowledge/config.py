@@ -1,10 +1,43 @@
+import os
 from pathlib import Path
+from typing import Dict
 
 # Repo root (../.. from this file)
 BASE_DIR = Path(__file__).resolve().parents[2]
 
-# Standardize on lowercase "knowledgebase" for the folder name
-KNOWLEDGE_DIR = BASE_DIR / "knowledgebase"
+# Standardize on lowercase "knowledgebase" for the folder name.
+# Each location can be overridden (e.g. benchmarks index into a scratch dir).
+KNOWLEDGE_DIR = Path(os.getenv("KNOWLEDGE_DIR", BASE_DIR / "knowledgebase"))
 
 # Chroma persistent path
-CHROMA_DIR = BASE_DIR / "chroma_store"
+CHROMA_DIR = Path(os.getenv("KNOWLEDGE_CHROMA_DIR", BASE_DIR / "chroma_store"))
+
+# Persistent chunk embedding cache, keyed by (model, chunk_hash)
+EMBEDDING_CACHE_DIR = Path(
+    os.getenv("KNOWLEDGE_EMBEDDING_CACHE_DIR", BASE_DIR / "embedding_cache")
+)
+
+
+def _parse_folder_map(raw: str) -> Dict[str, str]:
+    """
+    Parse "notes=anchored,docs/adr=window" into {"notes": "anchored", "docs/adr": "window"}.
+    """
+    mapping: Dict[str, str] = {}
+    for part in raw.split(","):
+        if "=" not in part:
+            continue
+        folder, name = part.split("=", 1)
+        folder = folder.strip().strip("/").lower()
+        if folder:
+            mapping[folder] = name.strip().lower()
+    return mapping
+
+
+# Chunking strategy ("window" | "anchored"), selectable per folder under knowledgebase/.
+# Notes are edited in place often, so they use content-defined ("anchored") chunks by default.
+#   KNOWLEDGE_CHUNKER=window
+#   KNOWLEDGE_CHUNKER_FOLDERS="notes=anchored,sops=anchored"
+DEFAULT_CHUNKER = os.getenv("KNOWLEDGE_CHUNKER", "window").strip().lower()
+CHUNKER_BY_FOLDER = _parse_folder_map(
+    os.getenv("KNOWLEDGE_CHUNKER_FOLDERS", "notes=anchored")
+)
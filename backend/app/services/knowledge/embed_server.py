@@ -0,0 +1,211 @@
+# backend/app/services/knowledge/embed_server.py
+"""
+Standalone embedding service shared by all uvicorn workers.
+
+Each worker process would otherwise load its own copy of the embedding model.
+Run one of these per host instead and point the backend at it:
+
+    python -m app.services.knowledge.embed_server --socket /run/devcell/embed.sock
+    KNOWLEDGE_EMBED_SOCKET=/run/devcell/embed.sock uvicorn app.main:app --workers 4
+
+Requests from all connections are merged into micro-batches: the batcher
+waits up to --max-wait-ms after the first request (or until --max-batch texts
+are queued) and runs a single encode() call for the whole batch.
+
+Protocol: one JSON object per line in each direction.
+    -> {"op": "info"}
+    <- {"model": "<cache key>", "dim": 384}
+    -> {"op": "embed", "texts": ["...", "..."]}
+    <- {"model": "<cache key>", "dim": 384, "count": 2,
+        "vectors_b64": "<float32 little-endian, row-major>"}
+    <- {"error": "..."}   (on failure)
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import base64
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
+
+import numpy as np
+
+from .embedder import get_local_model_key, load_embedder
+
+
+@dataclass
+class _PendingRequest:
+    texts: List[str]
+    future: "asyncio.Future[np.ndarray]"
+    enqueued_at: float = field(default_factory=time.perf_counter)
+
+
+class EmbeddingServer:
+    def __init__(self, socket_path: str, max_batch: int = 64, max_wait_ms: float = 5.0):
+        self.socket_path = socket_path
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000.0
+
+        self.model = load_embedder()
+        # Never ask the service for its own key: KNOWLEDGE_EMBED_SOCKET may point here
+        self.model_key = get_local_model_key()
+        self.dim = int(self.model.get_sentence_embedding_dimension() or 0)
+
+        self._queue: "asyncio.Queue[_PendingRequest]" = asyncio.Queue()
+        # One inference thread: the model is not re-entrant and batching already
+        # gives us the throughput.
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="embed")
+
+        self.batches = 0
+        self.texts = 0
+
+    def _encode(self, texts: List[str]) -> np.ndarray:
+        return np.asarray(
+            self.model.encode(texts, normalize_embeddings=True, show_progress_bar=False),
+            dtype=np.float32,
+        )
+
+    async def _batch_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+
+        while True:
+            first = await self._queue.get()
+            batch = [first]
+            total = len(first.texts)
+            deadline = first.enqueued_at + self.max_wait
+
+            # Dynamic micro-batching: keep collecting until the batch is full
+            # or the oldest request has waited max_wait.
+            while total < self.max_batch:
+                timeout = deadline - time.perf_counter()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                batch.append(item)
+                total += len(item.texts)
+
+            texts = [t for req in batch for t in req.texts]
+            try:
+                vectors = await loop.run_in_executor(self._executor, self._encode, texts)
+            except Exception as e:
+                for req in batch:
+                    if not req.future.done():
+                        req.future.set_exception(e)
+                continue
+
+            self.batches += 1
+            self.texts += len(texts)
+
+            offset = 0
+            for req in batch:
+                n = len(req.texts)
+                if not req.future.done():
+                    req.future.set_result(vectors[offset : offset + n])
+                offset += n
+
+    async def _handle_request(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        op = payload.get("op", "embed")
+
+        if op == "info":
+            return {
+                "model": self.model_key,
+                "dim": self.dim,
+                "batches": self.batches,
+                "texts": self.texts,
+            }
+
+        if op != "embed":
+            return {"error": f"unknown op '{op}'"}
+
+        texts = payload.get("texts")
+        if not isinstance(texts, list) or not all(isinstance(t, str) for t in texts):
+            return {"error": "'texts' must be a list of strings"}
+        if not texts:
+            return {"model": self.model_key, "dim": self.dim, "count": 0, "vectors_b64": ""}
+
+        future: "asyncio.Future[np.ndarray]" = asyncio.get_running_loop().create_future()
+        await self._queue.put(_PendingRequest(texts=texts, future=future))
+        vectors = await future
+
+        return {
+            "model": self.model_key,
+            "dim": int(vectors.shape[1]),
+            "count": int(vectors.shape[0]),
+            "vectors_b64": base64.b64encode(vectors.astype("<f4").tobytes()).decode("ascii"),
+        }
+
+    async def _handle_connection(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    response = await self._handle_request(json.loads(line))
+                except Exception as e:
+                    response = {"error": str(e)}
+                writer.write(json.dumps(response).encode("utf-8") + b"\n")
+                await writer.drain()
+        finally:
+            writer.close()
+
+    async def serve_forever(self) -> None:
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+        batcher = asyncio.create_task(self._batch_loop())
+        server = await asyncio.start_unix_server(
+            self._handle_connection,
+            path=self.socket_path,
+            limit=64 * 1024 * 1024,
+        )
+        os.chmod(self.socket_path, 0o660)
+        print(
+            f"[embed-server] {self.model_key} (dim={self.dim}) listening on {self.socket_path} "
+            f"(max_batch={self.max_batch}, max_wait_ms={self.max_wait * 1000:.1f})"
+        )
+
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            batcher.cancel()
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="DevCell shared embedding service")
+    parser.add_argument(
+        "--socket",
+        default=os.getenv("KNOWLEDGE_EMBED_SOCKET", "/tmp/devcell-embed.sock"),
+        help="Unix socket path to listen on",
+    )
+    parser.add_argument("--max-batch", type=int, default=64)
+    parser.add_argument("--max-wait-ms", type=float, default=5.0)
+    args = parser.parse_args()
+
+    async def _run() -> None:
+        server = EmbeddingServer(args.socket, max_batch=args.max_batch, max_wait_ms=args.max_wait_ms)
+        await server.serve_forever()
+
+    try:
+        asyncio.run(_run())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,126 @@
+import base64
+import functools
+import json
 import os
+import socket
 from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
+import numpy as np
 from sentence_transformers import SentenceTransformer
 
+from .embedding_cache import get_embedding_cache
+
 
 EMBED_MODEL_NAME = os.getenv(
     "KNOWLEDGE_EMBED_MODEL",
     "sentence-transformers/all-MiniLM-L6-v2",
 )
 
+# Inference backend for the embedding model:
+#   torch       full-precision PyTorch (default)
+#   torch-int8  PyTorch with dynamic int8 quantization of Linear layers (CPU, no extra deps)
+#   onnx        ONNX Runtime (needs sentence-transformers>=3.2 + optimum[onnxruntime])
+#   onnx-int8   ONNX Runtime with a pre-quantized int8 export (KNOWLEDGE_EMBED_ONNX_FILE)
+EMBED_BACKEND = os.getenv("KNOWLEDGE_EMBED_BACKEND", "torch").strip().lower()
+EMBED_BACKENDS = ("torch", "torch-int8", "onnx", "onnx-int8")
+
+# CPU threads for inference (0 = library default)
+EMBED_THREADS = int(os.getenv("KNOWLEDGE_EMBED_THREADS", "0") or 0)
+
+# File inside the model repo used by the onnx-int8 backend
+EMBED_ONNX_FILE = os.getenv("KNOWLEDGE_EMBED_ONNX_FILE", "onnx/model_quint8_avx2.onnx")
+
+# Run one small batch right after loading so the first request is not slow
+EMBED_WARMUP = os.getenv("KNOWLEDGE_EMBED_WARMUP", "1").strip().lower() not in {"0", "false", "no"}
+
+# Optional shared embedding service (see embed_server.py). When set, this
+# process never loads the model unless the service is unreachable.
+EMBED_SOCKET = os.getenv("KNOWLEDGE_EMBED_SOCKET", "").strip()
+EMBED_SOCKET_TIMEOUT = float(os.getenv("KNOWLEDGE_EMBED_SOCKET_TIMEOUT", "60"))
+
+
+def _onnx_model_kwargs(threads: int, file_name: str | None) -> Dict[str, object]:
+    try:
+        import onnxruntime as ort
+    except ImportError as e:
+        raise RuntimeError(
+            "ONNX embedder backend requires onnxruntime; "
+            "install 'optimum[onnxruntime]' or use KNOWLEDGE_EMBED_BACKEND=torch."
+        ) from e
+
+    session_options = ort.SessionOptions()
+    if threads > 0:
+        session_options.intra_op_num_threads = threads
+        session_options.inter_op_num_threads = 1
+
+    kwargs: Dict[str, object] = {
+        "provider": "CPUExecutionProvider",
+        "session_options": session_options,
+    }
+    if file_name:
+        kwargs["file_name"] = file_name
+    return kwargs
+
+
+def load_embedder(
+    model_name: str = EMBED_MODEL_NAME,
+    backend: str = EMBED_BACKEND,
+    threads: int = EMBED_THREADS,
+    warmup: bool = EMBED_WARMUP,
+) -> SentenceTransformer:
+    """
+    Build an embedding model for the given backend.
+
+    get_embedder() is the cached, settings-driven entry point; this factory is
+    exposed so benchmarks can load several backends side by side.
+    """
+    if backend not in EMBED_BACKENDS:
+        raise ValueError(
+            f"Unknown KNOWLEDGE_EMBED_BACKEND '{backend}'. Expected one of: {', '.join(EMBED_BACKENDS)}"
+        )
+
+    if backend in {"torch", "torch-int8"}:
+        import torch
+
+        if threads > 0:
+            torch.set_num_threads(threads)
+
+        if backend == "torch":
+            model = SentenceTransformer(model_name)
+        else:
+            # Dynamic quantization only targets CPU inference
+            model = SentenceTransformer(model_name, device="cpu")
+            model = torch.quantization.quantize_dynamic(
+                model,
+                {torch.nn.Linear},
+                dtype=torch.qint8,
+            )
+    else:
+        model_kwargs = _onnx_model_kwargs(
+            threads,
+            EMBED_ONNX_FILE if backend == "onnx-int8" else None,
+        )
+        try:
+            model = SentenceTransformer(
+                model_name,
+                device="cpu",
+                backend="onnx",
+                model_kwargs=model_kwargs,
+            )
+        except TypeError as e:
+            raise RuntimeError(
+                "ONNX embedder backend requires sentence-transformers>=3.2."
+            ) from e
+
+    if warmup:
+        model.encode(
+            ["DevCell knowledgebase warmup sentence."] * 8,
+            show_progress_bar=False,
+        )
+
+    return model
+
 
 @lru_cache(maxsize=1)
 def get_embedder() -> SentenceTransformer:
@@ -18,4 +130,179 @@ def get_embedder() -> SentenceTransformer:
     Using lru_cache avoids global mutable state and ensures the model
     is only instantiated once per process.
     """
-    return SentenceTransformer(EMBED_MODEL_NAME)
+    return load_embedder()
+
+
+def _socket_call(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Send one request to the embedding service and return its decoded reply.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(EMBED_SOCKET_TIMEOUT)
+        sock.connect(EMBED_SOCKET)
+        sock.sendall(json.dumps(payload).encode("utf-8") + b"\n")
+        with sock.makefile("rb") as reader:
+            line = reader.readline()
+
+    if not line:
+        raise ConnectionError("Embedding service closed the connection")
+    reply = json.loads(line)
+    if "error" in reply:
+        raise RuntimeError(f"Embedding service error: {reply['error']}")
+    return reply
+
+
+# Model key reported by the embedding service; only successful lookups are kept
+_remote_key: Optional[str] = None
+
+# Service failures that fall back to the local model
+_SERVICE_ERRORS = (OSError, ValueError, RuntimeError)
+
+
+def _remote_model_key() -> Optional[str]:
+    """
+    Key of the model loaded by the embedding service, or None when it is
+    unreachable. A failed lookup is not remembered: the next call asks again.
+    """
+    global _remote_key
+    if _remote_key is None:
+        try:
+            _remote_key = _socket_call({"op": "info"}).get("model") or None
+        except _SERVICE_ERRORS as e:
+            print(f"[knowledge] Embedding service at {EMBED_SOCKET} unavailable: {e}")
+    return _remote_key
+
+
+def _service_failed(error: Exception) -> None:
+    global _remote_key
+    # Ask the service for its model again once it is back (it may have changed)
+    _remote_key = None
+    print(f"[knowledge] Embedding service call failed, using local model: {error}")
+
+
+def _embed_via_socket(texts: List[str], model_key: str) -> List[List[float]]:
+    reply = _socket_call({"op": "embed", "texts": texts})
+    served_by = reply.get("model", model_key)
+    if served_by != model_key:
+        raise ValueError(f"Embedding service switched model ({model_key} -> {served_by})")
+    count, dim = reply["count"], reply["dim"]
+    if count == 0:
+        return []
+    raw = base64.b64decode(reply["vectors_b64"])
+    matrix = np.frombuffer(raw, dtype="<f4").reshape(count, dim)
+    return matrix.astype(float).tolist()
+
+
+def _embed_locally(texts: List[str]) -> List[List[float]]:
+    vectors = get_embedder().encode(
+        texts,
+        normalize_embeddings=True,
+        show_progress_bar=False,
+    )
+    return [list(map(float, v)) for v in vectors]
+
+
+def get_local_model_key() -> str:
+    """
+    Key of the model this process loads itself (see get_embed_model_key()).
+    """
+    if EMBED_BACKEND == "torch":
+        return EMBED_MODEL_NAME
+    if EMBED_BACKEND == "onnx-int8":
+        return f"{EMBED_MODEL_NAME}@onnx-int8:{EMBED_ONNX_FILE}"
+    return f"{EMBED_MODEL_NAME}@{EMBED_BACKEND}"
+
+
+def get_embed_model_key() -> str:
+    """
+    Identity of the vectors embed_texts() would produce right now.
+
+    Quantized / ONNX backends produce slightly different vectors, so they get
+    their own cache namespace. The default torch backend keeps the bare model
+    name so existing caches stay valid. With a shared embedding service the
+    service reports the key for the model it actually loaded.
+
+    The service can go away between this call and the next embedding, so
+    code that stores vectors should use the key returned with them
+    (embed_texts_keyed(), embed_chunks()).
+    """
+    if EMBED_SOCKET:
+        remote_key = _remote_model_key()
+        if remote_key:
+            return remote_key
+    return get_local_model_key()
+
+
+def embed_texts_keyed(texts: Sequence[str]) -> Tuple[str, List[List[float]]]:
+    """
+    Embed texts and return (model_key, vectors), where model_key identifies
+    the model that actually produced the vectors.
+
+    Vectors are L2-normalized, matching Chroma's default embedding function,
+    so vectors computed here are comparable with ones Chroma produced earlier.
+    Uses the shared embedding service when KNOWLEDGE_EMBED_SOCKET is set and
+    degrades to an in-process model when the service fails.
+    """
+    texts = list(texts)
+    if EMBED_SOCKET:
+        remote_key = _remote_model_key()
+        if remote_key:
+            try:
+                return remote_key, _embed_via_socket(texts, remote_key) if texts else []
+            except _SERVICE_ERRORS as e:
+                _service_failed(e)
+    return get_local_model_key(), _embed_locally(texts) if texts else []
+
+
+def embed_texts(texts: Sequence[str]) -> List[List[float]]:
+    """
+    Embed texts with the shared model (see embed_texts_keyed()).
+    """
+    return embed_texts_keyed(texts)[1]
+
+
+def _embed_cached(
+    model_key: str,
+    unique: Dict[str, str],
+    embed: Callable[[List[str]], List[List[float]]],
+) -> Dict[str, List[float]]:
+    cache = get_embedding_cache(model_key)
+    vectors = cache.get_many(list(unique))
+    missing = [h for h in unique if h not in vectors]
+
+    if missing:
+        computed = dict(zip(missing, embed([unique[h] for h in missing])))
+        cache.put_many(computed)
+        vectors.update(computed)
+
+    return vectors
+
+
+def embed_chunks(
+    chunk_hashes: Sequence[str],
+    texts: Sequence[str],
+) -> Tuple[str, Dict[str, List[float]]]:
+    """
+    Return (model_key, {chunk_hash: vector}) for the given chunks, computing
+    only cache misses.
+
+    Identical chunks (same hash) are embedded once, even across files. Cache
+    hits and new vectors always come from the same model: if the embedding
+    service fails mid-way, the whole batch is redone against the local
+    model's cache namespace.
+    """
+    unique: Dict[str, str] = {}
+    for chash, text in zip(chunk_hashes, texts):
+        unique.setdefault(chash, text)
+
+    if EMBED_SOCKET:
+        remote_key = _remote_model_key()
+        if remote_key:
+            embed_remote = functools.partial(_embed_via_socket, model_key=remote_key)
+            try:
+                return remote_key, _embed_cached(remote_key, unique, embed_remote)
+            except _SERVICE_ERRORS as e:
+                _service_failed(e)
+
+    local_key = get_local_model_key()
+    return local_key, _embed_cached(local_key, unique, _embed_locally)
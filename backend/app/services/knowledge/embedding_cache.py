@@ -0,0 +1,248 @@
+# backend/app/services/knowledge/embedding_cache.py
+
+from __future__ import annotations
+
+import json
+import re
+import sqlite3
+import threading
+from contextlib import closing
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from .config import EMBEDDING_CACHE_DIR
+
+
+INDEX_VERSION = 2
+
+# Stay well below SQLite's host parameter limit for IN (...) lists
+_MAX_IN_PARAMS = 500
+
+
+def _slugify_model(model_key: str) -> str:
+    slug = re.sub(r"[^a-zA-Z0-9_.-]+", "_", model_key).strip("_")
+    return slug or "default"
+
+
+class EmbeddingCache:
+    """
+    Persistent embedding cache keyed by (model, chunk_hash).
+
+    Layout (one directory per model key):
+        vectors.f32   append-only float32 matrix, memory-mapped for reads
+        index.sqlite  meta (version, model, dim) and rows (chunk_hash -> row)
+
+    Vectors depend only on chunk text, so the cache is shared by every file:
+    renamed, copied or re-indexed files reuse vectors instead of re-embedding.
+
+    A write appends its vectors and inserts only their index rows, so its
+    cost does not grow with the cache. Writers in other worker processes are
+    serialized by the SQLite write lock (BEGIN IMMEDIATE). Index rows are
+    committed after their vectors are written, so a crash in between only
+    leaves unused vectors; rows past the end of a truncated file are ignored.
+    """
+
+    def __init__(self, root: Path, model_key: str):
+        self.model_key = model_key
+        self.dir = root / _slugify_model(model_key)
+        self.vectors_path = self.dir / "vectors.f32"
+        self.index_path = self.dir / "index.sqlite"
+        self.legacy_index_path = self.dir / "index.json"
+
+        self._lock = threading.Lock()
+        self._matrix: Optional[np.memmap] = None
+        self._matrix_dim: Optional[int] = None
+
+        self.hits = 0
+        self.misses = 0
+
+        self.dir.mkdir(parents=True, exist_ok=True)
+        self._init_index()
+
+    # ------------------------------------------------------------------
+    # Index handling
+    # ------------------------------------------------------------------
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.index_path, timeout=30.0, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    def _init_index(self) -> None:
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS rows (chunk_hash TEXT PRIMARY KEY, row INTEGER NOT NULL)"
+            )
+            meta = dict(conn.execute("SELECT key, value FROM meta").fetchall())
+            if meta.get("version") != str(INDEX_VERSION) or meta.get("model") != self.model_key:
+                # New or foreign index: start empty (a corrupt cache only costs re-embedding)
+                conn.execute("DELETE FROM rows")
+                conn.execute("DELETE FROM meta")
+                conn.executemany(
+                    "INSERT INTO meta (key, value) VALUES (?, ?)",
+                    [("version", str(INDEX_VERSION)), ("model", self.model_key)],
+                )
+                if not self._import_legacy_index(conn):
+                    self.vectors_path.unlink(missing_ok=True)
+            conn.execute("COMMIT")
+
+    def _import_legacy_index(self, conn: sqlite3.Connection) -> bool:
+        """
+        Keep the vectors of a version 1 cache (index.json rewritten on every
+        write) instead of re-embedding them. Returns True if rows were imported.
+        """
+        try:
+            data = json.loads(self.legacy_index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return False
+        self.legacy_index_path.unlink(missing_ok=True)
+
+        dim = data.get("dim")
+        if data.get("version") != 1 or data.get("model") != self.model_key:
+            return False
+        if not isinstance(dim, int) or dim <= 0:
+            return False
+        rows = [(h, r) for h, r in (data.get("rows") or {}).items() if isinstance(r, int)]
+        conn.execute("INSERT INTO meta (key, value) VALUES ('dim', ?)", (str(dim),))
+        conn.executemany("INSERT OR REPLACE INTO rows (chunk_hash, row) VALUES (?, ?)", rows)
+        return True
+
+    def _clear(self, conn: sqlite3.Connection) -> None:
+        conn.execute("DELETE FROM rows")
+        conn.execute("DELETE FROM meta WHERE key = 'dim'")
+        self.vectors_path.unlink(missing_ok=True)
+        self._matrix = None
+
+    @staticmethod
+    def _dim(conn: sqlite3.Connection) -> Optional[int]:
+        row = conn.execute("SELECT value FROM meta WHERE key = 'dim'").fetchone()
+        return int(row[0]) if row else None
+
+    def _get_matrix(self, dim: int) -> Optional[np.memmap]:
+        """
+        Memory-map vectors.f32, remapping when another writer appended rows.
+        """
+        rows = self.vectors_path.stat().st_size // (dim * 4) if self.vectors_path.exists() else 0
+        if rows == 0:
+            return None
+        if self._matrix is None or self._matrix_dim != dim or self._matrix.shape[0] != rows:
+            self._matrix = np.memmap(self.vectors_path, dtype=np.float32, mode="r", shape=(rows, dim))
+            self._matrix_dim = dim
+        return self._matrix
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def get_many(self, chunk_hashes: Sequence[str]) -> Dict[str, List[float]]:
+        """
+        Return cached vectors for the given hashes (missing hashes are omitted)
+        and update hit/miss counters.
+        """
+        hashes = list(dict.fromkeys(chunk_hashes))
+        found: Dict[str, List[float]] = {}
+
+        with self._lock, closing(self._connect()) as conn:
+            dim = self._dim(conn)
+            rows: Dict[str, int] = {}
+            if dim is not None:
+                for start in range(0, len(hashes), _MAX_IN_PARAMS):
+                    chunk = hashes[start:start + _MAX_IN_PARAMS]
+                    rows.update(
+                        conn.execute(
+                            f"SELECT chunk_hash, row FROM rows WHERE chunk_hash IN ({', '.join('?' for _ in chunk)})",
+                            chunk,
+                        ).fetchall()
+                    )
+
+            matrix = self._get_matrix(dim) if rows else None
+            if matrix is not None:
+                for chash, row in rows.items():
+                    if row < matrix.shape[0]:
+                        found[chash] = matrix[row].tolist()
+
+            self.hits += len(found)
+            self.misses += len(chunk_hashes) - len(found)
+            return found
+
+    def put_many(self, vectors: Dict[str, Sequence[float]]) -> None:
+        """
+        Append new vectors. Hashes that are already cached are skipped.
+        """
+        if not vectors:
+            return
+
+        with self._lock, closing(self._connect()) as conn:
+            # Serializes writers across processes until COMMIT
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                hashes = list(vectors)
+                known = set()
+                for start in range(0, len(hashes), _MAX_IN_PARAMS):
+                    chunk = hashes[start:start + _MAX_IN_PARAMS]
+                    known.update(
+                        r[0]
+                        for r in conn.execute(
+                            f"SELECT chunk_hash FROM rows WHERE chunk_hash IN ({', '.join('?' for _ in chunk)})",
+                            chunk,
+                        )
+                    )
+
+                new_items = [(h, v) for h, v in vectors.items() if h not in known]
+                if not new_items:
+                    conn.execute("COMMIT")
+                    return
+
+                matrix = np.asarray([v for _, v in new_items], dtype=np.float32)
+                dim = int(matrix.shape[1])
+                previous_dim = self._dim(conn)
+                if previous_dim is not None and dim != previous_dim:
+                    # Model output changed under the same key; start over.
+                    self._clear(conn)
+                conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('dim', ?)", (str(dim),))
+
+                start = (
+                    self.vectors_path.stat().st_size // (dim * 4)
+                    if self.vectors_path.exists()
+                    else 0
+                )
+                with self.vectors_path.open("ab") as f:
+                    # Drop a partial row left by a crashed write
+                    f.truncate(start * dim * 4)
+                    f.write(matrix.tobytes())
+
+                conn.executemany(
+                    "INSERT OR REPLACE INTO rows (chunk_hash, row) VALUES (?, ?)",
+                    [(chash, start + offset) for offset, (chash, _) in enumerate(new_items)],
+                )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+
+    def stats(self) -> Dict[str, Any]:
+        with closing(self._connect()) as conn:
+            entries = conn.execute("SELECT COUNT(*) FROM rows").fetchone()[0]
+            dim = self._dim(conn)
+        lookups = self.hits + self.misses
+        return {
+            "model": self.model_key,
+            "entries": entries,
+            "dim": dim,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+        }
+
+
+@lru_cache(maxsize=4)
+def get_embedding_cache(model_key: str) -> EmbeddingCache:
+    """
+    Return the process-wide cache instance for a model key.
+    """
+    return EmbeddingCache(EMBEDDING_CACHE_DIR, model_key)
@@ -1,70 +1,16 @@
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 import hashlib
-import os
-import re
 
 from pypdf import PdfReader
 
 from .config import KNOWLEDGE_DIR
-from .client import get_collection
-from .embedder import get_embedder
+from .chunking import CHUNKERS, get_chunker_name_for_path
+from .client import get_collection, reset_collection
+from .embedder import embed_chunks, get_embed_model_key
 from .manifest import load_manifest, save_manifest, get_doc_entry, set_doc_entry
 
 
-def _chunk_text(text: str, max_chars: int = 800, overlap: int = 200) -> List[str]:
-    """
-    Chunk text into overlapping windows of ~max_chars, trying to cut on sentence boundaries.
-
-    - First split into sentences using a lightweight regex.
-    - Then pack sentences into windows with overlap between chunks.
-    """
-    # Normalize line breaks a bit first
-    normalized = text.replace("\r\n", "\n").replace("\r", "\n")
-
-    # Very simple sentence segmentation: split on punctuation + space/newline
-    # This is intentionally light to avoid extra dependencies.
-    raw_sentences = re.split(r"(?<=[\.!?])\s+", normalized)
-    sentences = [s.strip() for s in raw_sentences if s.strip()]
-
-    if not sentences:
-        return [normalized[:max_chars]]
-
-    chunks: List[str] = []
-    current: List[str] = []
-    current_len = 0
-
-    for sent in sentences:
-        sent_len = len(sent)
-        if current and current_len + sent_len + 1 > max_chars:
-            # finalize current chunk
-            chunk_text = " ".join(current).strip()
-            if chunk_text:
-                chunks.append(chunk_text)
-
-            # start new chunk with overlap from the end of previous
-            if overlap > 0 and chunks:
-                # take last chunk and keep the last 'overlap' characters worth of sentences
-                last_chunk = chunks[-1]
-                # crude overlap: take tail substring
-                tail = last_chunk[-overlap:]
-                current = [tail, sent]
-                current_len = len(tail) + 1 + sent_len
-            else:
-                current = [sent]
-                current_len = sent_len
-        else:
-            current.append(sent)
-            current_len += sent_len + (1 if current_len > 0 else 0)
-
-    if current:
-        chunk_text = " ".join(current).strip()
-        if chunk_text:
-            chunks.append(chunk_text)
-
-    return chunks or [normalized[:max_chars]]
-
-
 def _extract_text_from_file(path: Path) -> Optional[str]:
     suffix = path.suffix.lower()
 
@@ -110,41 +56,67 @@ def _make_chunk_id(path: Path, chunk_hash: str) -> str:
 
     This ensures:
     - unchanged chunks keep the same id across re-indexes
-    - moved files will generate a different id (because path is part of the id)
+    - moved files will generate a different id (because path is part of the id);
+      their vectors are still reused through the embedding cache
     """
     base = f"{path}:{chunk_hash}"
     return hashlib.sha1(base.encode("utf-8", errors="ignore")).hexdigest()
 
 
-def _index_path(path: Path) -> None:
+def _empty_stats() -> Dict[str, int]:
+    return {"files": 0, "chunks": 0, "embedded": 0}
+
+
+class _EmbedModelChanged(Exception):
+    """
+    The embedding path no longer matches the model the collection was built
+    with (e.g. the embedding service went away or came back).
+    """
+
+
+def _index_path(path: Path) -> Dict[str, int]:
     """
     Index a single file at 'path' into Chroma with incremental updates.
 
     Behavior:
-    - If the file hasn't changed (hash + chunk hashes), do nothing.
+    - If the file hasn't changed (hash + chunk hashes + embedding model),
+      do nothing.
     - If some chunks changed:
         * new/changed chunks are upserted
         * removed chunks are deleted by id
+    - If the file's vectors came from another embedding model, every chunk
+      is re-embedded (vectors come from the embedding cache where possible).
     - Manifest is updated to reflect the latest state.
+
+    Raises _EmbedModelChanged instead of writing vectors of a model other
+    than the collection's (manifest "embed_model", see _check_embed_model).
+
+    Returns counters for this file: {"files", "chunks", "embedded"} where
+    "embedded" is the number of chunks that had to be (re-)upserted.
     """
+    stats = _empty_stats()
+
     collection = get_collection()
-    _ = get_embedder()  # ensure model is loaded
 
     if not path.is_file():
-        return
+        return stats
 
     if path.suffix.lower() not in {".txt", ".md", ".pdf"}:
-        return
+        return stats
 
     text = _extract_text_from_file(path)
     if not text:
-        return
+        return stats
 
     title = path.stem
-    chunks = _chunk_text(text)
+    chunker = get_chunker_name_for_path(path)
+    chunks = CHUNKERS[chunker](text)
 
     if not chunks:
-        return
+        return stats
+
+    stats["files"] = 1
+    stats["chunks"] = len(chunks)
 
     # Load manifest + previous entry
     manifest = load_manifest()
@@ -153,6 +125,12 @@ def _index_path(path: Path) -> None:
     file_hash = _compute_file_hash(path)
     mtime = path.stat().st_mtime
 
+    # Existing vectors are only reusable if the same model produced them
+    model_key = get_embed_model_key()
+    if model_key != manifest.get("embed_model"):
+        raise _EmbedModelChanged(model_key)
+    same_model = bool(prev_entry) and prev_entry.get("embed_model") == model_key
+
     # Compute hashes for current chunks
     new_chunks: List[Dict[str, Any]] = []
     new_chunk_hashes: List[str] = []
@@ -167,8 +145,8 @@ def _index_path(path: Path) -> None:
             }
         )
 
-    # Fast-path: nothing changed (file hash + chunk hashes identical)
-    if prev_entry:
+    # Fast-path: nothing changed (file hash + chunk hashes + model identical)
+    if same_model:
         prev_file_hash = prev_entry.get("file_hash")
         prev_chunks = prev_entry.get("chunks", [])
         prev_chunk_hashes = [c.get("chunk_hash") for c in prev_chunks]
@@ -179,7 +157,7 @@ def _index_path(path: Path) -> None:
             and all(a == b for a, b in zip(prev_chunk_hashes, new_chunk_hashes))
         ):
             # No content-level change; keep existing vectors
-            return
+            return stats
 
     # Build maps for reuse
     old_chunks_by_hash: Dict[str, Dict[str, Any]] = {}
@@ -190,14 +168,18 @@ def _index_path(path: Path) -> None:
             chash = c.get("chunk_hash")
             cid = c.get("chunk_id")
             if chash and cid:
-                old_chunks_by_hash[chash] = c
+                if same_model:
+                    old_chunks_by_hash[chash] = c
                 old_ids.add(cid)
 
     # Decide IDs and which chunks need upsert
     upsert_ids: List[str] = []
     upsert_docs: List[str] = []
+    upsert_hashes: List[str] = []
     upsert_metadatas: List[Dict[str, Any]] = []
     new_manifest_chunks: List[Dict[str, Any]] = []
+    moved_ids: List[str] = []
+    moved_metadatas: List[Dict[str, Any]] = []
 
     for chunk_meta, chunk_text in zip(new_chunks, chunks):
         chash = chunk_meta["chunk_hash"]
@@ -207,6 +189,16 @@ def _index_path(path: Path) -> None:
             # Unchanged chunk; reuse id
             cid = old["chunk_id"]
             chunk_meta["chunk_id"] = cid
+            if old.get("index") != chunk_meta["index"]:
+                # Same text at a new position; only the metadata needs refreshing
+                moved_ids.append(cid)
+                moved_metadatas.append(
+                    {
+                        "title": title,
+                        "path": str(path),
+                        "chunk_index": chunk_meta["index"],
+                    }
+                )
             new_manifest_chunks.append(
                 {
                     "index": chunk_meta["index"],
@@ -227,6 +219,7 @@ def _index_path(path: Path) -> None:
             )
             upsert_ids.append(cid)
             upsert_docs.append(chunk_text)
+            upsert_hashes.append(chash)
             upsert_metadatas.append(
                 {
                     "title": title,
@@ -235,6 +228,15 @@ def _index_path(path: Path) -> None:
                 }
             )
 
+    vectors: Dict[str, List[float]] = {}
+    if upsert_ids:
+        # Vectors come from the (model, chunk_hash) cache where possible, so
+        # renamed/copied files and repeated boilerplate are not re-embedded.
+        embedded_by, vectors = embed_chunks(upsert_hashes, upsert_docs)
+        if embedded_by != model_key:
+            # The embedding path changed since model_key was read
+            raise _EmbedModelChanged(embedded_by)
+
     # Determine which old ids should be removed (chunks that no longer exist)
     new_ids_set = {c["chunk_id"] for c in new_manifest_chunks}
     to_delete_ids = list(old_ids - new_ids_set) if old_ids else []
@@ -243,11 +245,16 @@ def _index_path(path: Path) -> None:
         # Remove only truly obsolete chunks for this file
         collection.delete(ids=to_delete_ids)
 
+    if moved_ids:
+        # Keep chunk_index accurate so neighbor context windows stay correct
+        collection.update(ids=moved_ids, metadatas=moved_metadatas)
+
     if upsert_ids:
         collection.upsert(
             ids=upsert_ids,
             metadatas=upsert_metadatas,
             documents=upsert_docs,
+            embeddings=[vectors[h] for h in upsert_hashes],
         )
 
     # Update manifest entry
@@ -258,28 +265,90 @@ def _index_path(path: Path) -> None:
         file_hash=file_hash,
         mtime=mtime,
         chunks=new_manifest_chunks,
+        chunker=chunker,
+        embed_model=model_key,
     )
     save_manifest(manifest)
 
+    stats["embedded"] = len(upsert_ids)
+    return stats
+
 
-def index_files_in_knowledgebase() -> None:
+def _check_embed_model() -> bool:
     """
-    Scan knowledgebase/ for supported files and index them in Chroma.
-    Uses incremental behavior via the manifest, so re-running this is cheap.
+    Make the collection match the current embedding model. If it was built
+    with another model, drop it and forget every document (they are
+    re-embedded on the next pass). Returns True if the collection was reset.
     """
-    KNOWLEDGE_DIR.mkdir(parents=True, exist_ok=True)
+    model_key = get_embed_model_key()
+    manifest = load_manifest()
+    if manifest.get("embed_model") == model_key:
+        return False
+
+    reset = bool(manifest.get("documents"))
+    if reset:
+        previous = manifest.get("embed_model") or "unknown"
+        print(
+            f"[knowledge] Embedding model changed ({previous} -> {model_key}); "
+            "rebuilding the vector collection"
+        )
+        reset_collection()
+        manifest["documents"] = {}
+    manifest["embed_model"] = model_key
+    save_manifest(manifest)
+    return reset
+
 
+def _index_all() -> Dict[str, int]:
+    totals = _empty_stats()
     for path in KNOWLEDGE_DIR.rglob("*"):
         if not path.is_file():
             continue
-        _index_path(path)
+        file_stats = _index_path(path)
+        for key, value in file_stats.items():
+            totals[key] += value
+    return totals
+
+
+def index_files_in_knowledgebase() -> Dict[str, int]:
+    """
+    Scan knowledgebase/ for supported files and index them in Chroma.
+    Uses incremental behavior via the manifest, so re-running this is cheap.
+
+    Returns aggregate counters; embedded / chunks is the re-embedding ratio
+    of this pass (0.0 when nothing changed).
+
+    If the embedding model changed since the last pass, the collection is
+    rebuilt first: vectors of different models (and dimensions) cannot be
+    mixed, and queries are embedded with the current model. A change during
+    the pass (the embedding service went away or came back) restarts it once.
+    """
+    KNOWLEDGE_DIR.mkdir(parents=True, exist_ok=True)
+    _check_embed_model()
+    try:
+        return _index_all()
+    except _EmbedModelChanged as e:
+        print(f"[knowledge] Embedding model changed to {e} while indexing; starting over")
+
+    _check_embed_model()
+    try:
+        return _index_all()
+    except _EmbedModelChanged as e:
+        raise RuntimeError(f"Embedding model keeps changing while indexing (now {e})") from None
 
 
-def index_single_file(path: Path) -> None:
+def index_single_file(path: Path) -> Dict[str, int]:
     """
     Index a single newly uploaded or updated file.
 
     Uses the same incremental behavior as index_files_in_knowledgebase().
+    If the embedding model changed, the rebuilt collection needs every file,
+    so this runs a full pass (which includes `path`) and returns its counters.
     """
     KNOWLEDGE_DIR.mkdir(parents=True, exist_ok=True)
-    _index_path(path)
+    if not _check_embed_model():
+        try:
+            return _index_path(path)
+        except _EmbedModelChanged as e:
+            print(f"[knowledge] Embedding model changed to {e} while indexing {path.name}")
+    return index_files_in_knowledgebase()
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from .config import KNOWLEDGE_DIR
 
@@ -64,11 +64,16 @@ def set_doc_entry(
     file_hash: str,
     mtime: float,
     chunks: List[Dict[str, Any]],
+    chunker: str = "window",
+    embed_model: Optional[str] = None,
 ) -> None:
     docs = manifest.setdefault("documents", {})
     docs[str(path)] = {
         "title": title,
         "file_hash": file_hash,
         "mtime": mtime,
+        "chunker": chunker,
+        # Model key of the vectors stored for this file (see embedder.get_embed_model_key)
+        "embed_model": embed_model,
         "chunks": chunks,
     }
@@ -1,6 +1,7 @@
 from typing import List, Dict, Any, Tuple, Optional
 
 from .client import get_collection
+from .embedder import embed_texts
 from .paths import classify_doc_path
 from app.schemas.knowledge import KnowledgeSourceChunk
 
@@ -98,9 +99,10 @@ def query_knowledge(query: str, top_k: int = 4) -> List[KnowledgeSourceChunk]:
     """
     collection = get_collection()
 
-    # First: seed query for top_k hits
+    # First: seed query for top_k hits. Embed with the same model the
+    # indexer used rather than Chroma's built-in embedding function.
     results = collection.query(
-        query_texts=[query],
+        query_embeddings=embed_texts([query]),
         n_results=top_k,
     )
 
@@ -0,0 +1,232 @@
+# backend/app/services/llm_cache_store.py
+"""
+Disk-backed LLM response cache (SQLite table `llm_cache`).
+
+Some prompts are deterministic enough to answer once: summaries of past
+dates (their standups no longer change) and reviews of an identical diff.
+cached_llm_chat() looks those up by an exact key before calling the LLM:
+the same payload hash the in-memory coalescer uses, or a hash of the settled
+inputs when the prompt also includes live data. Entries survive restarts.
+Once LLM_CACHE_MAX_ENTRIES is exceeded, the least recently used rows are
+evicted.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from app.core.config import settings
+from app.core.llm_client import llm_chat
+from app.core.llm_coalescer import is_llm_error_reply, make_llm_request_key
+from app.db import get_connection
+from app.db_async import run_db
+from app.schemas.llm_cache import LLMCacheEntry, LLMCacheStats
+
+_PREVIEW_CHARS = 200
+
+
+def _prompt_text(messages: List[Dict[str, Any]]) -> str:
+    return "\n\n".join(f"{m.get('role', '')}: {m.get('content', '')}" for m in messages)
+
+
+def _row_to_entry(row) -> LLMCacheEntry:
+    return LLMCacheEntry(
+        cache_key=row["cache_key"],
+        namespace=row["namespace"],
+        model=row["model"],
+        prompt_preview=row["prompt_text"][:_PREVIEW_CHARS],
+        response_preview=row["response"][:_PREVIEW_CHARS],
+        hit_count=row["hit_count"],
+        created_at=datetime.fromisoformat(row["created_at"]),
+        last_used_at=datetime.fromisoformat(row["last_used_at"]),
+    )
+
+
+def _touch(cur, cache_key: str) -> None:
+    cur.execute(
+        """
+        UPDATE llm_cache
+        SET hit_count = hit_count + 1, last_used_at = ?
+        WHERE cache_key = ?
+        """,
+        (datetime.now().isoformat(), cache_key),
+    )
+
+
+def get_cached_response(cache_key: str) -> Optional[str]:
+    """
+    Exact-match lookup. Refreshes the entry's LRU position on a hit.
+    """
+    conn = get_connection()
+    cur = conn.cursor()
+    cur.execute("SELECT response FROM llm_cache WHERE cache_key = ?", (cache_key,))
+    row = cur.fetchone()
+    if row is not None:
+        _touch(cur, cache_key)
+        conn.commit()
+    conn.close()
+    return row["response"] if row is not None else None
+
+
+async def get_cached_response_async(cache_key: str) -> Optional[str]:
+    """
+    get_cached_response() for async code (runs on the DB thread pool).
+    """
+    return await run_db(get_cached_response, cache_key)
+
+
+def put_cached_response(
+    cache_key: str,
+    namespace: str,
+    model: str,
+    prompt_text: str,
+    response: str,
+) -> None:
+    """
+    Insert or replace an entry, then evict least recently used rows beyond
+    LLM_CACHE_MAX_ENTRIES.
+    """
+    now = datetime.now().isoformat()
+
+    conn = get_connection()
+    cur = conn.cursor()
+    cur.execute(
+        """
+        INSERT OR REPLACE INTO llm_cache (
+            cache_key, namespace, model, prompt_text, response,
+            hit_count, created_at, last_used_at
+        )
+        VALUES (?, ?, ?, ?, ?, 0, ?, ?)
+        """,
+        (cache_key, namespace, model, prompt_text, response, now, now),
+    )
+    cur.execute(
+        """
+        DELETE FROM llm_cache
+        WHERE cache_key IN (
+            SELECT cache_key FROM llm_cache
+            ORDER BY last_used_at DESC
+            LIMIT -1 OFFSET ?
+        )
+        """,
+        (settings.LLM_CACHE_MAX_ENTRIES,),
+    )
+    conn.commit()
+    conn.close()
+
+
+async def put_cached_response_async(
+    cache_key: str,
+    namespace: str,
+    model: str,
+    prompt_text: str,
+    response: str,
+) -> None:
+    """
+    put_cached_response() for async code (runs on the DB thread pool).
+    """
+    await run_db(put_cached_response, cache_key, namespace, model, prompt_text, response)
+
+
+def list_cache_entries(namespace: Optional[str] = None, limit: int = 50) -> List[LLMCacheEntry]:
+    conn = get_connection()
+    cur = conn.cursor()
+    if namespace:
+        cur.execute(
+            "SELECT * FROM llm_cache WHERE namespace = ? ORDER BY last_used_at DESC LIMIT ?",
+            (namespace, limit),
+        )
+    else:
+        cur.execute("SELECT * FROM llm_cache ORDER BY last_used_at DESC LIMIT ?", (limit,))
+    rows = cur.fetchall()
+    conn.close()
+    return [_row_to_entry(r) for r in rows]
+
+
+def get_cache_stats() -> LLMCacheStats:
+    conn = get_connection()
+    cur = conn.cursor()
+    cur.execute(
+        """
+        SELECT namespace, COUNT(*) AS entries, COALESCE(SUM(hit_count), 0) AS hits
+        FROM llm_cache
+        GROUP BY namespace
+        """
+    )
+    rows = cur.fetchall()
+    conn.close()
+
+    return LLMCacheStats(
+        enabled=settings.LLM_CACHE_ENABLED,
+        entries=sum(r["entries"] for r in rows),
+        max_entries=settings.LLM_CACHE_MAX_ENTRIES,
+        total_hits=sum(r["hits"] for r in rows),
+        by_namespace={r["namespace"]: r["entries"] for r in rows},
+    )
+
+
+def purge_cache(namespace: Optional[str] = None) -> int:
+    """
+    Delete all entries (or one namespace). Returns the number of rows removed.
+    """
+    conn = get_connection()
+    cur = conn.cursor()
+    if namespace:
+        cur.execute("DELETE FROM llm_cache WHERE namespace = ?", (namespace,))
+    else:
+        cur.execute("DELETE FROM llm_cache")
+    deleted = cur.rowcount
+    conn.commit()
+    conn.close()
+    return deleted
+
+
+def delete_cache_entry(cache_key: str) -> bool:
+    conn = get_connection()
+    cur = conn.cursor()
+    cur.execute("DELETE FROM llm_cache WHERE cache_key = ?", (cache_key,))
+    deleted = cur.rowcount > 0
+    conn.commit()
+    conn.close()
+    return deleted
+
+
+async def cached_llm_chat(
+    messages: List[Dict[str, Any]],
+    *,
+    namespace: str,
+    model: Optional[str] = None,
+    key: Optional[Dict[str, Any]] = None,
+    **llm_kwargs: Any,
+) -> str:
+    """
+    llm_chat() behind the persistent cache.
+
+    - Exact hit: return the stored reply without calling the LLM.
+    - Miss: call llm_chat(messages, model, **llm_kwargs) and store the reply
+      unless it is an LLM error string.
+
+    The entry is keyed on the full request unless `key` is given: then it is
+    keyed on (model, namespace, key) alone. Use that when the prompt also
+    carries live context that should not invalidate the entry.
+    """
+    if not settings.LLM_CACHE_ENABLED:
+        return await llm_chat(messages, model, **llm_kwargs)
+
+    model_name = model or settings.LLM_DEFAULT_MODEL
+    if key is None:
+        cache_key = make_llm_request_key({"model": model_name, "messages": messages})
+    else:
+        cache_key = make_llm_request_key({"model": model_name, "namespace": namespace, "key": key})
+
+    cached = await get_cached_response_async(cache_key)
+    if cached is not None:
+        return cached
+
+    reply = await llm_chat(messages, model, **llm_kwargs)
+
+    if reply and not is_llm_error_reply(reply):
+        await put_cached_response_async(cache_key, namespace, model_name, _prompt_text(messages), reply)
+
+    return reply
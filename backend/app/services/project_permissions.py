@@ -1,135 +1,208 @@
 # backend/app/services/project_permissions.py
 
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
-from fastapi import HTTPException, status
+from fastapi import Depends, HTTPException, status
 
+from app.schemas.project import Project, ProjectRole
+from app.schemas.task import TaskEntry
 from app.schemas.user import UserPublic
-from app.services.projects import get_project_by_id
-from app.services.projects.members import get_user_role_for_project
-
-
-def _ensure_project_exists(project_id: int):
-    """
-    Load a project by id or raise 404.
-    """
-    project = get_project_by_id(project_id)
-    if project is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Project not found",
-        )
-    return project
+from app.services.auth_service import get_current_user
+from app.services.projects import get_project_by_id, list_projects
+from app.services.projects.members import list_project_access_for_user
 
 
 def _is_admin(user: UserPublic) -> bool:
     return getattr(user, "role", None) == "admin"
 
 
-def _get_membership_role(project_id: int, username: str) -> Optional[str]:
-    return get_user_role_for_project(project_id, username)
+class ProjectAccess:
+    """
+    Request-scoped authorization context for project permissions.
 
+    On first use it loads, in one query, every project the user owns or is a
+    member of. Later checks are answered from memory. Project existence for
+    404-vs-403 is also memoized, so repeated checks on the same project (list
+    and bulk endpoints) cost nothing.
 
-def require_project_view(project_id: int, user: UserPublic):
+    Inject it with Depends(get_project_access). Data is read once per request,
+    so do permission checks before changing memberships.
     """
-    Ensure that the given user is allowed to *view* the project.
 
-    Allowed if:
-    - user is admin, OR
-    - user is the canonical project.owner, OR
-    - user has any membership (owner/member/viewer) for this project.
-    """
-    project = _ensure_project_exists(project_id)
+    def __init__(self, user: UserPublic):
+        self.user = user
+        self.is_admin = _is_admin(user)
+        # project_id -> (is canonical project.owner, membership role)
+        self._access: Optional[Dict[int, Tuple[bool, Optional[ProjectRole]]]] = None
+        self._projects: Dict[int, Optional[Project]] = {}
+
+    def _load(self) -> Dict[int, Tuple[bool, Optional[ProjectRole]]]:
+        if self._access is None:
+            self._access = {}
+            for project, owns, role in list_project_access_for_user(self.user.username):
+                self._projects[project.id] = project
+                self._access[project.id] = (owns, role)
+        return self._access
+
+    def get_project(self, project_id: int) -> Project:
+        """
+        Load a project by id (memoized) or raise 404.
+        """
+        if not self.is_admin:
+            self._load()
+        if project_id not in self._projects:
+            self._projects[project_id] = get_project_by_id(project_id)
+
+        project = self._projects[project_id]
+        if project is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Project not found",
+            )
+        return project
 
-    if _is_admin(user):
+    # ------------------------------------------------------------------
+    # Predicates (no existence check)
+    # ------------------------------------------------------------------
+
+    def role(self, project_id: int) -> Optional[ProjectRole]:
+        return self._load().get(project_id, (False, None))[1]
+
+    def is_project_owner(self, project_id: int) -> bool:
+        return self.is_admin or self._load().get(project_id, (False, None))[0]
+
+    def viewable_project_ids(self) -> List[int]:
+        """
+        Projects the user owns or is a member of; every project for admins.
+        """
+        if self.is_admin:
+            for project in list_projects():
+                self._projects[project.id] = project
+            return sorted(pid for pid, project in self._projects.items() if project is not None)
+        return sorted(self._load())
+
+    def can_view(self, project_id: int) -> bool:
+        # Canonical owner or any membership row
+        return self.is_admin or project_id in self._load()
+
+    def can_edit(self, project_id: int) -> bool:
+        if self.is_admin:
+            return True
+        owns, role = self._load().get(project_id, (False, None))
+        # NOTE: 'viewer' is not sufficient for edits.
+        return owns or role in ("owner", "member")
+
+    def can_edit_task(self, task: TaskEntry) -> bool:
+        """
+        Project tasks need project edit rights; personal tasks need the
+        task owner or an admin.
+        """
+        if task.project_id is not None:
+            return self.can_edit(task.project_id)
+        return self.is_admin or task.owner == self.user.username
+
+    # ------------------------------------------------------------------
+    # Route guards: 404 if the project does not exist, 403 if not allowed
+    # ------------------------------------------------------------------
+
+    def require_view(self, project_id: int) -> Project:
+        """
+        Allowed if:
+        - user is admin, OR
+        - user is the canonical project.owner, OR
+        - user has any membership (owner/member/viewer) for this project.
+        """
+        project = self.get_project(project_id)
+        if not self.can_view(project_id):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Not allowed to view this project",
+            )
         return project
 
-    if user.username == getattr(project, "owner", None):
+    def require_membership(self, project_id: int) -> Project:
+        """
+        Allowed if:
+        - user is admin, OR
+        - user is the canonical project.owner, OR
+        - user has any membership row for this project.
+        """
+        project = self.get_project(project_id)
+        if not self.can_view(project_id):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Not a member of this project",
+            )
         return project
 
-    role = _get_membership_role(project_id, user.username)
-    if role is None:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not allowed to view this project",
-        )
+    def require_edit(self, project_id: int) -> Project:
+        """
+        Allowed if:
+        - user is admin, OR
+        - user is the canonical project.owner, OR
+        - user has role in ('owner', 'member') on this project.
+        """
+        project = self.get_project(project_id)
+        if not self.can_edit(project_id):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Not allowed to modify project-scoped content",
+            )
+        return project
 
-    return project
+    def require_owner(self, project_id: int) -> Project:
+        """
+        Allowed if:
+        - user is admin, OR
+        - user.username == project.owner
+        """
+        project = self.get_project(project_id)
+        if not self.is_project_owner(project_id):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Not allowed to manage this project; owner or admin required",
+            )
+        return project
 
 
-def require_project_membership(project_id: int, user: UserPublic):
+def get_project_access(
+    current_user: UserPublic = Depends(get_current_user),
+) -> ProjectAccess:
     """
-    Ensure that the user is at least a member of the project (any role).
-
-    Allowed if:
-    - user is admin, OR
-    - user is the canonical project.owner, OR
-    - user has any membership row for this project.
+    FastAPI dependency: one ProjectAccess per request (FastAPI caches
+    dependencies within a request, so every Depends() shares it).
     """
-    project = _ensure_project_exists(project_id)
-
-    if _is_admin(user):
-        return project
-
-    if user.username == getattr(project, "owner", None):
-        return project
+    return ProjectAccess(current_user)
 
-    role = _get_membership_role(project_id, user.username)
-    if role is None:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not a member of this project",
-        )
 
-    return project
+# ----------------------------------------------------------------------
+# One-off helpers for code outside a request-scoped context
+# ----------------------------------------------------------------------
 
 
-def require_project_edit(project_id: int, user: UserPublic):
+def require_project_view(project_id: int, user: UserPublic):
     """
-    Ensure that the user can *modify* project-scoped content (e.g., tasks).
-
-    Allowed if:
-    - user is admin, OR
-    - user is the canonical project.owner, OR
-    - user has role in ('owner', 'member') on this project.
-
-    NOTE: 'viewer' is not sufficient for edits.
+    Ensure that the given user is allowed to *view* the project.
     """
-    project = _ensure_project_exists(project_id)
+    return ProjectAccess(user).require_view(project_id)
 
-    if _is_admin(user):
-        return project
 
-    if user.username == getattr(project, "owner", None):
-        return project
+def require_project_membership(project_id: int, user: UserPublic):
+    """
+    Ensure that the user is at least a member of the project (any role).
+    """
+    return ProjectAccess(user).require_membership(project_id)
 
-    role = _get_membership_role(project_id, user.username)
-    if role not in ("owner", "member"):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not allowed to modify project-scoped content",
-        )
 
-    return project
+def require_project_edit(project_id: int, user: UserPublic):
+    """
+    Ensure that the user can *modify* project-scoped content (e.g., tasks).
+    """
+    return ProjectAccess(user).require_edit(project_id)
 
 
 def require_project_owner(project_id: int, user: UserPublic):
     """
     Ensure that the user is the effective project owner.
-
-    Allowed if:
-    - user is admin, OR
-    - user.username == project.owner
     """
-    project = _ensure_project_exists(project_id)
-
-    if _is_admin(user):
-        return project
-
-    if user.username != getattr(project, "owner", None):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not allowed to manage this project; owner or admin required",
-        )
-
-    return project
+    return ProjectAccess(user).require_owner(project_id)
@@ -1,25 +1,38 @@
-from typing import Tuple
+from datetime import date as date_cls
+from typing import Dict, List, Optional, Tuple
 
-from app.services.projects import get_project_by_id
-from app.services.standup_store import get_today_standups_for_project
+from app.schemas.standup import StandupEntry
+from app.schemas.task import TaskEntry
+from app.services.projects import get_project_by_id_async
+from app.services.standup_store import get_today_standups_for_project_async
+from app.services.task_store import list_tasks_for_owners_async
+from app.core.config import settings
 from app.core.llm_client import llm_chat
+from app.services.llm_cache_store import cached_llm_chat
 
 
-async def summarize_project_today(project_id: int) -> Tuple[str, int, str]:
-    """
-    Summarize today's standups for a single project.
-    Returns (summary_text, count_of_entries, project_name).
-    """
-    project = get_project_by_id(project_id)
-    if project is None:
-        return "Project not found.", 0, ""
-
-    entries = get_today_standups_for_project(project_id)
-    project_name = project.name
+PROJECT_SUMMARY_SYSTEM_PROMPT = (
+    "You are summarizing work on a single software project based on daily standups.\n"
+    "Write a concise summary focused on this project only.\n"
+    "Include:\n"
+    "- Overall status\n"
+    "- Notable progress\n"
+    "- Blockers or risks\n"
+    "Keep it brief and practical."
+)
 
-    if not entries:
-        return f"No standups submitted today for project '{project_name}'.", 0, project_name
 
+def build_project_summary_messages(
+    project_name: str,
+    entries: List[StandupEntry],
+    target_date: date_cls,
+    tasks_by_owner: Optional[Dict[str, List[TaskEntry]]] = None,
+    project_id: Optional[int] = None,
+) -> List[dict]:
+    """
+    Prompt for one project's standups on one date, plus the authors' active
+    tasks on this project when tasks_by_owner is given.
+    """
     lines = []
     for s in entries:
         lines.append(f"Name: {s.name}")
@@ -30,25 +43,87 @@ async def summarize_project_today(project_id: int) -> Tuple[str, int, str]:
             lines.append(f"  Blockers: {s.blockers}")
         lines.append("")
 
+    task_lines = []
+    for owner in sorted({s.name for s in entries if s.name}):
+        for t in (tasks_by_owner or {}).get(owner, []):
+            if t.project_id == project_id:
+                task_lines.append(f"- {owner}: [{t.status}][{t.progress}%] {t.title}")
+    if task_lines:
+        lines.append("Active tasks on this project:")
+        lines.extend(task_lines)
+        lines.append("")
+
     text = "\n".join(lines)
 
-    system_prompt = (
-        "You are summarizing work on a single software project based on daily standups.\n"
-        "Write a concise summary focused on this project only.\n"
-        "Include:\n"
-        "- Overall status\n"
-        "- Notable progress\n"
-        "- Blockers or risks\n"
-        "Keep it brief and practical."
-    )
+    if target_date == date_cls.today():
+        heading = "Here are today's standups"
+    else:
+        heading = f"Here are the standups for {target_date.isoformat()}"
 
-    messages = [
-        {"role": "system", "content": system_prompt},
+    return [
+        {"role": "system", "content": PROJECT_SUMMARY_SYSTEM_PROMPT},
         {
             "role": "user",
-            "content": f"Project: {project_name}\n\nHere are today's standups:\n\n{text}",
+            "content": f"Project: {project_name}\n\n{heading}:\n\n{text}",
         },
     ]
 
-    summary = await llm_chat(messages)
+
+async def complete_project_summary(
+    messages: List[dict],
+    target_date: date_cls,
+    project_id: int,
+    project_name: str,
+    entries: List[StandupEntry],
+) -> str:
+    if target_date < date_cls.today():
+        # Past dates are settled: key on the project, date and its standups,
+        # not on the live task list in the prompt.
+        return await cached_llm_chat(
+            messages,
+            namespace="project_summary",
+            key={
+                "system": PROJECT_SUMMARY_SYSTEM_PROMPT,
+                "project": [project_id, project_name],
+                "date": target_date.isoformat(),
+                "standups": [[s.id, s.name, s.yesterday, s.today, s.blockers] for s in entries],
+            },
+            coalesce=True,
+            endpoint="project_summary",
+            priority="background",
+        )
+    return await llm_chat(
+        messages,
+        coalesce=True,
+        cache_ttl=settings.LLM_RESPONSE_CACHE_TTL_SECONDS,
+        endpoint="project_summary",
+        priority="background",
+    )
+
+
+async def summarize_project_today(project_id: int) -> Tuple[str, int, str]:
+    """
+    Summarize today's standups for a single project.
+    Returns (summary_text, count_of_entries, project_name).
+    """
+    project = await get_project_by_id_async(project_id)
+    if project is None:
+        return "Project not found.", 0, ""
+
+    entries = await get_today_standups_for_project_async(project_id)
+    project_name = project.name
+
+    if not entries:
+        return f"No standups submitted today for project '{project_name}'.", 0, project_name
+
+    tasks_by_owner = await list_tasks_for_owners_async(
+        {s.name for s in entries if s.name},
+        project_id=project_id,
+    )
+
+    today = date_cls.today()
+    messages = build_project_summary_messages(
+        project_name, entries, today, tasks_by_owner, project_id
+    )
+    summary = await complete_project_summary(messages, today, project_id, project_name, entries)
     return summary, len(entries), project_name
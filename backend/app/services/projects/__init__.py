@@ -1,7 +1,11 @@
 from .crud import (
     add_project,
     list_projects,
+    list_projects_async,
+    list_project_dicts,
+    list_project_dicts_by_ids,
     get_project_by_id,
+    get_project_by_id_async,
     delete_project,
     update_project,
 )
@@ -9,7 +13,11 @@ from .crud import (
 __all__ = [
     "add_project",
     "list_projects",
+    "list_projects_async",
+    "list_project_dicts",
+    "list_project_dicts_by_ids",
     "get_project_by_id",
+    "get_project_by_id_async",
     "delete_project",
     "update_project",
 ]
@@ -1,9 +1,12 @@
 from __future__ import annotations
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 from app.schemas.project import Project, ProjectCreate, ProjectUpdate
 from app.db import get_connection
+from app.db_async import run_db
+from app.services.change_log import publish_changes
+from app.services.dashboard_cache import invalidate_dashboard_cache
 
 
 def _row_to_project(row) -> Project:
@@ -17,6 +20,21 @@ def _row_to_project(row) -> Project:
     )
 
 
+def _row_to_project_dict(row) -> Dict[str, Any]:
+    """
+    Plain-dict version of _row_to_project for FastJSONResponse list
+    endpoints (same JSON as Project).
+    """
+    return {
+        "id": row["id"],
+        "name": row["name"],
+        "description": row["description"],
+        "owner": row["owner"],
+        "status": row["status"],
+        "created_at": datetime.fromisoformat(row["created_at"]),
+    }
+
+
 def add_project(data: ProjectCreate) -> Project:
     conn = get_connection()
     cur = conn.cursor()
@@ -33,6 +51,8 @@ def add_project(data: ProjectCreate) -> Project:
     project_id = cur.lastrowid
 
     conn.commit()
+    invalidate_dashboard_cache()
+    publish_changes()
 
     cur.execute("SELECT * FROM projects WHERE id = ?", (project_id,))
     row = cur.fetchone()
@@ -45,13 +65,50 @@ def add_project(data: ProjectCreate) -> Project:
     return _row_to_project(row)
 
 
-def list_projects() -> List[Project]:
+def _select_projects() -> list:
     conn = get_connection()
     cur = conn.cursor()
     cur.execute("SELECT * FROM projects ORDER BY created_at ASC")
     rows = cur.fetchall()
     conn.close()
-    return [_row_to_project(row) for row in rows]
+    return rows
+
+
+def list_projects() -> List[Project]:
+    return [_row_to_project(row) for row in _select_projects()]
+
+
+async def list_projects_async() -> List[Project]:
+    """
+    list_projects() for async code (runs on the DB thread pool).
+    """
+    return await run_db(list_projects)
+
+
+def list_project_dicts() -> List[Dict[str, Any]]:
+    """
+    list_projects() as plain dicts, for FastJSONResponse list endpoints.
+    """
+    return [_row_to_project_dict(row) for row in _select_projects()]
+
+
+def list_project_dicts_by_ids(project_ids: Iterable[int]) -> List[Dict[str, Any]]:
+    """
+    Current rows for the given ids (missing ids are skipped) as plain dicts,
+    for the change feed.
+    """
+    project_ids = list(project_ids)
+    if not project_ids:
+        return []
+    conn = get_connection()
+    cur = conn.cursor()
+    cur.execute(
+        f"SELECT * FROM projects WHERE id IN ({', '.join('?' for _ in project_ids)})",
+        project_ids,
+    )
+    rows = cur.fetchall()
+    conn.close()
+    return [_row_to_project_dict(row) for row in rows]
 
 
 def get_project_by_id(project_id: int) -> Optional[Project]:
@@ -65,11 +122,20 @@ def get_project_by_id(project_id: int) -> Optional[Project]:
     return _row_to_project(row)
 
 
+async def get_project_by_id_async(project_id: int) -> Optional[Project]:
+    """
+    get_project_by_id() for async code (runs on the DB thread pool).
+    """
+    return await run_db(get_project_by_id, project_id)
+
+
 def delete_project(project_id: int) -> None:
     conn = get_connection()
     cur = conn.cursor()
     cur.execute("DELETE FROM projects WHERE id = ?", (project_id,))
     conn.commit()
+    invalidate_dashboard_cache()
+    publish_changes()
     conn.close()
 
 
@@ -100,6 +166,8 @@ def update_project(project_id: int, data: ProjectUpdate) -> Optional[Project]:
         (new_name, new_description, new_status, project_id),
     )
     conn.commit()
+    invalidate_dashboard_cache()
+    publish_changes()
 
     cur.execute("SELECT * FROM projects WHERE id = ?", (project_id,))
     updated_row = cur.fetchone()
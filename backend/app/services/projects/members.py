@@ -3,15 +3,18 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from app.db import get_connection
+from app.db_async import run_db
+from app.services.change_log import publish_changes
+from app.services.dashboard_cache import invalidate_dashboard_cache
 from app.schemas.project import (
     Project,
     ProjectMember,
     ProjectRole,
 )
-from app.services.projects.crud import _row_to_project
+from app.services.projects.crud import _row_to_project, _row_to_project_dict
 
 
 def _row_to_member(row) -> ProjectMember:
@@ -49,6 +52,8 @@ def add_project_member(
         (project_id, username, role, created_at),
     )
     conn.commit()
+    invalidate_dashboard_cache()
+    publish_changes()
 
     cur.execute(
         """
@@ -95,6 +100,8 @@ def remove_project_member(project_id: int, username: str) -> None:
         (project_id, username),
     )
     conn.commit()
+    invalidate_dashboard_cache()
+    publish_changes()
     conn.close()
 
 
@@ -119,6 +126,27 @@ def get_user_role_for_project(
     return row["role"]  # type: ignore[return-value]
 
 
+def _select_projects_for_user(username: str) -> list:
+    conn = get_connection()
+    cur = conn.cursor()
+    cur.execute(
+        """
+        SELECT p.*
+        FROM projects p
+        LEFT JOIN project_members m
+          ON p.id = m.project_id
+        WHERE p.owner = ?
+           OR m.username = ?
+        GROUP BY p.id
+        ORDER BY p.created_at ASC
+        """,
+        (username, username),
+    )
+    rows = cur.fetchall()
+    conn.close()
+    return rows
+
+
 def list_projects_for_user(username: str) -> List[Project]:
     """
     List projects where the user is either:
@@ -126,21 +154,43 @@ def list_projects_for_user(username: str) -> List[Project]:
     - the project.owner, OR
     - present in project_members (any role)
     """
+    return [_row_to_project(r) for r in _select_projects_for_user(username)]
+
+
+async def list_projects_for_user_async(username: str) -> List[Project]:
+    """
+    list_projects_for_user() for async code (runs on the DB thread pool).
+    """
+    return await run_db(list_projects_for_user, username)
+
+
+def list_project_dicts_for_user(username: str) -> List[Dict[str, Any]]:
+    """
+    list_projects_for_user() as plain dicts, for FastJSONResponse list endpoints.
+    """
+    return [_row_to_project_dict(r) for r in _select_projects_for_user(username)]
+
+
+def list_project_access_for_user(
+    username: str,
+) -> List[Tuple[Project, bool, Optional[ProjectRole]]]:
+    """
+    Every project the user owns or is a member of, in one query, as
+    (project, is_canonical_owner, membership_role_or_None).
+    """
     conn = get_connection()
     cur = conn.cursor()
     cur.execute(
         """
-        SELECT p.*
+        SELECT p.*, m.role AS member_role
         FROM projects p
         LEFT JOIN project_members m
-          ON p.id = m.project_id
+          ON m.project_id = p.id AND m.username = ?
         WHERE p.owner = ?
            OR m.username = ?
-        GROUP BY p.id
-        ORDER BY p.created_at ASC
         """,
-        (username, username),
+        (username, username, username),
     )
     rows = cur.fetchall()
     conn.close()
-    return [_row_to_project(r) for r in rows]
+    return [(_row_to_project(r), r["owner"] == username, r["member_role"]) for r in rows]
@@ -37,7 +37,7 @@ async def query_knowledge(question: str, n_results: int = 3) -> Dict[str, Any]:
             },
             {"role": "user", "content": question},
         ]
-        answer = await llm_chat(messages)
+        answer = await llm_chat(messages, priority="interactive")
         return {"answer": answer, "sources": []}
 
     # 2) Build context from retrieved chunks
@@ -63,7 +63,7 @@ async def query_knowledge(question: str, n_results: int = 3) -> Dict[str, Any]:
     ]
 
     # 4) Call shared LLM helper
-    answer = await llm_chat(messages)
+    answer = await llm_chat(messages, priority="interactive")
 
     # Export chunk identifiers as legacy 'sources'
     source_ids = [s.document_id for s in sources]
@@ -1,5 +1,5 @@
-from app.core.llm_client import llm_chat
 from app.schemas.review import CodeReviewRequest
+from app.services.llm_cache_store import cached_llm_chat
 
 
 async def generate_code_review(request: CodeReviewRequest) -> str:
@@ -38,5 +38,12 @@ async def generate_code_review(request: CodeReviewRequest) -> str:
         {"role": "user", "content": user_prompt},
     ]
 
-    review_text = await llm_chat(messages)
+    # Identical diffs get the stored review (exact request hash)
+    review_text = await cached_llm_chat(
+        messages,
+        namespace="review",
+        coalesce=True,
+        endpoint="review",
+        priority="interactive",
+    )
     return review_text
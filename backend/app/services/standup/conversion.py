@@ -6,7 +6,7 @@ from app.schemas.standup import StandupEntry
 from app.schemas.task import TaskCreate, TaskEntry
 from app.schemas.user import UserPublic
 from app.services.standup_store import get_standup_by_id
-from app.services.task_store import add_task
+from app.services.task_store import add_tasks_bulk
 
 
 def convert_standup_to_tasks(
@@ -40,7 +40,7 @@ def convert_standup_to_tasks(
             detail="No conversion items provided.",
         )
 
-    created_tasks: List[TaskEntry] = []
+    to_create: List[TaskCreate] = []
 
     for item in items:
         if not item.create:
@@ -71,13 +71,12 @@ def convert_standup_to_tasks(
             origin_standup_id=standup_id,
         )
 
-        created = add_task(current_user.username, task_data)
-        created_tasks.append(created)
+        to_create.append(task_data)
 
-    if not created_tasks:
+    if not to_create:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="No tasks were created (all items were disabled or empty).",
         )
 
-    return created_tasks
+    return add_tasks_bulk(current_user.username, to_create)
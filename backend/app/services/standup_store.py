@@ -1,17 +1,23 @@
 from __future__ import annotations
 from datetime import datetime, date
-from typing import List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 from app.schemas.standup import StandupCreate, StandupEntry, StandupUpdate
 from app.services.projects import get_project_by_id
 from app.db import get_connection
+from app.db_async import run_db
+from app.services.change_log import publish_changes
+from app.services.dashboard_cache import invalidate_dashboard_cache
 
 
 def _row_to_standup(row) -> StandupEntry:
     # Determine project_name from projects table if needed
     project_id = row["project_id"]
     project_name: Optional[str] = None
-    if project_id is not None:
+    if "project_name" in row.keys():
+        # Already joined by the query
+        project_name = row["project_name"]
+    elif project_id is not None:
         proj = get_project_by_id(project_id)
         if proj is not None:
             project_name = proj.name
@@ -28,6 +34,23 @@ def _row_to_standup(row) -> StandupEntry:
     )
 
 
+def _row_to_standup_dict(row) -> Dict[str, Any]:
+    """
+    Plain-dict version of _row_to_standup for FastJSONResponse list
+    endpoints (same JSON as StandupEntry). Expects the joined project_name.
+    """
+    return {
+        "id": row["id"],
+        "name": row["name"],
+        "yesterday": row["yesterday"],
+        "today": row["today"],
+        "blockers": row["blockers"],
+        "created_at": datetime.fromisoformat(row["created_at"]),
+        "project_id": row["project_id"],
+        "project_name": row["project_name"],
+    }
+
+
 def add_standup(data: StandupCreate) -> StandupEntry:
     conn = get_connection()
     cur = conn.cursor()
@@ -41,6 +64,8 @@ def add_standup(data: StandupCreate) -> StandupEntry:
     )
     standup_id = cur.lastrowid
     conn.commit()
+    invalidate_dashboard_cache()
+    publish_changes()
 
     cur.execute("SELECT * FROM standups WHERE id = ?", (standup_id,))
     row = cur.fetchone()
@@ -58,26 +83,115 @@ def _get_all_standups() -> List[StandupEntry]:
     return [_row_to_standup(row) for row in rows]
 
 
+def _select_standups_for_date(target_date: date) -> list:
+    conn = get_connection()
+    cur = conn.cursor()
+    cur.execute(
+        """
+        SELECT s.*, p.name AS project_name
+        FROM standups s
+        LEFT JOIN projects p ON p.id = s.project_id
+        WHERE date(s.created_at) = ?
+        ORDER BY s.created_at ASC
+        """,
+        (target_date.isoformat(),),
+    )
+    rows = cur.fetchall()
+    conn.close()
+    return rows
+
+
 def get_standups_for_date(target_date: date) -> List[StandupEntry]:
     """
     Get all standups whose created_at DATE is target_date.
     Uses SQL filtering instead of loading the entire table.
     """
+    return [_row_to_standup(row) for row in _select_standups_for_date(target_date)]
+
+
+async def get_standups_for_date_async(target_date: date) -> List[StandupEntry]:
+    """
+    get_standups_for_date() for async code (runs on the DB thread pool).
+    """
+    return await run_db(get_standups_for_date, target_date)
+
+
+def list_standup_dicts_for_date(target_date: date) -> List[Dict[str, Any]]:
+    """
+    get_standups_for_date() as plain dicts, for FastJSONResponse list endpoints.
+    """
+    return [_row_to_standup_dict(row) for row in _select_standups_for_date(target_date)]
+
+
+def list_standup_dicts_by_ids(standup_ids: Iterable[int]) -> List[Dict[str, Any]]:
+    """
+    Current rows for the given ids (missing ids are skipped) as plain dicts,
+    for the change feed.
+    """
+    standup_ids = list(standup_ids)
+    if not standup_ids:
+        return []
     conn = get_connection()
     cur = conn.cursor()
     cur.execute(
-        """
-        SELECT * FROM standups
-        WHERE date(created_at) = ?
-        ORDER BY created_at ASC
+        f"""
+        SELECT s.*, p.name AS project_name
+        FROM standups s
+        LEFT JOIN projects p ON p.id = s.project_id
+        WHERE s.id IN ({", ".join("?" for _ in standup_ids)})
         """,
-        (target_date.isoformat(),),
+        standup_ids,
     )
     rows = cur.fetchall()
     conn.close()
+    return [_row_to_standup_dict(row) for row in rows]
+
+
+def get_standups_in_range(
+    start_date: date,
+    end_date: date,
+    project_ids: Optional[List[int]] = None,
+) -> List[StandupEntry]:
+    """
+    Get all standups whose created_at DATE is within [start_date, end_date],
+    optionally limited to project_ids, in a single query. Project names are
+    joined in rather than looked up per row.
+    """
+    query = """
+        SELECT s.*, p.name AS project_name
+        FROM standups s
+        LEFT JOIN projects p ON p.id = s.project_id
+        WHERE date(s.created_at) BETWEEN ? AND ?
+    """
+    params: list = [start_date.isoformat(), end_date.isoformat()]
+
+    if project_ids is not None:
+        if not project_ids:
+            return []
+        query += f" AND s.project_id IN ({', '.join('?' for _ in project_ids)})"
+        params.extend(project_ids)
+
+    query += " ORDER BY s.created_at ASC"
+
+    conn = get_connection()
+    cur = conn.cursor()
+    cur.execute(query, params)
+    rows = cur.fetchall()
+    conn.close()
     return [_row_to_standup(row) for row in rows]
 
 
+async def get_standups_in_range_async(
+    start_date: date,
+    end_date: date,
+    project_ids: Optional[List[int]] = None,
+) -> List[StandupEntry]:
+    """
+    get_standups_in_range() for async code (runs on the DB thread pool).
+    """
+    return await run_db(get_standups_in_range, start_date, end_date, project_ids)
+
+
 def get_today_standups() -> List[StandupEntry]:
     """
     Convenience wrapper for today's standups.
@@ -85,6 +199,13 @@ def get_today_standups() -> List[StandupEntry]:
     return get_standups_for_date(date.today())
 
 
+async def get_today_standups_async() -> List[StandupEntry]:
+    """
+    get_today_standups() for async code (runs on the DB thread pool).
+    """
+    return await run_db(get_today_standups)
+
+
 def get_today_standups_for_project(project_id: int) -> List[StandupEntry]:
     """
     Get today's standups filtered by a specific project_id.
@@ -93,6 +214,13 @@ def get_today_standups_for_project(project_id: int) -> List[StandupEntry]:
     return [s for s in today_items if s.project_id == project_id]
 
 
+async def get_today_standups_for_project_async(project_id: int) -> List[StandupEntry]:
+    """
+    get_today_standups_for_project() for async code (runs on the DB thread pool).
+    """
+    return await run_db(get_today_standups_for_project, project_id)
+
+
 def get_standups_for_project_on_date(project_id: int, target_date: date) -> List[StandupEntry]:
     """
     Get standups for a project on a specific date.
@@ -117,6 +245,8 @@ def delete_standup(standup_id: int) -> None:
     cur = conn.cursor()
     cur.execute("DELETE FROM standups WHERE id = ?", (standup_id,))
     conn.commit()
+    invalidate_dashboard_cache()
+    publish_changes()
     conn.close()
 
 
@@ -150,6 +280,8 @@ def update_standup(standup_id: int, data: StandupUpdate) -> Optional[StandupEntr
         (new_yesterday, new_today, new_blockers, new_project_id, standup_id),
     )
     conn.commit()
+    invalidate_dashboard_cache()
+    publish_changes()
 
     cur.execute("SELECT * FROM standups WHERE id = ?", (standup_id,))
     updated_row = cur.fetchone()
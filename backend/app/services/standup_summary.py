@@ -1,25 +1,42 @@
-from datetime import date as date_cls
-from typing import Tuple, List
-
-from app.services.standup_store import get_today_standups, get_standups_for_date
-from app.services.task_store import list_tasks
+import asyncio
+from collections import defaultdict
+from datetime import date as date_cls, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.schemas.standup import StandupEntry
+from app.schemas.task import TaskEntry
+from app.services.projects import get_project_by_id_async
+from app.services.project_summary import build_project_summary_messages, complete_project_summary
+from app.services.standup_store import (
+    get_today_standups_async,
+    get_standups_for_date_async,
+    get_standups_in_range_async,
+)
+from app.services.task_store import list_tasks_for_owners_async
+from app.core.config import settings
 from app.core.llm_client import llm_chat
+from app.services.llm_cache_store import cached_llm_chat
 
 
-async def summarize_standups_for_date(target_date: date_cls) -> Tuple[str, int]:
-    """
-    Build a combined text summary of standups and active tasks for a given date.
-    Returns (summary_text, count_of_entries).
-    """
-    # Choose how to load standups based on date
-    if target_date == date_cls.today():
-        standups = get_today_standups()
-    else:
-        standups = get_standups_for_date(target_date)
+SUMMARY_SYSTEM_PROMPT = (
+    "You are an assistant that summarizes daily standups and related tasks for an engineering team. "
+    "Generate a concise but useful summary that:\n"
+    "- Groups information by person and/or project where helpful.\n"
+    "- Highlights progress, key accomplishments, and important blockers.\n"
+    "- Mentions urgent or cross-team dependencies.\n"
+    "- Uses short paragraphs or bullet points, not one long wall of text.\n"
+)
 
-    if not standups:
-        return f"No standups submitted for {target_date.isoformat()}.", 0
 
+def build_standup_summary_messages(
+    target_date: date_cls,
+    standups: List[StandupEntry],
+    tasks_by_owner: Dict[str, List[TaskEntry]],
+) -> List[dict]:
+    """
+    Prompt for the team summary of one date: standup entries plus the active
+    tasks of everyone who submitted one.
+    """
     # ------------------------------------------------------------------
     # Build standup text block
     # ------------------------------------------------------------------
@@ -43,7 +60,7 @@ async def summarize_standups_for_date(target_date: date_cls) -> Tuple[str, int]:
     task_lines: List[str] = []
 
     for owner in owners:
-        tasks = list_tasks(owner=owner, active_only=True)
+        tasks = tasks_by_owner.get(owner)
         if not tasks:
             continue
 
@@ -63,29 +80,65 @@ async def summarize_standups_for_date(target_date: date_cls) -> Tuple[str, int]:
     # ------------------------------------------------------------------
     # LLM prompt
     # ------------------------------------------------------------------
-    system_prompt = (
-        "You are an assistant that summarizes daily standups and related tasks for an engineering team. "
-        "Generate a concise but useful summary that:\n"
-        "- Groups information by person and/or project where helpful.\n"
-        "- Highlights progress, key accomplishments, and important blockers.\n"
-        "- Mentions urgent or cross-team dependencies.\n"
-        "- Uses short paragraphs or bullet points, not one long wall of text.\n"
-    )
-
-    date_label = target_date.isoformat()
-
     user_content = (
-        f"Date: {date_label}\n\n"
+        f"Date: {target_date.isoformat()}\n\n"
         f"Here are the standup entries for this date:\n\n{standup_text}\n\n"
         f"Here are the active tasks for the people above:\n\n{tasks_text}"
     )
 
-    messages = [
-        {"role": "system", "content": system_prompt},
+    return [
+        {"role": "system", "content": SUMMARY_SYSTEM_PROMPT},
         {"role": "user", "content": user_content},
     ]
 
-    summary = await llm_chat(messages)
+
+async def complete_standup_summary(
+    messages: List[dict],
+    target_date: date_cls,
+    standups: List[StandupEntry],
+) -> str:
+    if target_date < date_cls.today():
+        # Past dates are settled: key on the date and its standups. The tasks
+        # in the prompt are live state; edits to them must not miss the cache.
+        return await cached_llm_chat(
+            messages,
+            namespace="standup_summary",
+            key={
+                "system": SUMMARY_SYSTEM_PROMPT,
+                "date": target_date.isoformat(),
+                "standups": [[s.id, s.name, s.yesterday, s.today, s.blockers] for s in standups],
+            },
+            coalesce=True,
+            endpoint="standup_summary",
+            priority="background",
+        )
+    return await llm_chat(
+        messages,
+        coalesce=True,
+        cache_ttl=settings.LLM_RESPONSE_CACHE_TTL_SECONDS,
+        endpoint="standup_summary",
+        priority="background",
+    )
+
+
+async def summarize_standups_for_date(target_date: date_cls) -> Tuple[str, int]:
+    """
+    Build a combined text summary of standups and active tasks for a given date.
+    Returns (summary_text, count_of_entries).
+    """
+    # Choose how to load standups based on date
+    if target_date == date_cls.today():
+        standups = await get_today_standups_async()
+    else:
+        standups = await get_standups_for_date_async(target_date)
+
+    if not standups:
+        return f"No standups submitted for {target_date.isoformat()}.", 0
+
+    tasks_by_owner = await list_tasks_for_owners_async({s.name for s in standups if s.name})
+
+    messages = build_standup_summary_messages(target_date, standups, tasks_by_owner)
+    summary = await complete_standup_summary(messages, target_date, standups)
     return summary, len(standups)
 
 
@@ -94,3 +147,95 @@ async def summarize_today_standups() -> Tuple[str, int]:
     Backwards-compatible helper for 'today' summary.
     """
     return await summarize_standups_for_date(date_cls.today())
+
+
+async def summarize_standups_batch(
+    start_date: date_cls,
+    end_date: date_cls,
+    project_ids: Optional[List[int]] = None,
+    include_overall: bool = True,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Summaries for every date in [start_date, end_date]: the team summary
+    (include_overall) and one summary per project in project_ids.
+
+    Standups and tasks are loaded once for the whole range. The LLM calls
+    then run concurrently, at most STANDUP_BATCH_CONCURRENCY at a time.
+    Past dates use the same cache keys as the single-date/single-project
+    endpoints, so summaries already generated come from the LLM cache.
+
+    Returns {date: {"overall": {...} | None, "projects": {project_id: {...}}}}.
+    """
+    project_ids = list(dict.fromkeys(project_ids or []))
+
+    standups = await get_standups_in_range_async(
+        start_date,
+        end_date,
+        project_ids=None if include_overall else project_ids,
+    )
+
+    by_date: Dict[date_cls, List[StandupEntry]] = defaultdict(list)
+    for s in standups:
+        by_date[s.created_at.date()].append(s)
+
+    # One query for every author in the range; project summaries filter by project
+    tasks_by_owner = await list_tasks_for_owners_async({s.name for s in standups if s.name})
+
+    project_names: Dict[int, str] = {}
+    for project_id in project_ids:
+        project = await get_project_by_id_async(project_id)
+        project_names[project_id] = project.name if project else ""
+
+    semaphore = asyncio.Semaphore(max(1, settings.STANDUP_BATCH_CONCURRENCY))
+
+    async def limited(coro_factory) -> str:
+        async with semaphore:
+            return await coro_factory()
+
+    async def overall_item(day: date_cls) -> Dict[str, Any]:
+        entries = by_date.get(day, [])
+        if not entries:
+            return {"summary": f"No standups submitted for {day.isoformat()}.", "count": 0}
+        messages = build_standup_summary_messages(day, entries, tasks_by_owner)
+        summary = await limited(lambda: complete_standup_summary(messages, day, entries))
+        return {"summary": summary, "count": len(entries)}
+
+    async def project_item(day: date_cls, project_id: int) -> Dict[str, Any]:
+        name = project_names[project_id]
+        item: Dict[str, Any] = {"project_id": project_id, "project_name": name}
+        entries = [s for s in by_date.get(day, []) if s.project_id == project_id]
+        if not entries:
+            item.update(
+                summary=f"No standups submitted on {day.isoformat()} for project '{name}'.",
+                count=0,
+            )
+            return item
+        messages = build_project_summary_messages(name, entries, day, tasks_by_owner, project_id)
+        item["summary"] = await limited(
+            lambda: complete_project_summary(messages, day, project_id, name, entries)
+        )
+        item["count"] = len(entries)
+        return item
+
+    days = [start_date + timedelta(days=i) for i in range((end_date - start_date).days + 1)]
+    results: Dict[str, Dict[str, Any]] = {}
+    jobs = []
+
+    for day in days:
+        day_result: Dict[str, Any] = {"overall": None, "projects": {}}
+        results[day.isoformat()] = day_result
+
+        if include_overall:
+            jobs.append((day_result, None, overall_item(day)))
+        for project_id in project_ids:
+            jobs.append((day_result, project_id, project_item(day, project_id)))
+
+    items = await asyncio.gather(*(coro for _, _, coro in jobs))
+
+    for (day_result, project_id, _), item in zip(jobs, items):
+        if project_id is None:
+            day_result["overall"] = item
+        else:
+            day_result["projects"][project_id] = item
+
+    return results
@@ -3,21 +3,54 @@
 from __future__ import annotations
 
 from datetime import datetime, date
-from typing import List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 
-from app.schemas.task import TaskCreate, TaskEntry, TaskUpdate
+from app.schemas.task import TaskCreate, TaskEntry, TaskStats, TaskStatusCounts, TaskUpdate
 from app.services.projects import get_project_by_id
 from app.db import get_connection
+from app.db_async import run_db
+from app.services.change_log import publish_changes
 
 
 def _row_to_task(row) -> TaskEntry:
     project_id = row["project_id"]
     project_name: Optional[str] = None
-    if project_id is not None:
+    if "project_name" in row.keys():
+        # Already joined by the query
+        project_name = row["project_name"]
+    elif project_id is not None:
         proj = get_project_by_id(project_id)
         if proj is not None:
             project_name = proj.name
 
+    return _row_to_task_with_project(row, project_name)
+
+
+def _row_to_task_dict(row) -> Dict[str, Any]:
+    """
+    Plain-dict version of _row_to_task for FastJSONResponse list endpoints:
+    same keys and JSON output as TaskEntry, without per-row validation.
+    Expects the joined project_name column (_TASK_SELECT).
+    """
+    return {
+        "title": row["title"],
+        "description": row["description"],
+        "status": row["status"],
+        "project_id": row["project_id"],
+        "progress": row["progress"],
+        "due_date": row["due_date"],
+        "is_active": bool(row["is_active"]),
+        "id": row["id"],
+        "owner": row["owner"],
+        "origin_standup_id": row["origin_standup_id"],
+        "created_at": datetime.fromisoformat(row["created_at"]),
+        "updated_at": datetime.fromisoformat(row["updated_at"]),
+        "project_name": row["project_name"],
+    }
+
+
+def _row_to_task_with_project(row, project_name: Optional[str]) -> TaskEntry:
+    project_id = row["project_id"]
     return TaskEntry(
         id=row["id"],
         owner=row["owner"],
@@ -35,56 +68,66 @@ def _row_to_task(row) -> TaskEntry:
     )
 
 
-def add_task(owner: str, data: TaskCreate) -> TaskEntry:
+_INSERT_COLUMNS = (
+    "owner",
+    "title",
+    "description",
+    "status",
+    "project_id",
+    "progress",
+    "due_date",
+    "is_active",
+    "origin_standup_id",
+    "created_at",
+    "updated_at",
+)
+
+
+def _insert_params(owner: str, data: TaskCreate, now: str) -> tuple:
     """
-    Insert a new task, normalizing status/progress semantics:
+    Column values for a new task, normalizing status/progress semantics:
 
     - If status == "done" and progress < 100 -> progress forced to 100.
     """
-    conn = get_connection()
-    cur = conn.cursor()
-
-    now = datetime.now().isoformat()
-
-    # Normalize status/progress coupling for new tasks
     status = data.status
     progress = data.progress
     if status == "done" and progress < 100:
         progress = 100
 
+    return (
+        owner,
+        data.title,
+        data.description,
+        status,
+        data.project_id,
+        progress,
+        data.due_date.isoformat() if data.due_date else None,
+        1 if data.is_active else 0,
+        data.origin_standup_id,
+        now,
+        now,
+    )
+
+
+def add_task(owner: str, data: TaskCreate) -> TaskEntry:
+    """
+    Insert a new task, normalizing status/progress semantics (see _insert_params).
+    """
+    conn = get_connection()
+    cur = conn.cursor()
+
+    now = datetime.now().isoformat()
+
     cur.execute(
-        """
-        INSERT INTO tasks (
-            owner,
-            title,
-            description,
-            status,
-            project_id,
-            progress,
-            due_date,
-            is_active,
-            origin_standup_id,
-            created_at,
-            updated_at
-        )
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        f"""
+        INSERT INTO tasks ({', '.join(_INSERT_COLUMNS)})
+        VALUES ({', '.join('?' for _ in _INSERT_COLUMNS)})
         """,
-        (
-            owner,
-            data.title,
-            data.description,
-            status,
-            data.project_id,
-            progress,
-            data.due_date.isoformat() if data.due_date else None,
-            1 if data.is_active else 0,
-            data.origin_standup_id,
-            now,
-            now,
-        ),
+        _insert_params(owner, data, now),
     )
     task_id = cur.lastrowid
     conn.commit()
+    publish_changes()
 
     cur.execute("SELECT * FROM tasks WHERE id = ?", (task_id,))
     row = cur.fetchone()
@@ -96,6 +139,143 @@ def add_task(owner: str, data: TaskCreate) -> TaskEntry:
     return _row_to_task(row)
 
 
+# Rows per multi-row INSERT; 11 columns each stays under SQLite's
+# host parameter limit (32766 since 3.32).
+_BULK_INSERT_ROWS = 500
+
+
+def _insert_tasks(cur, owner: str, items: Sequence[TaskCreate]) -> List[TaskEntry]:
+    """
+    Insert tasks on an open cursor (no commit) and return them in input order.
+    """
+    now = datetime.now().isoformat()
+    params = [_insert_params(owner, data, now) for data in items]
+    row_placeholder = f"({', '.join('?' for _ in _INSERT_COLUMNS)})"
+
+    rows = []
+    for start in range(0, len(params), _BULK_INSERT_ROWS):
+        chunk = params[start:start + _BULK_INSERT_ROWS]
+        cur.execute(
+            f"""
+            INSERT INTO tasks ({', '.join(_INSERT_COLUMNS)})
+            VALUES {', '.join(row_placeholder for _ in chunk)}
+            RETURNING *
+            """,
+            [value for row in chunk for value in row],
+        )
+        # RETURNING order is unspecified; ids are assigned in VALUES order
+        rows.extend(sorted(cur.fetchall(), key=lambda r: r["id"]))
+
+    project_ids = sorted({r["project_id"] for r in rows if r["project_id"] is not None})
+    project_names: Dict[int, str] = {}
+    if project_ids:
+        cur.execute(
+            f"SELECT id, name FROM projects WHERE id IN ({', '.join('?' for _ in project_ids)})",
+            project_ids,
+        )
+        project_names = {r["id"]: r["name"] for r in cur.fetchall()}
+
+    return [_row_to_task_with_project(r, project_names.get(r["project_id"])) for r in rows]
+
+
+def add_tasks_bulk(owner: str, items: Sequence[TaskCreate]) -> List[TaskEntry]:
+    """
+    Insert many tasks for one owner in a single transaction.
+
+    Rows go in with multi-row INSERT ... RETURNING statements (500 rows
+    each), so the created tasks come back without reading them again.
+    Project names are resolved with one query. Normalization is the same as
+    add_task. Returns the tasks in input order. Nothing is inserted if any
+    row fails.
+    """
+    if not items:
+        return []
+
+    conn = get_connection()
+    cur = conn.cursor()
+    try:
+        created = _insert_tasks(cur, owner, items)
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+    publish_changes()
+    return created
+
+
+async def add_tasks_bulk_async(owner: str, items: Sequence[TaskCreate]) -> List[TaskEntry]:
+    """
+    add_tasks_bulk() for async code (runs on the DB thread pool).
+    """
+    return await run_db(add_tasks_bulk, owner, items)
+
+
+def add_tasks_bulk_once(
+    owner: str,
+    items: Sequence[Tuple[str, TaskCreate]],
+) -> Tuple[List[TaskEntry], int]:
+    """
+    Like add_tasks_bulk, but each item carries an import key (e.g. a content
+    hash). Items whose key was already imported for this owner, or that
+    repeat a key earlier in `items`, are skipped. The keys are recorded in
+    task_import_keys in the same transaction as the tasks, so re-running an
+    import is idempotent.
+
+    Returns (created tasks in input order, number of skipped items).
+    """
+    if not items:
+        return [], 0
+
+    conn = get_connection()
+    cur = conn.cursor()
+    try:
+        keys = list(dict.fromkeys(key for key, _ in items))
+        seen = set()
+        for start in range(0, len(keys), _MAX_IN_PARAMS):
+            chunk = keys[start:start + _MAX_IN_PARAMS]
+            cur.execute(
+                f"""
+                SELECT import_key FROM task_import_keys
+                WHERE owner = ? AND import_key IN ({', '.join('?' for _ in chunk)})
+                """,
+                [owner, *chunk],
+            )
+            seen.update(r["import_key"] for r in cur.fetchall())
+
+        new_keys: List[str] = []
+        to_create: List[TaskCreate] = []
+        for key, data in items:
+            if key in seen:
+                continue
+            seen.add(key)
+            new_keys.append(key)
+            to_create.append(data)
+
+        created = _insert_tasks(cur, owner, to_create) if to_create else []
+
+        now = datetime.now().isoformat()
+        cur.executemany(
+            """
+            INSERT INTO task_import_keys (owner, import_key, task_id, created_at)
+            VALUES (?, ?, ?, ?)
+            """,
+            [(owner, key, task.id, now) for key, task in zip(new_keys, created)],
+        )
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+    if created:
+        publish_changes()
+    return created, len(items) - len(created)
+
+
 def get_task_by_id(task_id: int) -> Optional[TaskEntry]:
     conn = get_connection()
     cur = conn.cursor()
@@ -107,7 +287,15 @@ def get_task_by_id(task_id: int) -> Optional[TaskEntry]:
     return _row_to_task(row)
 
 
-def list_tasks(
+# Tasks with their project name joined in (avoids a project lookup per row)
+_TASK_SELECT = """
+    SELECT t.*, p.name AS project_name
+    FROM tasks t
+    LEFT JOIN projects p ON p.id = t.project_id
+"""
+
+
+def _select_tasks(
     owner: Optional[str] = None,
     project_id: Optional[int] = None,
     status: Optional[str] = None,
@@ -116,71 +304,183 @@ def list_tasks(
     search: Optional[str] = None,
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
-) -> List[TaskEntry]:
+) -> list:
     """
-    List tasks with normalized filtering semantics.
-
-    - owner: filter by task owner
-    - project_id: filter by project_id
-    - status: filter by status string
-    - active_only: if True, only tasks with is_active=1
-    - origin_standup_id: filter by standup origin
-    - search: case-insensitive LIKE match on title/description
-    - start_date/end_date: inclusive date range on created_at (by date only)
+    Rows for list_tasks / list_task_dicts (see list_tasks for the filters).
     """
     conn = get_connection()
     cur = conn.cursor()
 
-    query = "SELECT * FROM tasks"
+    query = _TASK_SELECT
     clauses = []
     params: list = []
 
     if owner is not None:
-        clauses.append("owner = ?")
+        clauses.append("t.owner = ?")
         params.append(owner)
 
     if project_id is not None:
-        clauses.append("project_id = ?")
+        clauses.append("t.project_id = ?")
         params.append(project_id)
 
     if status is not None:
-        clauses.append("status = ?")
+        clauses.append("t.status = ?")
         params.append(status)
 
     if active_only:
-        clauses.append("is_active = 1")
+        clauses.append("t.is_active = 1")
 
     if origin_standup_id is not None:
-        clauses.append("origin_standup_id = ?")
+        clauses.append("t.origin_standup_id = ?")
         params.append(origin_standup_id)
 
     if search:
         # Simple LIKE-based search over title and description
-        clauses.append("(title LIKE ? OR description LIKE ?)")
+        clauses.append("(t.title LIKE ? OR t.description LIKE ?)")
         pattern = f"%{search}%"
         params.extend([pattern, pattern])
 
     if start_date is not None:
         # Compare by date(created_at) to ignore time portion
-        clauses.append("date(created_at) >= ?")
+        clauses.append("date(t.created_at) >= ?")
         params.append(start_date.isoformat())
 
     if end_date is not None:
-        clauses.append("date(created_at) <= ?")
+        clauses.append("date(t.created_at) <= ?")
         params.append(end_date.isoformat())
 
     if clauses:
         query += " WHERE " + " AND ".join(clauses)
 
-    query += " ORDER BY created_at DESC"
+    query += " ORDER BY t.created_at DESC"
 
     cur.execute(query, params)
     rows = cur.fetchall()
     conn.close()
+    return rows
+
+
+def list_tasks(
+    owner: Optional[str] = None,
+    project_id: Optional[int] = None,
+    status: Optional[str] = None,
+    active_only: bool = True,
+    origin_standup_id: Optional[int] = None,
+    search: Optional[str] = None,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+) -> List[TaskEntry]:
+    """
+    List tasks with normalized filtering semantics.
 
+    - owner: filter by task owner
+    - project_id: filter by project_id
+    - status: filter by status string
+    - active_only: if True, only tasks with is_active=1
+    - origin_standup_id: filter by standup origin
+    - search: case-insensitive LIKE match on title/description
+    - start_date/end_date: inclusive date range on created_at (by date only)
+    """
+    rows = _select_tasks(
+        owner, project_id, status, active_only, origin_standup_id, search, start_date, end_date
+    )
     return [_row_to_task(r) for r in rows]
 
 
+def list_task_dicts(
+    owner: Optional[str] = None,
+    project_id: Optional[int] = None,
+    status: Optional[str] = None,
+    active_only: bool = True,
+    origin_standup_id: Optional[int] = None,
+    search: Optional[str] = None,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+) -> List[Dict[str, Any]]:
+    """
+    list_tasks() as plain dicts, for FastJSONResponse list endpoints.
+    """
+    rows = _select_tasks(
+        owner, project_id, status, active_only, origin_standup_id, search, start_date, end_date
+    )
+    return [_row_to_task_dict(r) for r in rows]
+
+
+def list_task_dicts_by_ids(task_ids: Iterable[int]) -> List[Dict[str, Any]]:
+    """
+    Current rows for the given ids (missing ids are skipped) as plain dicts,
+    for the change feed.
+    """
+    task_ids = list(task_ids)
+    if not task_ids:
+        return []
+    conn = get_connection()
+    cur = conn.cursor()
+    cur.execute(
+        _TASK_SELECT + f" WHERE t.id IN ({', '.join('?' for _ in task_ids)})",
+        task_ids,
+    )
+    rows = cur.fetchall()
+    conn.close()
+    return [_row_to_task_dict(r) for r in rows]
+
+
+def list_tasks_for_owners(
+    owners: Iterable[str],
+    active_only: bool = True,
+    project_id: Optional[int] = None,
+) -> Dict[str, List[TaskEntry]]:
+    """
+    Load tasks for several owners in a single query, grouped by owner.
+
+    Every requested owner is a key in the result (empty list if they have
+    no tasks). Per owner, tasks are ordered like list_tasks (newest first).
+    Project names are joined in rather than looked up per task.
+    """
+    owner_list = sorted(set(owners))
+    grouped: Dict[str, List[TaskEntry]] = {owner: [] for owner in owner_list}
+    if not owner_list:
+        return grouped
+
+    query = f"""
+        SELECT t.*, p.name AS project_name
+        FROM tasks t
+        LEFT JOIN projects p ON p.id = t.project_id
+        WHERE t.owner IN ({', '.join('?' for _ in owner_list)})
+    """
+    params: list = list(owner_list)
+
+    if active_only:
+        query += " AND t.is_active = 1"
+
+    if project_id is not None:
+        query += " AND t.project_id = ?"
+        params.append(project_id)
+
+    query += " ORDER BY t.created_at DESC"
+
+    conn = get_connection()
+    cur = conn.cursor()
+    cur.execute(query, params)
+    rows = cur.fetchall()
+    conn.close()
+
+    for row in rows:
+        grouped[row["owner"]].append(_row_to_task(row))
+    return grouped
+
+
+async def list_tasks_for_owners_async(
+    owners: Iterable[str],
+    active_only: bool = True,
+    project_id: Optional[int] = None,
+) -> Dict[str, List[TaskEntry]]:
+    """
+    list_tasks_for_owners() for async code (runs on the DB thread pool).
+    """
+    return await run_db(list_tasks_for_owners, owners, active_only, project_id)
+
+
 def list_tasks_for_standup(standup_id: int) -> List[TaskEntry]:
     """
     Convenience helper: list all tasks that were created from a given standup.
@@ -189,9 +489,10 @@ def list_tasks_for_standup(standup_id: int) -> List[TaskEntry]:
     return list_tasks(origin_standup_id=standup_id, active_only=False)
 
 
-def update_task(task_id: int, data: TaskUpdate) -> Optional[TaskEntry]:
+def _apply_update(current: TaskEntry, data: TaskUpdate) -> Dict[str, Any]:
     """
-    Update a task, normalizing status/progress semantics:
+    Compute the column values after applying `data` to `current`,
+    normalizing status/progress semantics:
 
     - If setting status = "done" with no explicit progress and current progress < 100
       -> force progress to 100.
@@ -200,17 +501,6 @@ def update_task(task_id: int, data: TaskUpdate) -> Optional[TaskEntry]:
     - If progress is explicitly set < 100 while current status is "done" and
       status is not explicitly overridden -> downgrade status to "in_progress".
     """
-    conn = get_connection()
-    cur = conn.cursor()
-
-    cur.execute("SELECT * FROM tasks WHERE id = ?", (task_id,))
-    row = cur.fetchone()
-    if row is None:
-        conn.close()
-        return None
-
-    current = _row_to_task(row)
-
     new_title = data.title if data.title is not None else current.title
     new_description = data.description if data.description is not None else current.description
 
@@ -239,34 +529,65 @@ def update_task(task_id: int, data: TaskUpdate) -> Optional[TaskEntry]:
         # Progress lowered while status was done and not explicitly overridden
         new_status = "in_progress"
 
+    return {
+        "title": new_title,
+        "description": new_description,
+        "status": new_status,
+        "project_id": new_project_id,
+        "progress": new_progress,
+        "due_date": new_due_date.isoformat() if new_due_date else None,
+        "is_active": 1 if new_is_active else 0,
+    }
+
+
+_UPDATE_TASK_SQL = """
+    UPDATE tasks
+    SET title = ?,
+        description = ?,
+        status = ?,
+        project_id = ?,
+        progress = ?,
+        due_date = ?,
+        is_active = ?,
+        updated_at = ?
+    WHERE id = ?
+"""
+
+
+def _update_params(task_id: int, values: Dict[str, Any], now: str) -> tuple:
+    return (
+        values["title"],
+        values["description"],
+        values["status"],
+        values["project_id"],
+        values["progress"],
+        values["due_date"],
+        values["is_active"],
+        now,
+        task_id,
+    )
+
+
+def update_task(task_id: int, data: TaskUpdate) -> Optional[TaskEntry]:
+    """
+    Update a task, normalizing status/progress semantics (see _apply_update).
+    """
+    conn = get_connection()
+    cur = conn.cursor()
+
+    cur.execute("SELECT * FROM tasks WHERE id = ?", (task_id,))
+    row = cur.fetchone()
+    if row is None:
+        conn.close()
+        return None
+
+    current = _row_to_task(row)
+    values = _apply_update(current, data)
     now = datetime.now().isoformat()
 
-    cur.execute(
-        """
-        UPDATE tasks
-        SET title = ?,
-            description = ?,
-            status = ?,
-            project_id = ?,
-            progress = ?,
-            due_date = ?,
-            is_active = ?,
-            updated_at = ?
-        WHERE id = ?
-        """,
-        (
-            new_title,
-            new_description,
-            new_status,
-            new_project_id,
-            new_progress,
-            new_due_date.isoformat() if new_due_date else None,
-            1 if new_is_active else 0,
-            now,
-            task_id,
-        ),
-    )
+    cur.execute(_UPDATE_TASK_SQL, _update_params(task_id, values, now))
     conn.commit()
+    publish_changes()
 
     cur.execute("SELECT * FROM tasks WHERE id = ?", (task_id,))
     updated_row = cur.fetchone()
@@ -278,6 +599,76 @@ def update_task(task_id: int, data: TaskUpdate) -> Optional[TaskEntry]:
     return _row_to_task(updated_row)
 
 
+# Stay well below SQLite's host parameter limit for IN (...) lists
+_MAX_IN_PARAMS = 500
+
+
+def bulk_update_tasks(
+    task_ids: Iterable[int],
+    data: TaskUpdate,
+    is_allowed: Optional[Callable[[TaskEntry], bool]] = None,
+) -> Dict[int, str]:
+    """
+    Apply one TaskUpdate to many tasks.
+
+    All tasks are loaded with one query (per 500 IDs), `is_allowed` decides
+    per task whether it may be changed, and all updates are written with a
+    single executemany in one transaction. Normalization is the same as
+    update_task.
+
+    Returns {task_id: outcome}, where outcome is "updated", "not_found" or
+    "forbidden".
+    """
+    ids = list(dict.fromkeys(task_ids))
+    outcomes: Dict[int, str] = {}
+    if not ids:
+        return outcomes
+
+    conn = get_connection()
+    cur = conn.cursor()
+
+    current: Dict[int, TaskEntry] = {}
+    for start in range(0, len(ids), _MAX_IN_PARAMS):
+        chunk = ids[start:start + _MAX_IN_PARAMS]
+        cur.execute(
+            f"""
+            SELECT t.*, p.name AS project_name
+            FROM tasks t
+            LEFT JOIN projects p ON p.id = t.project_id
+            WHERE t.id IN ({', '.join('?' for _ in chunk)})
+            """,
+            chunk,
+        )
+        for row in cur.fetchall():
+            current[row["id"]] = _row_to_task(row)
+
+    now = datetime.now().isoformat()
+    params = []
+    for task_id in ids:
+        task = current.get(task_id)
+        if task is None:
+            outcomes[task_id] = "not_found"
+        elif is_allowed is not None and not is_allowed(task):
+            outcomes[task_id] = "forbidden"
+        else:
+            params.append(_update_params(task_id, _apply_update(task, data), now))
+            outcomes[task_id] = "updated"
+
+    try:
+        if params:
+            cur.executemany(_UPDATE_TASK_SQL, params)
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+    if params:
+        publish_changes()
+    return outcomes
+
+
 def delete_task(task_id: int) -> None:
     """
     Hard delete a task from the database.
@@ -291,3 +682,116 @@ def delete_task(task_id: int) -> None:
     cur.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
     conn.commit()
     conn.close()
+    publish_changes()
+
+
+def get_task_stats(
+    group_by: str = "project",
+    owner: Optional[str] = None,
+    project_id: Optional[int] = None,
+    visible_project_ids: Optional[Sequence[int]] = None,
+    viewer: Optional[str] = None,
+    today: Optional[date] = None,
+) -> Tuple[List[TaskStats], TaskStats]:
+    """
+    Task counts per project (group_by="project"; personal tasks form the
+    project_id=None group) or per owner (group_by="owner").
+
+    Reads the trigger-maintained task_aggregates / task_due_aggregates
+    tables (see db.py), so the cost grows with the number of owner/project
+    pairs, not with the number of tasks.
+
+    Filters:
+    - owner / project_id: only that owner's / project's tasks.
+    - visible_project_ids (non-admins): only these projects, plus the
+      personal tasks of `viewer`.
+
+    Returns (groups, totals over the groups).
+    """
+    where: List[str] = []
+    params: List[Any] = []
+
+    if owner is not None:
+        where.append("a.owner = ?")
+        params.append(owner)
+    if project_id is not None:
+        where.append("a.project_key = ?")
+        params.append(project_id)
+    if visible_project_ids is not None:
+        ids = list(visible_project_ids)
+        placeholders = ", ".join("?" for _ in ids)
+        visible = f"a.project_key IN ({placeholders})" if ids else "0"
+        where.append(f"({visible} OR (a.project_key = 0 AND a.owner = ?))")
+        params.extend([*ids, viewer])
+
+    where_sql = f"WHERE {' AND '.join(where)}" if where else ""
+    key = "a.project_key" if group_by == "project" else "a.owner"
+    cutoff = (today or date.today()).isoformat()
+
+    conn = get_connection()
+    cur = conn.cursor()
+    cur.execute(
+        f"""
+        WITH overdue AS (
+            SELECT owner, project_key, SUM(open_count) AS n
+            FROM task_due_aggregates
+            WHERE due_date < ?
+            GROUP BY owner, project_key
+        )
+        SELECT
+            {key} AS group_key,
+            SUM(a.total) AS total,
+            SUM(a.active) AS active,
+            SUM(a.todo) AS todo,
+            SUM(a.in_progress) AS in_progress,
+            SUM(a.done) AS done,
+            SUM(a.blocked) AS blocked,
+            SUM(a.progress_sum) AS progress_sum,
+            SUM(COALESCE(o.n, 0)) AS overdue,
+            MAX(p.name) AS project_name
+        FROM task_aggregates a
+        LEFT JOIN overdue o ON o.owner = a.owner AND o.project_key = a.project_key
+        LEFT JOIN projects p ON p.id = a.project_key
+        {where_sql}
+        GROUP BY {key}
+        HAVING SUM(a.total) > 0
+        ORDER BY {key}
+        """,
+        [cutoff, *params],
+    )
+    rows = cur.fetchall()
+    conn.close()
+
+    def to_stats(r) -> TaskStats:
+        return TaskStats(
+            active=r["active"],
+            archived=r["total"] - r["active"],
+            by_status=TaskStatusCounts(
+                todo=r["todo"],
+                in_progress=r["in_progress"],
+                done=r["done"],
+                blocked=r["blocked"],
+            ),
+            overdue=r["overdue"],
+            avg_progress=round(r["progress_sum"] / r["active"], 1) if r["active"] else 0.0,
+        )
+
+    stats: List[TaskStats] = []
+    for r in rows:
+        item = to_stats(r)
+        if group_by == "project":
+            if r["group_key"]:
+                item.project_id = r["group_key"]
+                item.project_name = r["project_name"]
+        else:
+            item.owner = r["group_key"]
+            item.project_id = project_id
+        stats.append(item)
+
+    fields = ("total", "active", "todo", "in_progress", "done", "blocked", "progress_sum", "overdue")
+    totals = to_stats({f: sum(r[f] for r in rows) for f in fields})
+    if project_id is not None:
+        totals.project_id = project_id
+    if owner is not None:
+        totals.owner = owner
+    return stats, totals
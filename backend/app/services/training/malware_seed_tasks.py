@@ -2,14 +2,20 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
+import re
 from datetime import date, timedelta
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Literal, Optional
 
 from pydantic import BaseModel, Field
 
+from app.core.config import settings
 from app.core.llm_client import llm_chat
+from app.core.llm_coalescer import is_llm_error_reply
 from app.schemas.training import MalwareTrainingWeek
+from app.services.llm_cache_store import get_cached_response_async, put_cached_response_async
 
 
 # --- 24-week high-level syllabus for automation ---
@@ -148,45 +154,37 @@ def _fallback_seed_tasks(week_spec: MalwareTrainingWeek, task_count: int) -> Lis
     return fallback[:task_count]
 
 
-async def generate_seed_tasks_for_week(
-    week: int,
-    task_count: int,
-) -> List[SeedTaskDraft]:
-    """
-    Ask Qwen to generate benign, lab-only training tasks for a given week.
-    If anything goes wrong, fall back to a small deterministic set.
-
-    All returned titles are normalized to start with a [WNN] prefix so the
-    frontend can group tasks per week easily.
-    """
-
-    # Look up the week spec
+SEED_TASKS_SYSTEM_PROMPT = (
+    "You are designing training tasks for a DEFENSIVE malware-analysis course "
+    "in a military cyber unit. All work is:\n"
+    "- Lab-only\n"
+    "- Benign payloads only\n"
+    "- Focused on understanding, analysis, documentation, and detection\n"
+    "- NO real-world malicious payloads\n"
+    "- NO instructions for bypassing production security controls\n\n"
+    "You MUST respond with JSON ONLY, no commentary, no markdown, no code fences.\n"
+    "The JSON schema is:\n"
+    "{\n"
+    '  \"tasks\": [\n'
+    "    {\n"
+    '      \"title\": \"short title\",\n'
+    '      \"description\": \"1-3 sentences, defensive/lab-only\",\n'
+    '      \"due_in_days\": 7\n'
+    "    }\n"
+    "  ]\n"
+    "}\n"
+    "Do not include code samples, shell commands, or anything operationally dangerous."
+)
+
+
+def _get_week_spec(week: int) -> MalwareTrainingWeek:
     week_spec = next((w for w in MALWARE_TRAINING_SYLLABUS if w.week == week), None)
     if week_spec is None:
         raise ValueError(f"Unknown training week: {week}")
+    return week_spec
 
-    system_msg = (
-        "You are designing training tasks for a DEFENSIVE malware-analysis course "
-        "in a military cyber unit. All work is:\n"
-        "- Lab-only\n"
-        "- Benign payloads only\n"
-        "- Focused on understanding, analysis, documentation, and detection\n"
-        "- NO real-world malicious payloads\n"
-        "- NO instructions for bypassing production security controls\n\n"
-        "You MUST respond with JSON ONLY, no commentary, no markdown, no code fences.\n"
-        "The JSON schema is:\n"
-        "{\n"
-        '  \"tasks\": [\n'
-        "    {\n"
-        '      \"title\": \"short title\",\n'
-        '      \"description\": \"1-3 sentences, defensive/lab-only\",\n'
-        '      \"due_in_days\": 7\n'
-        "    }\n"
-        "  ]\n"
-        "}\n"
-        "Do not include code samples, shell commands, or anything operationally dangerous."
-    )
 
+def _seed_task_messages(week_spec: MalwareTrainingWeek, task_count: int) -> List[Dict[str, str]]:
     user_msg = (
         "Design weekly training tasks for this malware-analysis syllabus week.\n\n"
         f"Week {week_spec.week}: {week_spec.title}\n"
@@ -196,18 +194,21 @@ async def generate_seed_tasks_for_week(
         f"Generate {task_count} tasks."
     )
 
-    messages = [
-        {"role": "system", "content": system_msg},
+    return [
+        {"role": "system", "content": SEED_TASKS_SYSTEM_PROMPT},
         {"role": "user", "content": user_msg},
     ]
 
-    # ---------- Call LLM ----------
-    try:
-        raw = await llm_chat(messages)
-    except Exception as e:
-        print(f"[training] LLM call failed, falling back: {e}")
-        return _fallback_seed_tasks(week_spec, task_count)
 
+def _parse_seed_drafts(
+    raw: str,
+    week_spec: MalwareTrainingWeek,
+    task_count: int,
+) -> List[SeedTaskDraft]:
+    """
+    Turn an LLM reply into drafts: JSON first, then a bullet list.
+    Returns [] if neither yields any task.
+    """
     drafts: List[SeedTaskDraft] = []
 
     # ---------- 1) Try to extract clean JSON (strip fences, etc.) ----------
@@ -226,8 +227,6 @@ async def generate_seed_tasks_for_week(
 
         # If still not starting with '{', try to find first JSON-looking block
         if not text.lstrip().startswith("{"):
-            import re
-
             m = re.search(r"\{.*\}", text, flags=re.DOTALL)
             if m:
                 text = m.group(0)
@@ -301,7 +300,153 @@ async def generate_seed_tasks_for_week(
         if drafts:
             return drafts[:task_count]
     except Exception as e:
-        print(f"[training] Bullet parsing failed, using static fallback: {e}")
+        print(f"[training] Bullet parsing failed: {e}")
 
-    # ---------- 3) Final deterministic fallback ----------
+    return []
+
+
+async def generate_seed_tasks_for_week(
+    week: int,
+    task_count: int,
+) -> List[SeedTaskDraft]:
+    """
+    Ask Qwen to generate benign, lab-only training tasks for a given week.
+    If anything goes wrong, fall back to a small deterministic set.
+
+    All returned titles are normalized to start with a [WNN] prefix so the
+    frontend can group tasks per week easily.
+    """
+    week_spec = _get_week_spec(week)
+    messages = _seed_task_messages(week_spec, task_count)
+
+    # ---------- Call LLM ----------
+    try:
+        raw = await llm_chat(messages, priority="background")
+    except Exception as e:
+        print(f"[training] LLM call failed, falling back: {e}")
+        return _fallback_seed_tasks(week_spec, task_count)
+
+    drafts = _parse_seed_drafts(raw, week_spec, task_count)
+    if drafts:
+        return drafts
+
+    # ---------- Final deterministic fallback ----------
+    print("[training] No tasks parsed from LLM reply, using static fallback")
     return _fallback_seed_tasks(week_spec, task_count)
+
+
+# ----------------------------------------------------------------------
+# Multi-week generation
+# ----------------------------------------------------------------------
+
+_DRAFT_CACHE_NAMESPACE = "training_seed_drafts"
+
+
+class WeekSeedDrafts(BaseModel):
+    week: int
+    # "cache": stored drafts, "llm": generated now, "fallback": static set
+    # after every attempt failed
+    source: Literal["cache", "llm", "fallback"]
+    attempts: int = 0
+    error: Optional[str] = None
+    drafts: List[SeedTaskDraft]
+
+
+def syllabus_week_hash(week_spec: MalwareTrainingWeek) -> str:
+    """
+    Hash of everything the drafts depend on besides task_count: the week's
+    syllabus entry and the generation prompt.
+    """
+    content = week_spec.model_dump_json() + "\n" + SEED_TASKS_SYSTEM_PROMPT
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def _draft_cache_key(week_spec: MalwareTrainingWeek, task_count: int) -> str:
+    return f"{_DRAFT_CACHE_NAMESPACE}:{week_spec.week}:{task_count}:{syllabus_week_hash(week_spec)}"
+
+
+async def _generate_week_with_retries(
+    week_spec: MalwareTrainingWeek,
+    task_count: int,
+    semaphore: asyncio.Semaphore,
+) -> WeekSeedDrafts:
+    """
+    Call the LLM until it yields parseable drafts, up to
+    TRAINING_SEED_MAX_ATTEMPTS times with exponential backoff. Error replies,
+    exceptions (e.g. a full LLM queue) and unparseable replies all count as
+    failed attempts.
+    """
+    messages = _seed_task_messages(week_spec, task_count)
+    attempts = max(1, settings.TRAINING_SEED_MAX_ATTEMPTS)
+    error: Optional[str] = None
+
+    for attempt in range(1, attempts + 1):
+        if attempt > 1:
+            await asyncio.sleep(settings.TRAINING_SEED_RETRY_BACKOFF_SECONDS * 2 ** (attempt - 2))
+
+        try:
+            async with semaphore:
+                raw = await llm_chat(messages, priority="background")
+        except Exception as e:
+            error = str(e) or type(e).__name__
+            continue
+
+        if is_llm_error_reply(raw):
+            error = raw
+            continue
+
+        drafts = _parse_seed_drafts(raw, week_spec, task_count)
+        if drafts:
+            return WeekSeedDrafts(week=week_spec.week, source="llm", attempts=attempt, drafts=drafts)
+        error = "No tasks could be parsed from the LLM reply"
+
+    print(f"[training] Week {week_spec.week}: giving up after {attempts} attempts, using fallback: {error}")
+    return WeekSeedDrafts(
+        week=week_spec.week,
+        source="fallback",
+        attempts=attempts,
+        error=error,
+        drafts=_fallback_seed_tasks(week_spec, task_count),
+    )
+
+
+async def generate_seed_drafts_for_weeks(
+    weeks: List[int],
+    task_count: int,
+    refresh: bool = False,
+) -> List[WeekSeedDrafts]:
+    """
+    Drafts for several syllabus weeks, in the order given.
+
+    Drafts are cached in the llm_cache table under
+    (week, task_count, syllabus hash), so asking again for the same weeks
+    needs no LLM call until the syllabus or prompt changes. refresh=True
+    ignores the cache and overwrites it. Cache misses are generated
+    concurrently (at most TRAINING_SEED_CONCURRENCY LLM calls in flight),
+    with retries. A week that still fails gets the static fallback drafts,
+    which are not cached.
+    """
+    specs = [_get_week_spec(week) for week in weeks]
+    semaphore = asyncio.Semaphore(max(1, settings.TRAINING_SEED_CONCURRENCY))
+
+    async def one(week_spec: MalwareTrainingWeek) -> WeekSeedDrafts:
+        cache_key = _draft_cache_key(week_spec, task_count)
+
+        if not refresh:
+            cached = await get_cached_response_async(cache_key)
+            if cached is not None:
+                drafts = [SeedTaskDraft(**d) for d in json.loads(cached)]
+                return WeekSeedDrafts(week=week_spec.week, source="cache", drafts=drafts)
+
+        result = await _generate_week_with_retries(week_spec, task_count, semaphore)
+        if result.source == "llm":
+            await put_cached_response_async(
+                cache_key,
+                _DRAFT_CACHE_NAMESPACE,
+                settings.LLM_DEFAULT_MODEL,
+                _seed_task_messages(week_spec, task_count)[1]["content"],
+                json.dumps([d.model_dump() for d in result.drafts]),
+            )
+        return result
+
+    return list(await asyncio.gather(*(one(spec) for spec in specs)))
@@ -1,17 +1,21 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import List
+from typing import IO, Any, Callable, Dict, Iterator, List, Optional, Tuple
 
+import codecs
+import hashlib
 import json
 from fastapi import HTTPException, status
+from pydantic import ValidationError
 
+from app.core.config import settings
+from app.db import get_connection
 from app.schemas.task import TaskCreate, TaskEntry
-from app.services.task_store import add_task
+from app.services.task_store import add_tasks_bulk, add_tasks_bulk_once
 
-# TODO: adjust this path to where your generated seed file actually lives.
-# For your current setup this should be correct:
-TRAINING_TASKS_PATH = Path("/home/llm/devcell-training/export/tasks_seed.json")
+# Seed file written by devcell-training/build_seed_tasks.py (TRAINING_SEED_PATH)
+TRAINING_TASKS_PATH = Path(settings.TRAINING_SEED_PATH)
 
 
 def load_training_seeds(path: Path = TRAINING_TASKS_PATH) -> list[dict]:
@@ -59,16 +63,16 @@ def load_training_seeds(path: Path = TRAINING_TASKS_PATH) -> list[dict]:
     return items
 
 
-def import_training_tasks(owner: str) -> List[TaskEntry]:
+def import_training_tasks(owner: str, path: Path = TRAINING_TASKS_PATH) -> List[TaskEntry]:
     """
     Import all training seed tasks for the given owner.
 
     - Reads devcell-training/export/tasks_seed.json
-    - For each item, maps into TaskCreate and calls add_task(...)
+    - Maps each item into TaskCreate and inserts them all with add_tasks_bulk(...)
     - Returns the list of created TaskEntry objects.
     """
-    seeds = load_training_seeds()
-    created: List[TaskEntry] = []
+    seeds = load_training_seeds(path)
+    payloads: List[TaskCreate] = []
 
     for item in seeds:
         # devcell-training seeds don't have project_id/due_date/origin_standup_id.
@@ -83,9 +87,285 @@ def import_training_tasks(owner: str) -> List[TaskEntry]:
             is_active=item.get("is_active", True),
             origin_standup_id=None,
         )
+        payloads.append(payload)
 
-        # Your existing task_store.add_task(owner, data=TaskCreate)
-        created_task = add_task(owner=owner, data=payload)
-        created.append(created_task)
+    # One transaction for the whole seed file
+    return add_tasks_bulk(owner=owner, items=payloads)
 
-    return created
+
+# ----------------------------------------------------------------------
+# Streaming import (large seed files)
+# ----------------------------------------------------------------------
+
+_READ_CHUNK_BYTES = 64 * 1024
+# Errors kept in the report; the invalid count covers the rest
+_MAX_REPORTED_ERRORS = 50
+
+_JSON_DECODER = json.JSONDecoder()
+
+
+class _JsonStream:
+    """
+    Minimal pull parser over a binary file: whitespace/punctuation handling
+    plus json raw_decode() for whole values, reading more data only when a
+    value is cut off at the end of the buffer.
+    """
+
+    def __init__(self, fh: IO[bytes]):
+        self._fh = fh
+        self._decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        if self._eof:
+            return False
+        chunk = self._fh.read(_READ_CHUNK_BYTES)
+        if not chunk:
+            self._eof = True
+        self._buf = self._buf[self._pos:] + self._decoder.decode(chunk, final=not chunk)
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Next non-whitespace character ('' at end of file)."""
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in " \t\r\n":
+                self._pos += 1
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Seed file is not valid JSON: expected {char!r}, found {found or 'end of file'!r}")
+        self._pos += 1
+
+    def value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                obj, end = _JSON_DECODER.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError as e:
+                if self._fill():
+                    continue
+                raise ValueError(f"Seed file is not valid JSON: {e.msg}") from None
+            # A number ending exactly at the buffer edge may continue in the next chunk
+            if end == len(self._buf) and self._fill():
+                continue
+            self._pos = end
+            return obj
+
+
+def _object_key(stream: _JsonStream) -> str:
+    key = stream.value()
+    if not isinstance(key, str):
+        raise ValueError("Seed file is not valid JSON: object keys must be strings")
+    stream.expect(":")
+    return key
+
+
+def _next_member(stream: _JsonStream) -> bool:
+    """
+    After an object member: consume ',' and return True, or '}' and return False.
+    """
+    if stream.peek() == "}":
+        stream.expect("}")
+        return False
+    stream.expect(",")
+    return True
+
+
+def _iter_json_items(fh: IO[bytes]) -> Iterator[Tuple[str, Any]]:
+    """
+    Yield ("item N", value) for each element of the top-level "items" array
+    (or of a top-level array) without loading the whole document. The rest
+    of the document is checked too, so malformed JSON after the items
+    raises ValueError once they have been yielded.
+    """
+    stream = _JsonStream(fh)
+
+    wrapped = stream.peek() == "{"
+    if wrapped:
+        stream.expect("{")
+        if stream.peek() == "}":
+            raise ValueError("Seed file format invalid: missing 'items' list")
+        while _object_key(stream) != "items":
+            stream.value()  # skip other top-level keys
+            if not _next_member(stream):
+                raise ValueError("Seed file format invalid: missing 'items' list")
+
+    stream.expect("[")
+    if stream.peek() != "]":
+        index = 0
+        while True:
+            yield f"item {index}", stream.value()
+            index += 1
+            if stream.peek() == "]":
+                break
+            stream.expect(",")
+    stream.expect("]")
+
+    if wrapped:
+        while _next_member(stream):
+            _object_key(stream)
+            stream.value()
+    if stream.peek() != "":
+        raise ValueError("Seed file is not valid JSON: unexpected data after the end of the document")
+
+
+def _iter_jsonl_items(fh: IO[bytes]) -> Iterator[Tuple[str, Any]]:
+    """
+    Yield ("line N", value) per non-empty line. A malformed line yields its
+    JSONDecodeError instead of a value so the import can skip it.
+    """
+    for line_no, raw in enumerate(fh, start=1):
+        line = raw.strip()
+        if not line:
+            continue
+        try:
+            yield f"line {line_no}", json.loads(line)
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            yield f"line {line_no}", e
+
+
+def detect_seed_format(filename: str) -> str:
+    return "jsonl" if Path(filename).suffix.lower() in (".jsonl", ".ndjson") else "json"
+
+
+def _import_key(payload: TaskCreate, project_name: Optional[str]) -> str:
+    content = payload.model_dump(mode="json", exclude={"project_id", "origin_standup_id"})
+    content["project_name"] = project_name
+    canonical = json.dumps(content, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class _ProjectLookup:
+    """
+    project_name -> project_id, one query per distinct name. Names that do not
+    exist, or that `can_use` rejects, resolve to None (personal task).
+    """
+
+    def __init__(self, can_use: Optional[Callable[[int], bool]] = None):
+        self._can_use = can_use
+        self._ids: Dict[str, Optional[int]] = {}
+        self.unresolved: Dict[str, int] = {}
+
+    def resolve(self, name: Optional[str]) -> Optional[int]:
+        if not name:
+            return None
+        if name not in self._ids:
+            conn = get_connection()
+            cur = conn.cursor()
+            cur.execute("SELECT id FROM projects WHERE name = ? ORDER BY id LIMIT 1", (name,))
+            row = cur.fetchone()
+            conn.close()
+            project_id = row["id"] if row else None
+            if project_id is not None and self._can_use is not None and not self._can_use(project_id):
+                project_id = None
+            self._ids[name] = project_id
+
+        project_id = self._ids[name]
+        if project_id is None:
+            self.unresolved[name] = self.unresolved.get(name, 0) + 1
+        return project_id
+
+
+def import_training_file(
+    owner: str,
+    fh: IO[bytes],
+    fmt: str = "json",
+    *,
+    total_bytes: Optional[int] = None,
+    batch_size: Optional[int] = None,
+    can_use_project: Optional[Callable[[int], bool]] = None,
+    on_progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> Dict[str, Any]:
+    """
+    Stream seed tasks from `fh` (fmt "json": {"items": [...]} or a top-level
+    array; fmt "jsonl": one object per line) into the owner's tasks.
+
+    - Items are validated against TaskCreate; invalid ones are counted and
+      reported (first 50) and skipped.
+    - project_name maps to project_id through a cached lookup; unknown or
+      non-editable projects (can_use_project) leave the task personal.
+    - Every item gets a content hash, and items already imported for this
+      owner are skipped (add_tasks_bulk_once), so re-running is idempotent.
+    - Valid items are inserted every `batch_size` items, one transaction each;
+      on_progress(report) is called after each batch.
+
+    Only the current batch is held in memory. Malformed JSON in a JSON
+    document raises ValueError (batches already inserted stay); malformed
+    JSONL lines are reported and skipped.
+    """
+    batch_size = max(1, batch_size or settings.TRAINING_IMPORT_BATCH_SIZE)
+    projects = _ProjectLookup(can_use_project)
+    report: Dict[str, Any] = {
+        "format": fmt,
+        "processed": 0,
+        "created": 0,
+        "duplicates": 0,
+        "invalid": 0,
+        "errors": [],
+        "unresolved_projects": {},
+        "bytes_read": 0,
+        "total_bytes": total_bytes,
+    }
+    batch: List[Tuple[str, TaskCreate]] = []
+
+    def invalid(where: str, error: str) -> None:
+        report["invalid"] += 1
+        if len(report["errors"]) < _MAX_REPORTED_ERRORS:
+            report["errors"].append({"at": where, "error": error})
+
+    def flush() -> None:
+        if batch:
+            created, skipped = add_tasks_bulk_once(owner, batch)
+            report["created"] += len(created)
+            report["duplicates"] += skipped
+            batch.clear()
+        report["bytes_read"] = fh.tell()
+        report["unresolved_projects"] = dict(projects.unresolved)
+        if on_progress is not None:
+            on_progress(dict(report))
+
+    items = _iter_jsonl_items(fh) if fmt == "jsonl" else _iter_json_items(fh)
+    for where, item in items:
+        report["processed"] += 1
+
+        if isinstance(item, Exception):
+            invalid(where, f"invalid JSON: {item}")
+            continue
+        if not isinstance(item, dict):
+            invalid(where, "expected a JSON object")
+            continue
+
+        project_name = item.get("project_name")
+        if not isinstance(project_name, str):
+            project_name = None
+        try:
+            # Seeds carry no project_id/origin_standup_id; project comes from project_name
+            payload = TaskCreate(
+                title=item.get("title"),
+                description=item.get("description") or "",
+                status=item.get("status", "todo"),
+                progress=item.get("progress", 0),
+                due_date=item.get("due_date"),
+                is_active=item.get("is_active", True),
+            )
+        except ValidationError as e:
+            invalid(where, "; ".join(
+                f"{'.'.join(str(p) for p in err['loc'])}: {err['msg']}" for err in e.errors()
+            ))
+            continue
+
+        payload.project_id = projects.resolve(project_name)
+        batch.append((_import_key(payload, project_name), payload))
+        if len(batch) >= batch_size:
+            flush()
+
+    flush()
+    return report
@@ -6,9 +6,10 @@ import hashlib
 import secrets
 import sqlite3
 from datetime import datetime, timedelta, timezone
-from typing import Optional, List
+from typing import Any, Dict, Optional, List
 
 from app.db import get_connection
+from app.db_async import run_db
 from app.schemas.user import UserPublic
 from app.core.config import settings
 
@@ -52,6 +53,25 @@ def _row_to_user_public(row: sqlite3.Row) -> UserPublic:
     )
 
 
+def _row_to_user_dict(row: sqlite3.Row) -> Dict[str, Any]:
+    """
+    Plain-dict version of _row_to_user_public for FastJSONResponse list
+    endpoints (same JSON as UserPublic).
+    """
+    return {
+        "username": row["username"],
+        "role": row["role"],
+        "display_name": row["display_name"],
+        "job_title": row["job_title"],
+        "team_name": row["team_name"],
+        "rank": row["rank"],
+        "skills": row["skills"],
+        "is_active": bool(row["is_active"]),
+        "id": row["id"],
+        "created_at": datetime.fromisoformat(row["created_at"]),
+    }
+
+
 SESSION_TTL_HOURS = getattr(settings, "SESSION_TTL_HOURS", 8)
 
 
@@ -104,10 +124,7 @@ def get_user_by_username(username: str) -> Optional[UserPublic]:
     return _row_to_user_public(row)
 
 
-def list_users() -> List[UserPublic]:
-    """
-    Return all users ordered by id.
-    """
+def _select_users() -> List[sqlite3.Row]:
     conn = get_connection()
     cur = conn.cursor()
     cur.execute(
@@ -119,7 +136,21 @@ def list_users() -> List[UserPublic]:
     )
     rows = cur.fetchall()
     conn.close()
-    return [_row_to_user_public(r) for r in rows]
+    return rows
+
+
+def list_users() -> List[UserPublic]:
+    """
+    Return all users ordered by id.
+    """
+    return [_row_to_user_public(r) for r in _select_users()]
+
+
+def list_user_dicts() -> List[Dict[str, Any]]:
+    """
+    list_users() as plain dicts, for FastJSONResponse list endpoints.
+    """
+    return [_row_to_user_dict(r) for r in _select_users()]
 
 
 # ---------------------------------------------------------------------------
@@ -330,6 +361,14 @@ def get_user_by_token(token: str) -> Optional[UserPublic]:
     return user
 
 
+async def get_user_by_token_async(token: str) -> Optional[UserPublic]:
+    """
+    get_user_by_token() for async code (runs on the DB thread pool); used by
+    get_current_user on every authenticated request.
+    """
+    return await run_db(get_user_by_token, token)
+
+
 def list_user_sessions(user_id: int) -> List[dict]:
     """
     List sessions for a user without exposing token values.
@@ -0,0 +1,16 @@
+# backend/tests/conftest.py
+
+import pytest
+
+from app import db
+
+
+@pytest.fixture
+def scratch_db(tmp_path, monkeypatch):
+    """
+    Point get_connection() at a fresh, initialized SQLite file for one test.
+    """
+    path = tmp_path / "devcell-test.db"
+    monkeypatch.setattr(db, "DB_PATH", path)
+    db.init_db()
+    return path
@@ -0,0 +1,68 @@
+# backend/tests/test_agents_queue_full.py
+
+import asyncio
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api.routes import agents
+from app.core import llm_gateway
+from app.core.llm_gateway import LLMGateway
+from app.main import create_app
+from app.services import job_store
+
+
+@pytest.fixture
+def full_gateway(monkeypatch):
+    # One slot, already taken, and no room to queue
+    gateway = LLMGateway(max_concurrency=1, max_queue=0)
+    gateway._active = 1
+    monkeypatch.setattr(llm_gateway, "_gateway", gateway)
+    return gateway
+
+
+def _request(**overrides) -> agents.SdlcDemoRequest:
+    return agents.SdlcDemoRequest(mode="feature", input="Add CSV export", **overrides)
+
+
+def _parse_sse(body: str) -> list:
+    events = []
+    for block in body.split("\n\n"):
+        lines = [line for line in block.splitlines() if not line.startswith(":")]
+        if not lines:
+            continue
+        name = lines[0].removeprefix("event: ")
+        data = json.loads(lines[1].removeprefix("data: "))
+        events.append((name, data))
+    return events
+
+
+def test_sync_run_answers_503_with_retry_after(full_gateway):
+    client = TestClient(create_app())  # no startup events: nothing to index
+
+    response = client.post("/api/agents/sdlc_demo", json={"mode": "feature", "input": "Add CSV export"})
+
+    assert response.status_code == 503
+    assert int(response.headers["retry-after"]) >= 1
+
+
+@pytest.mark.parametrize("execution", ["sequential", "dag"])
+async def test_stream_ends_with_retry_after_error(full_gateway, execution):
+    response = await agents.stream_sdlc_demo(_request(execution=execution))
+    body = "".join([chunk async for chunk in response.body_iterator])
+
+    events = _parse_sse(body)
+    name, data = events[-1]
+    assert name == "error"
+    assert data["retry_after"] >= 1
+    assert not any(n == "agent_finished" for n, _ in events)
+
+
+async def test_job_fails_when_queue_is_full(scratch_db, full_gateway):
+    created = await agents.create_sdlc_demo_job(_request())
+    await asyncio.gather(*list(job_store._running))
+
+    job = job_store.get_job(created.job_id, kind=agents.SDLC_JOB_KIND)
+    assert job.status == "failed"
+    assert job.result is None
@@ -0,0 +1,198 @@
+# backend/tests/test_change_feed.py
+
+from datetime import datetime
+
+import pytest
+
+from app.api.routes.changes import _resume_cursor
+from app.core.config import settings
+from app.schemas.project import ProjectCreate, ProjectUpdate
+from app.schemas.standup import StandupCreate
+from app.schemas.task import TaskCreate, TaskUpdate
+from app.schemas.user import UserPublic
+from app.services.change_feed import ChangeFeedFilter
+from app.services.change_log import change_log_bounds, read_changes, trim_change_log
+from app.services.projects import add_project, delete_project, update_project
+from app.services.projects.members import add_project_member, remove_project_member
+from app.services.standup_store import add_standup
+from app.services.task_store import add_task, delete_task, update_task
+
+USERS = ("olga", "max", "bob", "eve", "root")
+
+
+def _user(username: str) -> UserPublic:
+    role = "admin" if username == "root" else "user"
+    return UserPublic(id=1, username=username, role=role, created_at=datetime.now())
+
+
+@pytest.fixture
+def world(scratch_db):
+    """
+    alpha: owned by olga, max is a member. beta: owned by bob.
+    eve has no projects; root is an admin.
+    """
+    alpha = add_project(ProjectCreate(name="alpha", owner="olga"))
+    beta = add_project(ProjectCreate(name="beta", owner="bob"))
+    add_project_member(alpha.id, "max", "member")
+    return alpha.id, beta.id
+
+
+class Feeds:
+    """
+    One ChangeFeedFilter per user, all reading from the same cursor.
+    """
+
+    def __init__(self):
+        self.filters = {name: ChangeFeedFilter(_user(name)) for name in USERS}
+        self.cursor = change_log_bounds()[1]
+
+    def read(self) -> dict:
+        rows = read_changes(self.cursor)
+        self.cursor = rows[-1]["id"] if rows else self.cursor
+        return {
+            name: [(e["entity"], e["op"], e["id"], e["data"]) for e in feed.events(rows)]
+            for name, feed in self.filters.items()
+        }
+
+
+def _ops(events) -> list:
+    return [(entity, op, entity_id) for entity, op, entity_id, _ in events]
+
+
+def test_project_task_visible_to_viewers_only(world):
+    alpha, _ = world
+    feeds = Feeds()
+
+    task = add_task("max", TaskCreate(title="alpha work", project_id=alpha))
+    events = feeds.read()
+
+    for name in ("olga", "max", "root"):
+        assert _ops(events[name]) == [("task", "insert", task.id)]
+        assert events[name][0][3]["title"] == "alpha work"
+    assert events["bob"] == events["eve"] == []
+
+
+def test_personal_task_visible_to_owner_and_admin(world):
+    feeds = Feeds()
+
+    task = add_task("eve", TaskCreate(title="personal"))
+    update_task(task.id, TaskUpdate(progress=50))
+    events = feeds.read()
+
+    expected = [("task", "insert", task.id), ("task", "update", task.id)]
+    assert _ops(events["eve"]) == _ops(events["root"]) == expected
+    assert events["olga"] == events["max"] == events["bob"] == []
+
+
+def test_task_moved_out_of_view_is_sent_as_delete(world):
+    alpha, beta = world
+    task = add_task("max", TaskCreate(title="alpha work", project_id=alpha))
+    feeds = Feeds()
+
+    update_task(task.id, TaskUpdate(project_id=beta))
+    events = feeds.read()
+
+    # Could see it in alpha, cannot see it in beta
+    assert events["olga"] == events["max"] == [("task", "delete", task.id, None)]
+    # Could not see it before, can now
+    assert _ops(events["bob"]) == [("task", "update", task.id)]
+    assert events["bob"][0][3]["project_id"] == beta
+    assert _ops(events["root"]) == [("task", "update", task.id)]
+    assert events["eve"] == []
+
+    delete_task(task.id)
+    events = feeds.read()
+    assert events["bob"] == events["root"] == [("task", "delete", task.id, None)]
+    assert events["olga"] == events["max"] == events["eve"] == []
+
+
+def test_standups_are_visible_to_everyone(world):
+    feeds = Feeds()
+
+    entry = add_standup(StandupCreate(name="eve", yesterday="y", today="t"))
+    events = feeds.read()
+
+    for name in USERS:
+        assert _ops(events[name]) == [("standup", "insert", entry.id)]
+
+
+def test_removed_member_sees_the_removal_then_nothing(world):
+    alpha, _ = world
+    feeds = Feeds()
+
+    remove_project_member(alpha, "max")
+    events = feeds.read()
+
+    removal = [("project_member", "delete", alpha, None)]
+    assert events["max"] == events["olga"] == events["root"] == removal
+    assert events["bob"] == events["eve"] == []
+
+    task = add_task("olga", TaskCreate(title="after removal", project_id=alpha))
+    update_project(alpha, ProjectUpdate(status="active"))
+    events = feeds.read()
+    assert events["max"] == []
+    assert _ops(events["olga"]) == [("task", "insert", task.id), ("project", "update", alpha)]
+
+
+def test_new_member_sees_membership_and_project(world):
+    _, beta = world
+    feeds = Feeds()
+
+    add_project_member(beta, "eve", "viewer")
+    update_project(beta, ProjectUpdate(name="beta 2"))
+    events = feeds.read()
+
+    assert events["eve"] == [
+        ("project_member", "insert", beta, {"project_id": beta, "username": "eve"}),
+        ("project", "update", beta, events["eve"][1][3]),
+    ]
+    assert events["eve"][1][3]["name"] == "beta 2"
+    assert events["max"] == []
+
+
+def test_deleted_project_reaches_former_viewers(world):
+    alpha, _ = world
+    feeds = Feeds()
+
+    delete_project(alpha)
+    events = feeds.read()
+
+    # Access after the delete no longer includes alpha; access before does
+    for name in ("olga", "max", "root"):
+        assert ("project", "delete", alpha, None) in events[name]
+    assert events["bob"] == events["eve"] == []
+
+
+def test_resume_cursor(scratch_db, monkeypatch):
+    assert _resume_cursor(None) == (0, False)
+
+    ids = []
+    for i in range(5):
+        add_standup(StandupCreate(name=f"user{i}", yesterday="y", today="t"))
+        ids.append(change_log_bounds()[1])
+    latest = ids[-1]
+
+    # Nothing trimmed: resume where the client left off
+    assert _resume_cursor(None) == (latest, False)
+    assert _resume_cursor(0) == (0, False)
+    assert _resume_cursor(ids[1]) == (ids[1], False)
+    assert _resume_cursor(latest) == (latest, False)
+    # An id from another database
+    assert _resume_cursor(latest + 10) == (latest, True)
+
+    monkeypatch.setattr(settings, "CHANGE_FEED_MAX_ROWS", 2)
+    trim_change_log()
+    oldest, _ = change_log_bounds()
+    assert oldest == ids[3]
+
+    # Changes after ids[0] are partly gone; after ids[2] all are still there
+    assert _resume_cursor(0) == (latest, True)
+    assert _resume_cursor(ids[1]) == (latest, True)
+    assert _resume_cursor(ids[2]) == (ids[2], False)
+
+    # Everything trimmed: only a client that saw the latest id is up to date
+    monkeypatch.setattr(settings, "CHANGE_FEED_MAX_ROWS", 0)
+    trim_change_log()
+    assert change_log_bounds() == (None, latest)
+    assert _resume_cursor(latest) == (latest, False)
+    assert _resume_cursor(ids[3]) == (latest, True)
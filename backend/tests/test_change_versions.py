@@ -0,0 +1,81 @@
+# backend/tests/test_change_versions.py
+
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.routes import standup
+from app.schemas.standup import StandupCreate
+from app.services.standup_store import add_standup
+
+
+@pytest.fixture
+def client(scratch_db):
+    app = FastAPI()
+    app.include_router(standup.router, prefix="/api")
+    return TestClient(app)
+
+
+def _add(name: str) -> None:
+    add_standup(StandupCreate(name=name, yesterday="y", today="t"))
+
+
+def _by_date_url(day) -> str:
+    return f"/api/standup/by-date?date={day.isoformat()}"
+
+
+def test_matching_etag_gets_304(client):
+    _add("alice")
+    url = _by_date_url(datetime.utcnow().date())
+
+    first = client.get(url)
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+
+    again = client.get(url, headers={"If-None-Match": etag})
+    assert again.status_code == 304
+    assert again.headers["etag"] == etag
+    assert again.content == b""
+
+
+def test_write_in_same_second_is_not_a_304(client):
+    _add("alice")
+    url = _by_date_url(datetime.utcnow().date())
+    first = client.get(url)
+    assert len(first.json()["items"]) == 1
+
+    # Same second as the first write: a second-resolution date cannot see it
+    _add("bob")
+
+    conditional = client.get(url, headers={"If-None-Match": first.headers["etag"]})
+    assert conditional.status_code == 200
+    assert len(conditional.json()["items"]) == 2
+
+
+def test_if_modified_since_is_not_answered(client):
+    _add("alice")
+    url = _by_date_url(datetime.utcnow().date())
+    first = client.get(url)
+    assert "last-modified" not in first.headers
+
+    _add("bob")
+    since = (datetime.utcnow() + timedelta(days=1)).strftime("%a, %d %b %Y %H:%M:%S GMT")
+    response = client.get(url, headers={"If-Modified-Since": since})
+    assert response.status_code == 200
+    assert len(response.json()["items"]) == 2
+
+
+def test_etag_differs_per_date(client):
+    _add("alice")
+    today = datetime.utcnow().date()
+    first = client.get(_by_date_url(today))
+
+    other_day = client.get(
+        _by_date_url(today - timedelta(days=1)),
+        headers={"If-None-Match": first.headers["etag"]},
+    )
+    assert other_day.status_code == 200
+    assert other_day.json()["items"] == []
+    assert other_day.headers["etag"] != first.headers["etag"]
@@ -0,0 +1,58 @@
+# backend/tests/test_dashboard_visibility.py
+
+from datetime import datetime
+
+import pytest
+
+from app.schemas.project import ProjectCreate
+from app.schemas.standup import StandupCreate
+from app.schemas.task import TaskCreate
+from app.schemas.user import UserPublic
+from app.services import dashboard_service
+from app.services.projects import add_project
+from app.services.projects.members import add_project_member
+from app.services.standup_store import add_standup
+from app.services.task_store import add_task
+
+
+def _user(username: str, role: str = "user") -> UserPublic:
+    return UserPublic(id=1, username=username, role=role, created_at=datetime.utcnow())
+
+
+@pytest.fixture
+def prompts(scratch_db, monkeypatch):
+    sent = []
+
+    async def fake_llm_chat(messages, *args, **kwargs):
+        sent.append(messages[-1]["content"])
+        return "summary"
+
+    monkeypatch.setattr(dashboard_service, "llm_chat", fake_llm_chat)
+    return sent
+
+
+@pytest.fixture
+def workspace(scratch_db):
+    shared = add_project(ProjectCreate(name="Shared", owner="viewer"))
+    secret = add_project(ProjectCreate(name="Secret", owner="alice"))
+    add_project_member(shared.id, "alice", "member")
+
+    add_standup(StandupCreate(name="alice", yesterday="", today="Reversing sample"))
+    add_task("alice", TaskCreate(title="Shared task", project_id=shared.id))
+    add_task("alice", TaskCreate(title="Secret task", project_id=secret.id))
+    add_task("alice", TaskCreate(title="Personal task"))
+
+
+async def test_member_sees_only_visible_tasks(workspace, prompts):
+    await dashboard_service.summarize_dashboard(_user("viewer"), max_age=0)
+
+    prompt = prompts[-1]
+    assert "Shared task" in prompt
+    assert "Personal task" in prompt
+    assert "Secret" not in prompt
+
+
+async def test_admin_sees_all_tasks(workspace, prompts):
+    await dashboard_service.summarize_dashboard(_user("root", role="admin"), max_age=0)
+
+    assert "Secret task" in prompts[-1]
@@ -0,0 +1,90 @@
+# backend/tests/test_embedder_model_key.py
+
+import base64
+
+import numpy as np
+import pytest
+
+from app.services.knowledge import embedder
+from app.services.knowledge.embedding_cache import EmbeddingCache
+
+
+REMOTE_KEY = "remote-model"
+LOCAL_KEY = "local-model"
+
+
+class FakeService:
+    def __init__(self):
+        self.up = True
+        self.model = REMOTE_KEY
+        self.caches = {}
+
+    def __call__(self, payload):
+        if not self.up:
+            raise ConnectionRefusedError("service down")
+        if payload["op"] == "info":
+            return {"model": self.model, "dim": 2}
+        vectors = np.full((len(payload["texts"]), 2), 1.0, dtype="<f4")
+        return {
+            "model": self.model,
+            "dim": 2,
+            "count": len(payload["texts"]),
+            "vectors_b64": base64.b64encode(vectors.tobytes()).decode("ascii"),
+        }
+
+
+@pytest.fixture
+def service(tmp_path, monkeypatch):
+    fake = FakeService()
+
+    monkeypatch.setattr(embedder, "EMBED_SOCKET", "/tmp/devcell-test-embed.sock")
+    monkeypatch.setattr(embedder, "_remote_key", None)
+    monkeypatch.setattr(embedder, "_socket_call", fake)
+    monkeypatch.setattr(embedder, "get_local_model_key", lambda: LOCAL_KEY)
+    monkeypatch.setattr(embedder, "_embed_locally", lambda texts: [[0.0, 2.0] for _ in texts])
+    monkeypatch.setattr(
+        embedder,
+        "get_embedding_cache",
+        lambda key: fake.caches.setdefault(key, EmbeddingCache(tmp_path, key)),
+    )
+    return fake
+
+
+def test_failed_lookup_is_not_cached(service):
+    service.up = False
+    assert embedder.get_embed_model_key() == LOCAL_KEY
+
+    service.up = True
+    assert embedder.get_embed_model_key() == REMOTE_KEY
+
+
+def test_chunks_fall_back_with_local_key(service):
+    assert embedder.embed_chunks(["a"], ["alpha"])[0] == REMOTE_KEY
+
+    service.up = False
+    key, vectors = embedder.embed_chunks(["a", "b"], ["alpha", "beta"])
+
+    # Remote-cached "a" must not be mixed with a locally embedded "b"
+    assert key == LOCAL_KEY
+    assert vectors == {"a": [0.0, 2.0], "b": [0.0, 2.0]}
+    assert service.caches[REMOTE_KEY].get_many(["b"]) == {}
+
+
+def test_service_error_reply_falls_back(service, monkeypatch):
+    def failing(payload):
+        if payload["op"] == "info":
+            return {"model": REMOTE_KEY}
+        raise RuntimeError("Embedding service error: out of memory")
+
+    monkeypatch.setattr(embedder, "_socket_call", failing)
+    assert embedder.embed_texts_keyed(["x"]) == (LOCAL_KEY, [[0.0, 2.0]])
+
+
+def test_model_switch_is_detected(service):
+    assert embedder.get_embed_model_key() == REMOTE_KEY
+    service.model = "other-model"
+
+    key, _ = embedder.embed_texts_keyed(["x"])
+    assert key == LOCAL_KEY
+    # The next batch asks the service again and picks up its new model
+    assert embedder.embed_texts_keyed(["x"])[0] == "other-model"
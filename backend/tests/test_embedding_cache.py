@@ -0,0 +1,83 @@
+# backend/tests/test_embedding_cache.py
+
+import json
+
+import numpy as np
+
+from app.services.knowledge.embedding_cache import EmbeddingCache
+
+
+def _vectors(names) -> dict:
+    return {name: [float(i), float(len(name)), 0.5] for i, name in enumerate(names)}
+
+
+def test_round_trip_and_other_instances_see_writes(tmp_path):
+    cache = EmbeddingCache(tmp_path, "model-a")
+    other = EmbeddingCache(tmp_path, "model-a")  # e.g. another worker process
+
+    first = _vectors(["a", "bb"])
+    cache.put_many(first)
+    assert other.get_many(["a", "bb", "missing"]) == first
+
+    # Already cached hashes are not appended again
+    cache.put_many({"a": [9.0, 9.0, 9.0], "ccc": [1.0, 2.0, 3.0]})
+    assert cache.vectors_path.stat().st_size == 3 * 3 * 4
+    assert other.get_many(["a", "ccc"]) == {"a": first["a"], "ccc": [1.0, 2.0, 3.0]}
+
+    assert other.hits == 4 and other.misses == 1
+    assert cache.stats()["entries"] == 3 and cache.stats()["dim"] == 3
+
+
+def test_writes_only_add_index_rows(tmp_path, monkeypatch):
+    cache = EmbeddingCache(tmp_path, "model-a")
+    cache.put_many(_vectors([f"h{i}" for i in range(200)]))
+
+    written = []
+    original = cache._connect
+
+    def tracing_connect():
+        conn = original()
+        conn.set_trace_callback(written.append)
+        return conn
+
+    monkeypatch.setattr(cache, "_connect", tracing_connect)
+    cache.put_many(_vectors(["new"]))
+
+    inserts = [s for s in written if s.startswith("INSERT OR REPLACE INTO rows")]
+    assert len(inserts) == 1
+    assert cache.get_many(["new", "h0"]).keys() == {"new", "h0"}
+
+
+def test_dimension_change_starts_over(tmp_path):
+    cache = EmbeddingCache(tmp_path, "model-a")
+    cache.put_many(_vectors(["a", "b"]))
+
+    cache.put_many({"c": [1.0] * 5})
+
+    assert cache.get_many(["a", "b", "c"]) == {"c": [1.0] * 5}
+    assert cache.stats()["dim"] == 5 and cache.stats()["entries"] == 1
+
+
+def test_partial_row_from_a_crash_is_dropped(tmp_path):
+    cache = EmbeddingCache(tmp_path, "model-a")
+    cache.put_many(_vectors(["a"]))
+    with cache.vectors_path.open("ab") as f:
+        f.write(b"\x00\x00")  # half-written row, no index entry
+
+    cache.put_many({"b": [4.0, 5.0, 6.0]})
+
+    assert cache.get_many(["a", "b"]) == {"a": _vectors(["a"])["a"], "b": [4.0, 5.0, 6.0]}
+
+
+def test_legacy_json_index_is_imported(tmp_path):
+    model_dir = tmp_path / "model-a"
+    model_dir.mkdir()
+    np.asarray([[1, 2], [3, 4]], dtype=np.float32).tofile(model_dir / "vectors.f32")
+    (model_dir / "index.json").write_text(
+        json.dumps({"version": 1, "model": "model-a", "dim": 2, "rows": {"x": 0, "y": 1, "gone": 7}})
+    )
+
+    cache = EmbeddingCache(tmp_path, "model-a")
+
+    assert cache.get_many(["x", "y", "gone"]) == {"x": [1.0, 2.0], "y": [3.0, 4.0]}
+    assert not (model_dir / "index.json").exists()
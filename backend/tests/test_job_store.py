@@ -0,0 +1,56 @@
+# backend/tests/test_job_store.py
+
+import os
+import subprocess
+import sys
+
+from app.db import get_connection
+from app.services import job_store
+
+
+def _insert_job(job_id: str, owner, status: str = "running") -> None:
+    conn = get_connection()
+    conn.execute(
+        """
+        INSERT INTO background_jobs (id, kind, status, request_json, created_at, updated_at, owner)
+        VALUES (?, 'test', ?, '{}', '2026-01-01T00:00:00', '2026-01-01T00:00:00', ?)
+        """,
+        (job_id, status, owner),
+    )
+    conn.commit()
+    conn.close()
+
+
+def _status(job_id: str) -> str:
+    return job_store.get_job(job_id).status
+
+
+def _exited_pid() -> int:
+    proc = subprocess.Popen([sys.executable, "-c", "pass"])
+    proc.wait()
+    return proc.pid
+
+
+def test_live_owner_jobs_are_kept(scratch_db):
+    job = job_store.create_job("test", {})
+    _insert_job("other-worker", job_store._OWNER)
+
+    assert job_store.fail_interrupted_jobs() == 0
+    assert _status(job.id) == "queued"
+    assert _status("other-worker") == "running"
+
+
+def test_jobs_of_exited_or_unknown_owners_fail(scratch_db):
+    boot_id = job_store._BOOT_ID
+    _insert_job("exited", f"{boot_id}:{_exited_pid()}:1")
+    _insert_job("reused-pid", f"{boot_id}:{os.getpid()}:1")
+    _insert_job("other-boot", f"not-this-boot:{os.getpid()}:")
+    _insert_job("legacy", None, status="queued")
+    _insert_job("done", None, status="succeeded")
+
+    assert job_store.fail_interrupted_jobs() == 4
+    for job_id in ("exited", "reused-pid", "other-boot", "legacy"):
+        job = job_store.get_job(job_id)
+        assert job.status == "failed"
+        assert job.error == "Interrupted by server restart"
+    assert _status("done") == "succeeded"
@@ -0,0 +1,135 @@
+# backend/tests/test_knowledge_indexer_model.py
+
+import pytest
+
+from app.services.knowledge import client, indexer, manifest
+
+
+class FakeEmbedder:
+    """
+    Deterministic embed_chunks() stand-in: the vector dimension depends on
+    the model key, so mixing models shows up as mixed dimensions.
+    """
+
+    def __init__(self, model_key: str):
+        self.model_key = model_key
+        self.fallback = None  # model used from the next embed call on
+        self.embedded = []
+
+    def current_key(self) -> str:
+        return self.model_key
+
+    def embed_chunks(self, chunk_hashes, texts):
+        if self.fallback:
+            # The service went away after the key was read
+            self.model_key, self.fallback = self.fallback, None
+        dim = len(self.model_key)
+        self.embedded.extend(chunk_hashes)
+        return self.model_key, {h: [1.0] * dim for h in chunk_hashes}
+
+
+@pytest.fixture
+def kb(tmp_path, monkeypatch):
+    knowledge_dir = tmp_path / "knowledgebase"
+    knowledge_dir.mkdir()
+    monkeypatch.setattr(indexer, "KNOWLEDGE_DIR", knowledge_dir)
+    monkeypatch.setattr(manifest, "KNOWLEDGE_DIR", knowledge_dir)
+    monkeypatch.setattr(manifest, "MANIFEST_PATH", knowledge_dir / ".manifest.json")
+    monkeypatch.setattr(client, "CHROMA_DIR", tmp_path / "chroma")
+    monkeypatch.setattr(client, "_client", None)
+    monkeypatch.setattr(client, "_collection", None)
+
+    fake = FakeEmbedder("model-a")
+    monkeypatch.setattr(indexer, "get_embed_model_key", fake.current_key)
+    monkeypatch.setattr(indexer, "embed_chunks", fake.embed_chunks)
+    fake.dir = knowledge_dir
+    return fake
+
+
+def _write_doc(kb, name: str, paragraphs: int):
+    path = kb.dir / name
+    text = "\n\n".join(
+        " ".join(f"Paragraph {i} sentence {j} covers unpacking and triage." for j in range(20))
+        for i in range(paragraphs)
+    )
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+def _dimensions():
+    result = client.get_collection().get(include=["embeddings"])
+    return {len(v) for v in result["embeddings"]}
+
+
+def test_model_change_rebuilds_collection(kb):
+    _write_doc(kb, "a.md", 6)
+    _write_doc(kb, "b.md", 3)
+    indexer.index_files_in_knowledgebase()
+    assert _dimensions() == {len("model-a")}
+
+    kb.model_key = "model-bbbb"
+    stats = indexer.index_files_in_knowledgebase()
+
+    assert stats["embedded"] == stats["chunks"] > 0
+    assert _dimensions() == {len("model-bbbb")}
+    data = manifest.load_manifest()
+    assert data["embed_model"] == "model-bbbb"
+    assert {d["embed_model"] for d in data["documents"].values()} == {"model-bbbb"}
+
+
+def test_unchanged_file_is_skipped_only_for_same_model(kb):
+    path = _write_doc(kb, "a.md", 6)
+    indexer.index_single_file(path)
+    assert indexer.index_single_file(path)["embedded"] == 0
+
+    # Entry recorded by another model (same dimension, e.g. another backend):
+    # every chunk is re-embedded
+    kb.model_key = "model-b"
+    stats = indexer.index_single_file(path)
+    assert stats["embedded"] == stats["chunks"]
+    assert manifest.load_manifest()["documents"][str(path)]["embed_model"] == "model-b"
+
+
+def test_fallback_mid_pass_rebuilds_collection(kb):
+    _write_doc(kb, "a.md", 6)
+    _write_doc(kb, "b.md", 3)
+    indexer.index_files_in_knowledgebase()
+
+    # Edit one file, then have the embedder fall back to a model of another dimension
+    path = kb.dir / "a.md"
+    path.write_text(path.read_text(encoding="utf-8") + "\n\nNew paragraph about packers.", encoding="utf-8")
+    kb.fallback = "local-aaaa"
+    stats = indexer.index_files_in_knowledgebase()
+
+    assert stats["embedded"] == stats["chunks"]
+    assert _dimensions() == {len("local-aaaa")}
+    data = manifest.load_manifest()
+    assert data["embed_model"] == "local-aaaa"
+    assert {d["embed_model"] for d in data["documents"].values()} == {"local-aaaa"}
+
+
+def test_upload_after_model_change_reindexes_everything(kb):
+    _write_doc(kb, "a.md", 6)
+    indexer.index_files_in_knowledgebase()
+
+    kb.model_key = "model-bbbb"
+    uploaded = _write_doc(kb, "upload.md", 3)
+    stats = indexer.index_single_file(uploaded)
+
+    # Not just the upload: a.md must be in the rebuilt collection too
+    assert stats["files"] == 2
+    assert _dimensions() == {len("model-bbbb")}
+    paths = {m["path"] for m in client.get_collection().get(include=["metadatas"])["metadatas"]}
+    assert paths == {str(kb.dir / "a.md"), str(uploaded)}
+
+
+def test_fallback_during_upload_does_not_mix_dimensions(kb):
+    _write_doc(kb, "a.md", 6)
+    indexer.index_files_in_knowledgebase()
+
+    kb.fallback = "local-aaaa"
+    uploaded = _write_doc(kb, "upload.md", 3)
+    indexer.index_single_file(uploaded)
+
+    assert _dimensions() == {len("local-aaaa")}
+    assert manifest.load_manifest()["embed_model"] == "local-aaaa"
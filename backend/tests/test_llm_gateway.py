@@ -0,0 +1,160 @@
+# backend/tests/test_llm_gateway.py
+
+import asyncio
+
+import pytest
+
+from app.core.llm_gateway import LLMGateway, LLMQueueFullError
+
+
+async def _settle() -> None:
+    # Let woken tasks run up to their next await
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+async def _hold(gateway: LLMGateway, priority: str, name: str, order: list, release: asyncio.Event):
+    async with gateway.slot(priority):
+        order.append(name)
+        await release.wait()
+
+
+async def test_waiters_are_served_by_priority_then_fifo():
+    gateway = LLMGateway(max_concurrency=1, max_queue=10)
+    order: list = []
+    gates = {}
+
+    def start(priority: str, name: str) -> asyncio.Task:
+        gates[name] = asyncio.Event()
+        return asyncio.create_task(_hold(gateway, priority, name, order, gates[name]))
+
+    tasks = [start("default", "holder")]
+    await _settle()
+    for priority, name in [
+        ("background", "bg-1"),
+        ("default", "default-1"),
+        ("interactive", "ui-1"),
+        ("background", "bg-2"),
+        ("interactive", "ui-2"),
+    ]:
+        tasks.append(start(priority, name))
+        await _settle()
+    assert gateway.stats()["queued"] == 5
+
+    # Release slots one by one in admission order
+    for _ in range(6):
+        gates[order[-1]].set()
+        await _settle()
+    await asyncio.gather(*tasks)
+
+    assert order == ["holder", "ui-1", "ui-2", "default-1", "bg-1", "bg-2"]
+    stats = gateway.stats()
+    assert stats["active"] == 0 and stats["queued"] == 0
+    assert stats["priorities"]["interactive"]["admitted"] == 2
+
+
+async def test_released_slot_is_handed_to_waiter_not_newcomer():
+    gateway = LLMGateway(max_concurrency=1, max_queue=10)
+    order: list = []
+    holder_done, waiter_done, newcomer_done = asyncio.Event(), asyncio.Event(), asyncio.Event()
+
+    holder = asyncio.create_task(_hold(gateway, "default", "holder", order, holder_done))
+    await _settle()
+    waiter = asyncio.create_task(_hold(gateway, "background", "waiter", order, waiter_done))
+    await _settle()
+
+    holder_done.set()
+    # A newcomer arriving before the woken waiter runs must still queue
+    newcomer = asyncio.create_task(_hold(gateway, "interactive", "newcomer", order, newcomer_done))
+    await _settle()
+
+    assert order == ["holder", "waiter"]
+    assert gateway.stats()["active"] == 1
+    assert gateway.stats()["queued"] == 1
+
+    waiter_done.set()
+    newcomer_done.set()
+    await asyncio.gather(holder, waiter, newcomer)
+    assert order == ["holder", "waiter", "newcomer"]
+    assert gateway.stats()["active"] == 0
+
+
+async def test_cancelled_waiter_is_skipped():
+    gateway = LLMGateway(max_concurrency=1, max_queue=10)
+    order: list = []
+    gates = {name: asyncio.Event() for name in ("holder", "gone", "next")}
+
+    holder = asyncio.create_task(_hold(gateway, "default", "holder", order, gates["holder"]))
+    await _settle()
+    gone = asyncio.create_task(_hold(gateway, "interactive", "gone", order, gates["gone"]))
+    nxt = asyncio.create_task(_hold(gateway, "background", "next", order, gates["next"]))
+    await _settle()
+
+    gone.cancel()
+    await _settle()
+    assert gateway.stats()["queued"] == 1
+
+    gates["holder"].set()
+    gates["next"].set()
+    await asyncio.gather(holder, nxt)
+    with pytest.raises(asyncio.CancelledError):
+        await gone
+
+    assert order == ["holder", "next"]
+    assert gateway.stats()["active"] == 0 and gateway.stats()["queued"] == 0
+
+
+async def test_slot_handed_to_cancelled_waiter_is_passed_on():
+    gateway = LLMGateway(max_concurrency=1, max_queue=10)
+    order: list = []
+    gates = {name: asyncio.Event() for name in ("unlucky", "next")}
+
+    held = gateway.slot("default")
+    await held.__aenter__()
+    unlucky = asyncio.create_task(_hold(gateway, "interactive", "unlucky", order, gates["unlucky"]))
+    nxt = asyncio.create_task(_hold(gateway, "default", "next", order, gates["next"]))
+    await _settle()
+
+    # Hand the slot over, then cancel the waiter before it gets to run
+    await held.__aexit__(None, None, None)
+    unlucky.cancel()
+    gates["next"].set()
+
+    await nxt
+    with pytest.raises(asyncio.CancelledError):
+        await unlucky
+
+    assert order == ["next"]
+    assert gateway.stats()["active"] == 0 and gateway.stats()["queued"] == 0
+
+
+async def test_full_queue_rejects_with_retry_after():
+    gateway = LLMGateway(max_concurrency=1, max_queue=2)
+    order: list = []
+    release = asyncio.Event()
+
+    tasks = [asyncio.create_task(_hold(gateway, "default", f"t{i}", order, release)) for i in range(3)]
+    await _settle()
+    assert gateway.stats()["active"] == 1 and gateway.stats()["queued"] == 2
+
+    with pytest.raises(LLMQueueFullError) as excinfo:
+        async with gateway.slot("background"):
+            pass
+    assert excinfo.value.retry_after >= 1
+    assert gateway.stats()["priorities"]["background"]["rejected"] == 1
+
+    release.set()
+    await asyncio.gather(*tasks)
+    assert gateway.stats()["active"] == 0
+
+
+async def test_slot_is_released_when_the_call_fails():
+    gateway = LLMGateway(max_concurrency=1, max_queue=0)
+
+    with pytest.raises(RuntimeError):
+        async with gateway.slot("interactive"):
+            raise RuntimeError("upstream error")
+
+    async with gateway.slot("interactive"):
+        assert gateway.stats()["active"] == 1
+    assert gateway.stats()["active"] == 0
@@ -0,0 +1,135 @@
+# backend/tests/test_project_permissions.py
+
+from datetime import datetime
+
+import pytest
+from fastapi import HTTPException
+
+from app.schemas.project import ProjectCreate
+from app.schemas.task import TaskCreate
+from app.schemas.user import UserPublic
+from app.services import project_permissions
+from app.services.project_permissions import ProjectAccess, require_project_edit
+from app.services.projects import add_project
+from app.services.projects.members import add_project_member
+from app.services.task_store import add_task
+
+MISSING = 9999
+
+
+def _user(username: str, role: str = "user") -> UserPublic:
+    return UserPublic(id=1, username=username, role=role, created_at=datetime.now())
+
+
+@pytest.fixture
+def projects(scratch_db):
+    """
+    alpha: owned by olga; vic is a viewer, max a member, oscar a membership 'owner'.
+    beta: owned by bob, no members.
+    """
+    alpha = add_project(ProjectCreate(name="alpha", owner="olga"))
+    beta = add_project(ProjectCreate(name="beta", owner="bob"))
+    add_project_member(alpha.id, "vic", "viewer")
+    add_project_member(alpha.id, "max", "member")
+    add_project_member(alpha.id, "oscar", "owner")
+    return alpha.id, beta.id
+
+
+def _status(call) -> int:
+    with pytest.raises(HTTPException) as excinfo:
+        call()
+    return excinfo.value.status_code
+
+
+@pytest.mark.parametrize(
+    "username, view, edit, owner",
+    [
+        ("olga", True, True, True),  # canonical project.owner, no membership row
+        ("oscar", True, True, False),  # 'owner' role is not the canonical owner
+        ("max", True, True, False),
+        ("vic", True, False, False),
+        ("eve", False, False, False),
+    ],
+)
+def test_project_roles(projects, username, view, edit, owner):
+    alpha, _ = projects
+    access = ProjectAccess(_user(username))
+
+    assert access.can_view(alpha) is view
+    assert access.can_edit(alpha) is edit
+    assert access.is_project_owner(alpha) is owner
+
+    for allowed, require in (
+        (view, access.require_view),
+        (view, access.require_membership),
+        (edit, access.require_edit),
+        (owner, access.require_owner),
+    ):
+        if allowed:
+            assert require(alpha).name == "alpha"
+        else:
+            assert _status(lambda: require(alpha)) == 403
+
+
+def test_missing_project_is_404_before_403(projects):
+    for user in (_user("eve"), _user("olga"), _user("root", role="admin")):
+        access = ProjectAccess(user)
+        for require in (access.require_view, access.require_edit, access.require_owner):
+            assert _status(lambda: require(MISSING)) == 404
+    assert _status(lambda: require_project_edit(MISSING, _user("eve"))) == 404
+
+
+def test_viewable_project_ids(projects):
+    alpha, beta = projects
+
+    assert ProjectAccess(_user("vic")).viewable_project_ids() == [alpha]
+    assert ProjectAccess(_user("bob")).viewable_project_ids() == [beta]
+    assert ProjectAccess(_user("eve")).viewable_project_ids() == []
+    # Admins see every project, not just the ones they own or joined
+    assert ProjectAccess(_user("root", role="admin")).viewable_project_ids() == [alpha, beta]
+
+
+def test_admin_can_do_everything(projects):
+    alpha, beta = projects
+    access = ProjectAccess(_user("root", role="admin"))
+
+    for project_id in (alpha, beta):
+        assert access.can_view(project_id) and access.can_edit(project_id)
+        assert access.require_owner(project_id).id == project_id
+    assert access.role(alpha) is None
+
+
+def test_can_edit_task(projects):
+    alpha, beta = projects
+    personal = add_task("max", TaskCreate(title="personal"))
+    on_alpha = add_task("olga", TaskCreate(title="alpha work", project_id=alpha))
+    on_beta = add_task("bob", TaskCreate(title="beta work", project_id=beta))
+
+    # Personal tasks: only their owner (and admins), whatever the projects
+    assert ProjectAccess(_user("max")).can_edit_task(personal)
+    assert not ProjectAccess(_user("olga")).can_edit_task(personal)
+    assert ProjectAccess(_user("root", role="admin")).can_edit_task(personal)
+
+    # Project tasks follow project edit rights, not the task owner
+    assert ProjectAccess(_user("max")).can_edit_task(on_alpha)
+    assert not ProjectAccess(_user("vic")).can_edit_task(on_alpha)
+    assert not ProjectAccess(_user("max")).can_edit_task(on_beta)
+    assert ProjectAccess(_user("root", role="admin")).can_edit_task(on_beta)
+
+
+def test_checks_use_one_load(projects, monkeypatch):
+    alpha, beta = projects
+    calls = []
+    real = project_permissions.list_project_access_for_user
+    monkeypatch.setattr(
+        project_permissions,
+        "list_project_access_for_user",
+        lambda username: calls.append(username) or real(username),
+    )
+    monkeypatch.setattr(project_permissions, "get_project_by_id", lambda pid: calls.append(pid))
+
+    access = ProjectAccess(_user("max"))
+    for _ in range(3):
+        access.require_edit(alpha)
+        assert not access.can_view(beta)
+    assert calls == ["max"]
@@ -0,0 +1,88 @@
+# backend/tests/test_summary_cache.py
+
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from app.schemas.standup import StandupEntry
+from app.schemas.task import TaskEntry
+from app.services import llm_cache_store
+from app.services.project_summary import build_project_summary_messages, complete_project_summary
+from app.services.standup_summary import build_standup_summary_messages, complete_standup_summary
+
+PAST = date.today() - timedelta(days=3)
+
+
+@pytest.fixture
+def llm_calls(scratch_db, monkeypatch):
+    calls = []
+
+    async def fake_llm_chat(messages, model=None, **kwargs):
+        calls.append(messages)
+        return f"summary #{len(calls)}"
+
+    monkeypatch.setattr(llm_cache_store, "llm_chat", fake_llm_chat)
+    return calls
+
+
+def _standup(today: str = "Ship the importer") -> StandupEntry:
+    return StandupEntry(
+        id=1,
+        name="alice",
+        yesterday="Reviewed PRs",
+        today=today,
+        blockers="",
+        created_at=datetime.combine(PAST, datetime.min.time()),
+        project_id=7,
+        project_name="Importer",
+    )
+
+
+def _tasks(progress: int) -> dict:
+    now = datetime.now()
+    task = TaskEntry(
+        id=1,
+        owner="alice",
+        title="CSV import",
+        status="in_progress",
+        progress=progress,
+        project_id=7,
+        project_name="Importer",
+        is_active=True,
+        created_at=now,
+        updated_at=now,
+    )
+    return {"alice": [task]}
+
+
+async def test_past_team_summary_survives_task_edits(llm_calls):
+    standups = [_standup()]
+
+    first = build_standup_summary_messages(PAST, standups, _tasks(10))
+    edited = build_standup_summary_messages(PAST, standups, _tasks(60))
+    assert first != edited
+
+    assert await complete_standup_summary(first, PAST, standups) == "summary #1"
+    assert await complete_standup_summary(edited, PAST, standups) == "summary #1"
+    assert len(llm_calls) == 1
+
+
+async def test_past_team_summary_misses_when_standups_change(llm_calls):
+    standups = [_standup()]
+    changed = [_standup(today="Ship the exporter")]
+
+    await complete_standup_summary(build_standup_summary_messages(PAST, standups, {}), PAST, standups)
+    await complete_standup_summary(build_standup_summary_messages(PAST, changed, {}), PAST, changed)
+    assert len(llm_calls) == 2
+
+
+async def test_past_project_summary_survives_task_edits(llm_calls):
+    entries = [_standup()]
+
+    for progress in (10, 60):
+        messages = build_project_summary_messages("Importer", entries, PAST, _tasks(progress), 7)
+        assert await complete_project_summary(messages, PAST, 7, "Importer", entries) == "summary #1"
+
+    # Same standups under another project are a different summary
+    messages = build_project_summary_messages("Exporter", entries, PAST, _tasks(10), 8)
+    assert await complete_project_summary(messages, PAST, 8, "Exporter", entries) == "summary #2"
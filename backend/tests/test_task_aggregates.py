@@ -0,0 +1,157 @@
+# backend/tests/test_task_aggregates.py
+
+import random
+
+from app import db
+from app.db import get_connection
+
+
+OWNERS = ["alice", "bob", "carol"]
+PROJECTS = [None, 1, 2]
+STATUSES = ["todo", "in_progress", "done", "blocked"]
+DUE_DATES = [None, "2026-01-10", "2026-01-11", "2026-02-01"]
+
+
+def _random_values(rng: random.Random) -> dict:
+    return {
+        "owner": rng.choice(OWNERS),
+        "project_id": rng.choice(PROJECTS),
+        "status": rng.choice(STATUSES),
+        "progress": rng.randint(0, 100),
+        "due_date": rng.choice(DUE_DATES),
+        "is_active": rng.choice([0, 1, 1]),
+    }
+
+
+def _aggregates(cur) -> dict:
+    cur.execute(
+        """
+        SELECT owner, project_key, total, active, todo, in_progress, done, blocked, progress_sum
+        FROM task_aggregates
+        """
+    )
+    rows = {}
+    for r in cur.fetchall():
+        values = tuple(r)[2:]
+        if any(values):
+            rows[(r["owner"], r["project_key"])] = values
+        else:
+            assert values == (0,) * 7
+    return rows
+
+
+def _recount(cur) -> dict:
+    cur.execute(
+        """
+        SELECT owner, COALESCE(project_id, 0) AS project_key,
+               COUNT(*),
+               SUM(is_active = 1),
+               SUM(is_active = 1 AND status = 'todo'),
+               SUM(is_active = 1 AND status = 'in_progress'),
+               SUM(is_active = 1 AND status = 'done'),
+               SUM(is_active = 1 AND status = 'blocked'),
+               SUM(CASE WHEN is_active = 1 THEN progress ELSE 0 END)
+        FROM tasks
+        GROUP BY owner, COALESCE(project_id, 0)
+        """
+    )
+    return {(r[0], r[1]): tuple(r)[2:] for r in cur.fetchall()}
+
+
+def _due_aggregates(cur) -> dict:
+    cur.execute("SELECT owner, project_key, due_date, open_count FROM task_due_aggregates")
+    rows = {(r[0], r[1], r[2]): r[3] for r in cur.fetchall()}
+    assert all(count > 0 for count in rows.values())
+    return rows
+
+
+def _due_recount(cur) -> dict:
+    cur.execute(
+        """
+        SELECT owner, COALESCE(project_id, 0), due_date, COUNT(*)
+        FROM tasks
+        WHERE is_active = 1 AND status != 'done' AND due_date IS NOT NULL
+        GROUP BY owner, COALESCE(project_id, 0), due_date
+        """
+    )
+    return {(r[0], r[1], r[2]): r[3] for r in cur.fetchall()}
+
+
+def _assert_consistent(cur) -> None:
+    assert _aggregates(cur) == _recount(cur)
+    assert _due_aggregates(cur) == _due_recount(cur)
+
+
+def test_triggers_match_recount_after_random_writes(scratch_db):
+    rng = random.Random(46)
+    conn = get_connection()
+    cur = conn.cursor()
+    ids = []
+
+    for step in range(600):
+        action = rng.random()
+        if action < 0.4 or not ids:
+            v = _random_values(rng)
+            cur.execute(
+                """
+                INSERT INTO tasks (owner, title, status, project_id, progress, due_date,
+                                   is_active, created_at, updated_at)
+                VALUES (?, 't', ?, ?, ?, ?, ?, 'now', 'now')
+                """,
+                (v["owner"], v["status"], v["project_id"], v["progress"], v["due_date"], v["is_active"]),
+            )
+            ids.append(cur.lastrowid)
+        elif action < 0.85:
+            # Change a random subset of columns, including owner and project moves
+            v = _random_values(rng)
+            columns = rng.sample(sorted(v), rng.randint(1, len(v)))
+            cur.execute(
+                f"UPDATE tasks SET {', '.join(f'{c} = ?' for c in columns)} WHERE id = ?",
+                [v[c] for c in columns] + [rng.choice(ids)],
+            )
+        else:
+            task_id = ids.pop(rng.randrange(len(ids)))
+            cur.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
+
+        if step % 50 == 0:
+            _assert_consistent(cur)
+
+    conn.commit()
+    _assert_consistent(cur)
+
+    # Multi-row statements fire the triggers once per row
+    cur.execute("UPDATE tasks SET status = 'done', progress = 100 WHERE owner = 'alice'")
+    cur.execute("UPDATE tasks SET is_active = 0 WHERE project_id = 2")
+    cur.execute("DELETE FROM tasks WHERE owner = 'bob'")
+    conn.commit()
+    _assert_consistent(cur)
+    conn.close()
+
+
+def test_startup_rebuild_matches_triggers(scratch_db):
+    conn = get_connection()
+    cur = conn.cursor()
+    cur.executemany(
+        """
+        INSERT INTO tasks (owner, title, status, project_id, progress, due_date,
+                           is_active, created_at, updated_at)
+        VALUES (?, 't', ?, ?, 40, ?, 1, 'now', 'now')
+        """,
+        [(o, s, p, d) for o in OWNERS for s in STATUSES for p in PROJECTS for d in DUE_DATES],
+    )
+    conn.commit()
+    by_triggers = (_aggregates(cur), _due_aggregates(cur))
+
+    # Drift (e.g. rows written before the triggers existed) is repaired on start
+    cur.execute("UPDATE task_aggregates SET total = total + 5")
+    cur.execute("DELETE FROM task_due_aggregates")
+    conn.commit()
+    conn.close()
+
+    db.init_db()
+
+    conn = get_connection()
+    cur = conn.cursor()
+    assert (_aggregates(cur), _due_aggregates(cur)) == by_triggers
+    _assert_consistent(cur)
+    conn.close()
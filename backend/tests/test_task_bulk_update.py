@@ -0,0 +1,130 @@
+# backend/tests/test_task_bulk_update.py
+
+import sqlite3
+from datetime import datetime
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.routes import tasks
+from app.db import get_connection
+from app.schemas.project import ProjectCreate
+from app.schemas.task import TaskCreate, TaskUpdate
+from app.schemas.user import UserPublic
+from app.services.auth_service import get_current_user
+from app.services.projects import add_project
+from app.services.projects.members import add_project_member
+from app.services.task_store import add_task, bulk_update_tasks, get_task_by_id, update_task
+
+
+@pytest.fixture
+def world(scratch_db):
+    """
+    alpha: max is a member; beta: max is a viewer.
+    """
+    alpha = add_project(ProjectCreate(name="alpha", owner="olga"))
+    beta = add_project(ProjectCreate(name="beta", owner="olga"))
+    add_project_member(alpha.id, "max", "member")
+    add_project_member(beta.id, "max", "viewer")
+    return alpha.id, beta.id
+
+
+def _client(username: str) -> TestClient:
+    app = FastAPI()
+    app.include_router(tasks.router, prefix="/api")
+    user = UserPublic(id=1, username=username, role="user", created_at=datetime.now())
+    app.dependency_overrides[get_current_user] = lambda: user
+    return TestClient(app)
+
+
+def test_per_task_outcomes(world):
+    alpha, beta = world
+    mine = add_task("max", TaskCreate(title="personal"))
+    on_alpha = add_task("olga", TaskCreate(title="alpha work", project_id=alpha))
+    on_beta = add_task("olga", TaskCreate(title="beta work", project_id=beta))
+    theirs = add_task("olga", TaskCreate(title="olga's personal"))
+
+    response = _client("max").post(
+        "/api/tasks/bulk_update",
+        json={
+            "task_ids": [mine.id, on_alpha.id, on_beta.id, theirs.id, 9999, mine.id],
+            "update": {"status": "blocked"},
+        },
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "updated": 2,
+        "results": {
+            str(mine.id): "updated",
+            str(on_alpha.id): "updated",
+            str(on_beta.id): "forbidden",
+            str(theirs.id): "forbidden",
+            "9999": "not_found",
+        },
+    }
+    assert get_task_by_id(mine.id).status == get_task_by_id(on_alpha.id).status == "blocked"
+    assert get_task_by_id(on_beta.id).status == get_task_by_id(theirs.id).status == "todo"
+
+
+@pytest.mark.parametrize("target, status_code", [("beta", 403), ("missing", 404)])
+def test_target_project_must_be_editable(world, target, status_code):
+    alpha, beta = world
+    task = add_task("max", TaskCreate(title="alpha work", project_id=alpha))
+    project_id = {"beta": beta, "missing": 9999}[target]
+
+    response = _client("max").post(
+        "/api/tasks/bulk_update",
+        json={"task_ids": [task.id], "update": {"project_id": project_id}},
+    )
+
+    assert response.status_code == status_code
+    assert get_task_by_id(task.id).project_id == alpha
+
+
+@pytest.mark.parametrize(
+    "initial, update",
+    [
+        (("todo", 30), {"status": "done"}),
+        (("todo", 30), {"status": "done", "progress": 80}),
+        (("done", 100), {"progress": 40}),
+        (("done", 100), {"progress": 40, "status": "blocked"}),
+        (("in_progress", 50), {"progress": 100}),
+        (("blocked", 10), {"title": "renamed", "is_active": False}),
+    ],
+)
+def test_normalization_matches_update_task(scratch_db, initial, update):
+    status, progress = initial
+    single = add_task("max", TaskCreate(title="t", status=status, progress=progress))
+    bulk = add_task("max", TaskCreate(title="t", status=status, progress=progress))
+
+    expected = update_task(single.id, TaskUpdate(**update))
+    assert bulk_update_tasks([bulk.id], TaskUpdate(**update)) == {bulk.id: "updated"}
+    actual = get_task_by_id(bulk.id)
+
+    for field in ("title", "status", "progress", "is_active", "project_id"):
+        assert getattr(actual, field) == getattr(expected, field)
+
+
+def test_writes_are_one_transaction(scratch_db):
+    ids = [add_task("max", TaskCreate(title=f"t{i}")).id for i in range(3)]
+
+    # Make the write of the last task fail after the others were updated
+    conn = get_connection()
+    conn.execute(
+        f"""
+        CREATE TRIGGER fail_update BEFORE UPDATE ON tasks
+        WHEN NEW.id = {ids[-1]}
+        BEGIN
+            SELECT RAISE(ABORT, 'write failed');
+        END
+        """
+    )
+    conn.commit()
+    conn.close()
+
+    with pytest.raises(sqlite3.IntegrityError):
+        bulk_update_tasks(ids, TaskUpdate(status="done"))
+
+    assert [get_task_by_id(i).status for i in ids] == ["todo"] * 3
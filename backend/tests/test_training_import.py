@@ -0,0 +1,103 @@
+# backend/tests/test_training_import.py
+
+import io
+import json
+
+import pytest
+
+from app.schemas.project import ProjectCreate
+from app.services import training_import
+from app.services.projects import add_project
+from app.services.task_store import list_tasks
+
+ITEMS = [
+    {"title": "Unpack UPX sample", "progress": 100, "status": "done", "project_name": "Malware"},
+    {"title": "Résumé of packer families — 日本語 ✓", "description": "x" * 40, "progress": 7},
+    {"title": "Write triage notes", "tags": ["a", {"nested": [1, 2.5, None, True]}], "is_active": False},
+]
+
+
+def _json(items=ITEMS, **extra) -> bytes:
+    return json.dumps({"version": 2, "items": items, **extra}, ensure_ascii=False).encode("utf-8")
+
+
+def _parse(raw: bytes) -> list:
+    return [value for _, value in training_import._iter_json_items(io.BytesIO(raw))]
+
+
+@pytest.mark.parametrize("chunk_bytes", [1, 2, 3, 7, 64 * 1024])
+def test_values_split_across_buffer_edges(monkeypatch, chunk_bytes):
+    monkeypatch.setattr(training_import, "_READ_CHUNK_BYTES", chunk_bytes)
+
+    assert _parse(_json()) == ITEMS
+    assert _parse(b"\xef\xbb\xbf" + json.dumps(ITEMS).encode("utf-8")) == ITEMS
+    # A number at the very end of a buffer must not be cut short
+    assert _parse(b'{"items": [12345, 678]}') == [12345, 678]
+    assert _parse(b'{"items": []}') == []
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        b'{"a": 1 "items": [{"title": "x"}]}',
+        b'{"a": 1, "items": [{"title": "x"}] "b": 2}',
+        b'{"items": [{"title": "x"}], "b": 2,}',
+        b'{"items": [{"title": "x"} {"title": "y"}]}',
+        b'{"items": [{"title": "x"},]}',
+        b'{1: 2, "items": []}',
+        b'{"items": [{"title": "x"}]',
+        b'{"items": [{"title": "x"}]} trailing',
+        b'[{"title": "x"}] [{"title": "y"}]',
+        b'{"a": 1}',
+        b"{}",
+    ],
+)
+def test_malformed_documents_raise(monkeypatch, raw):
+    monkeypatch.setattr(training_import, "_READ_CHUNK_BYTES", 3)
+
+    with pytest.raises(ValueError):
+        _parse(raw)
+
+
+def test_json_import_creates_tasks_and_maps_projects(scratch_db):
+    project = add_project(ProjectCreate(name="Malware", owner="max"))
+
+    report = training_import.import_training_file("max", io.BytesIO(_json()), "json", batch_size=2)
+
+    assert (report["processed"], report["created"], report["invalid"]) == (3, 3, 0)
+    tasks = {t.title: t for t in list_tasks(owner="max", active_only=False)}
+    assert tasks["Unpack UPX sample"].project_id == project.id
+    assert tasks["Write triage notes"].is_active is False
+
+
+def test_jsonl_bad_lines_are_reported_and_skipped(scratch_db):
+    lines = [
+        json.dumps({"title": "first"}),
+        "",
+        '{"title": "broken",',
+        json.dumps(["not", "an", "object"]),
+        json.dumps({"description": "no title"}),
+        json.dumps({"title": "last", "progress": 500}),
+        json.dumps({"title": "second"}),
+    ]
+    raw = "\n".join(lines).encode("utf-8")
+
+    report = training_import.import_training_file("max", io.BytesIO(raw), "jsonl")
+
+    assert (report["processed"], report["created"], report["invalid"]) == (6, 2, 4)
+    assert [e["at"] for e in report["errors"]] == ["line 3", "line 4", "line 5", "line 6"]
+    assert report["errors"][0]["error"].startswith("invalid JSON")
+    assert sorted(t.title for t in list_tasks(owner="max")) == ["first", "second"]
+
+
+def test_reimport_skips_duplicates(scratch_db):
+    items = ITEMS + [ITEMS[0]]  # repeated within the file too
+
+    first = training_import.import_training_file("max", io.BytesIO(_json(items)), "json", batch_size=2)
+    again = training_import.import_training_file("max", io.BytesIO(_json(items)), "json")
+    other_owner = training_import.import_training_file("eve", io.BytesIO(_json(items)), "json")
+
+    assert (first["created"], first["duplicates"]) == (3, 1)
+    assert (again["created"], again["duplicates"]) == (0, 4)
+    assert other_owner["created"] == 3
+    assert len(list_tasks(owner="max", active_only=False)) == 3
@@ -0,0 +1,153 @@
+# scripts/benchmark_embedders.py
+"""
+Compare knowledge embedder backends on CPU: load time, sentences/second and
+retrieval agreement with the full-precision baseline.
+
+Recall@k is measured against the baseline backend: for each query we take the
+baseline's top-k nearest chunks and count how many the candidate backend also
+returns in its top-k. 1.0 means the quantized/ONNX model retrieves exactly the
+same chunks.
+
+Usage (from repo root):
+    python scripts/benchmark_embedders.py
+    python scripts/benchmark_embedders.py --backends torch,torch-int8,onnx-int8 --threads 4 --output bench.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "backend")))
+
+import numpy as np  # noqa: E402
+
+from app.services.knowledge.chunking import chunk_text_window  # noqa: E402
+from app.services.knowledge.config import KNOWLEDGE_DIR  # noqa: E402
+from app.services.knowledge.embedder import EMBED_MODEL_NAME, load_embedder  # noqa: E402
+
+
+def _load_corpus(root: Path, limit: int) -> List[str]:
+    chunks: List[str] = []
+    for path in sorted(root.rglob("*")):
+        if path.suffix.lower() not in {".md", ".txt"} or not path.is_file():
+            continue
+        chunks.extend(chunk_text_window(path.read_text(encoding="utf-8", errors="ignore")))
+    return chunks[:limit]
+
+
+def _queries_from_corpus(chunks: List[str], count: int) -> List[str]:
+    # First sentence of evenly spaced chunks: realistic short questions about the corpus
+    step = max(1, len(chunks) // max(count, 1))
+    return [c.split(". ")[0][:200] for c in chunks[::step][:count]]
+
+
+def _top_k(doc_vecs: np.ndarray, query_vecs: np.ndarray, k: int) -> np.ndarray:
+    scores = query_vecs @ doc_vecs.T
+    return np.argsort(-scores, axis=1)[:, :k]
+
+
+def run_backend(
+    backend: str,
+    model_name: str,
+    threads: int,
+    corpus: List[str],
+    queries: List[str],
+    batch_size: int,
+    repeat: int = 1,
+) -> Dict[str, Any]:
+    t0 = time.perf_counter()
+    model = load_embedder(model_name, backend=backend, threads=threads, warmup=True)
+    load_s = time.perf_counter() - t0
+
+    # Only the timing is repeated; recall uses the vectors of one pass over
+    # the corpus, so no chunk appears twice in the rankings.
+    t1 = time.perf_counter()
+    for _ in range(repeat):
+        doc_vecs = np.asarray(
+            model.encode(corpus, batch_size=batch_size, normalize_embeddings=True, show_progress_bar=False),
+            dtype=np.float32,
+        )
+    encode_s = time.perf_counter() - t1
+
+    query_vecs = np.asarray(
+        model.encode(queries, batch_size=batch_size, normalize_embeddings=True, show_progress_bar=False),
+        dtype=np.float32,
+    )
+
+    return {
+        "backend": backend,
+        "load_seconds": round(load_s, 3),
+        "encode_seconds": round(encode_s, 3),
+        "sentences_per_second": round(len(corpus) * repeat / encode_s, 1) if encode_s > 0 else None,
+        "_doc_vecs": doc_vecs,
+        "_query_vecs": query_vecs,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--backends", default="torch,torch-int8,onnx,onnx-int8")
+    parser.add_argument("--model", default=EMBED_MODEL_NAME)
+    parser.add_argument("--threads", type=int, default=0)
+    parser.add_argument("--corpus-dir", type=Path, default=KNOWLEDGE_DIR)
+    parser.add_argument("--max-chunks", type=int, default=2000)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=1, help="Encode the corpus N times for steadier throughput numbers (recall is unaffected)")
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--k", type=int, default=5)
+    parser.add_argument("--output", type=Path, help="Write JSON results to this file")
+    args = parser.parse_args()
+
+    corpus = _load_corpus(args.corpus_dir, args.max_chunks)
+    if not corpus:
+        sys.exit(f"No .md/.txt content found under {args.corpus_dir}")
+    queries = _queries_from_corpus(corpus, args.queries)
+    repeat = max(args.repeat, 1)
+
+    backends = [b.strip() for b in args.backends.split(",") if b.strip()]
+    results: List[Dict[str, Any]] = []
+    baseline = None
+
+    for backend in backends:
+        try:
+            res = run_backend(backend, args.model, args.threads, corpus, queries, args.batch_size, repeat)
+        except Exception as e:
+            results.append({"backend": backend, "error": str(e)})
+            print(f"[skip] {backend}: {e}", file=sys.stderr)
+            continue
+
+        if baseline is None:
+            baseline = res
+
+        base_top = _top_k(baseline["_doc_vecs"], baseline["_query_vecs"], args.k)
+        cand_top = _top_k(res["_doc_vecs"], res["_query_vecs"], args.k)
+        overlap = [len(set(b) & set(c)) / args.k for b, c in zip(base_top, cand_top)]
+        res["recall_at_k_vs_baseline"] = round(float(np.mean(overlap)), 4)
+        res["baseline"] = baseline["backend"]
+
+        results.append({k: v for k, v in res.items() if not k.startswith("_")})
+
+    report = {
+        "model": args.model,
+        "threads": args.threads,
+        "corpus_chunks": len(corpus),
+        "repeat": repeat,
+        "queries": len(queries),
+        "k": args.k,
+        "results": results,
+    }
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
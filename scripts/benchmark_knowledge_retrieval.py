@@ -0,0 +1,315 @@
+# scripts/benchmark_knowledge_retrieval.py
+"""
+Benchmark knowledge retrieval speed and quality end to end.
+
+Builds a synthetic corpus (or copies an existing one) into a scratch
+knowledgebase, runs index_files_in_knowledgebase() and a labelled query set
+through query_knowledge(), and reports:
+
+  - indexing throughput (files/s, chunks/s) for a cold and a no-change pass
+  - query latency p50 / p95 / p99
+  - peak RSS of the process
+  - recall@k and MRR against the labelled answers
+
+The synthetic corpus plants one unique fact per document and asks one
+question per fact, so the relevant document for every query is known.
+
+A real corpus can be used with --corpus-dir and --queries, where the queries
+file is a JSON list of {"query": "...", "relevant": ["file-stem", ...]}.
+
+Output is JSON. Pass --baseline with an earlier report to fail (exit 1) on
+quality or latency regressions.
+
+Usage (from repo root):
+    python scripts/benchmark_knowledge_retrieval.py --docs 200 --output bench.json
+    python scripts/benchmark_knowledge_retrieval.py --docs 200 --baseline bench.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import resource
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "backend")))
+
+import numpy as np  # noqa: E402
+
+
+SYSTEMS = [
+    "artifact registry", "build farm", "crash triage queue", "sensor gateway",
+    "malware sandbox", "ticket bridge", "log shipper", "signing service",
+    "firmware lab", "packet recorder", "symbol server", "release portal",
+]
+ACTIONS = [
+    "rollback procedure", "on-call escalation", "credential rotation",
+    "backup restore", "capacity review", "patch window",
+]
+PEOPLE = [
+    "Avery", "Blake", "Casey", "Devon", "Emerson", "Finley", "Harper",
+    "Jordan", "Kendall", "Logan", "Morgan", "Parker", "Quinn", "Riley",
+]
+FILLER = [
+    "The team reviews open items every sprint and records decisions in the tracker.",
+    "Configuration changes are peer reviewed before they are merged to main.",
+    "Monitoring dashboards show queue depth, error rate and latency for each service.",
+    "New developers pair with a mentor for the first two weeks on the project.",
+    "Test fixtures are regenerated whenever the upstream schema changes.",
+    "Runbooks live next to the code so they are versioned with the service.",
+    "Incidents are summarized in a blameless review within five working days.",
+    "Access requests must name a sponsor and an expiry date.",
+    "Nightly jobs archive build artifacts older than thirty days.",
+    "Alerts that fire without action are tuned or removed at the next review.",
+]
+
+
+def _percentile(values: List[float], pct: float) -> Optional[float]:
+    if not values:
+        return None
+    return round(float(np.percentile(values, pct)), 2)
+
+
+def _max_rss_mb() -> float:
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(rss / divisor, 1)
+
+
+def build_synthetic_corpus(root: Path, docs: int, paragraphs: int, seed: int) -> List[Dict[str, Any]]:
+    """
+    Write `docs` markdown files under root/{docs,notes}/ and return the
+    labelled query set. Each file carries one planted fact; its question
+    is answered only by that file.
+    """
+    rng = random.Random(seed)
+    queries: List[Dict[str, Any]] = []
+
+    for i in range(docs):
+        system = f"{rng.choice(SYSTEMS)} {i:04d}"
+        action = rng.choice(ACTIONS)
+        person = rng.choice(PEOPLE)
+        extension = rng.randint(1000, 9999)
+        stem = f"doc-{i:05d}"
+        folder = "notes" if i % 3 == 0 else "docs"
+
+        body: List[str] = [f"# {system.title()} handbook", ""]
+        fact_at = rng.randrange(paragraphs)
+        for p in range(paragraphs):
+            sentences = rng.sample(FILLER, k=min(4, len(FILLER)))
+            if p == fact_at:
+                sentences.insert(
+                    rng.randrange(len(sentences) + 1),
+                    f"The {action} for the {system} is owned by {person}, reachable at extension {extension}.",
+                )
+            body.append(" ".join(sentences))
+            body.append("")
+
+        path = root / folder / f"{stem}.md"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("\n".join(body), encoding="utf-8")
+
+        queries.append(
+            {
+                "query": f"Who owns the {action} for the {system}?",
+                "relevant": [stem],
+            }
+        )
+
+    return queries
+
+
+def _ranked_stems(sources: List[Any]) -> List[str]:
+    # query_knowledge returns one entry per context window; a file can appear
+    # more than once, so rank distinct files by first appearance.
+    seen: List[str] = []
+    for src in sources:
+        stem = src.title
+        if stem not in seen:
+            seen.append(stem)
+    return seen
+
+
+def run_queries(queries: List[Dict[str, Any]], k: int, warmup: int) -> Dict[str, Any]:
+    from app.services.knowledge import query_knowledge
+
+    for q in queries[:warmup]:
+        query_knowledge(q["query"], top_k=k)
+
+    latencies_ms: List[float] = []
+    recalls: List[float] = []
+    reciprocal_ranks: List[float] = []
+
+    for q in queries:
+        t0 = time.perf_counter()
+        sources = query_knowledge(q["query"], top_k=k)
+        latencies_ms.append((time.perf_counter() - t0) * 1000.0)
+
+        relevant = set(q["relevant"])
+        ranked = _ranked_stems(sources)[:k]
+        found = relevant.intersection(ranked)
+        recalls.append(len(found) / len(relevant) if relevant else 0.0)
+
+        rr = 0.0
+        for rank, stem in enumerate(ranked, start=1):
+            if stem in relevant:
+                rr = 1.0 / rank
+                break
+        reciprocal_ranks.append(rr)
+
+    return {
+        "queries": len(queries),
+        "k": k,
+        "latency_ms": {
+            "p50": _percentile(latencies_ms, 50),
+            "p95": _percentile(latencies_ms, 95),
+            "p99": _percentile(latencies_ms, 99),
+            "mean": round(float(np.mean(latencies_ms)), 2) if latencies_ms else None,
+        },
+        "recall_at_k": round(float(np.mean(recalls)), 4) if recalls else None,
+        "mrr": round(float(np.mean(reciprocal_ranks)), 4) if reciprocal_ranks else None,
+    }
+
+
+def run_indexing() -> Dict[str, Any]:
+    from app.services.knowledge import index_files_in_knowledgebase
+
+    t0 = time.perf_counter()
+    cold = index_files_in_knowledgebase()
+    cold_s = time.perf_counter() - t0
+
+    t1 = time.perf_counter()
+    warm = index_files_in_knowledgebase()
+    warm_s = time.perf_counter() - t1
+
+    return {
+        "files": cold["files"],
+        "chunks": cold["chunks"],
+        "embedded": cold["embedded"],
+        "cold_seconds": round(cold_s, 3),
+        "files_per_second": round(cold["files"] / cold_s, 1) if cold_s > 0 else None,
+        "chunks_per_second": round(cold["chunks"] / cold_s, 1) if cold_s > 0 else None,
+        "unchanged_seconds": round(warm_s, 3),
+        "unchanged_embedded": warm["embedded"],
+    }
+
+
+def compare_to_baseline(
+    report: Dict[str, Any],
+    baseline: Dict[str, Any],
+    max_quality_drop: float,
+    max_latency_increase: float,
+) -> List[str]:
+    """
+    Return human-readable regressions (empty list = pass).
+    """
+    failures: List[str] = []
+    cur_q, base_q = report["query"], baseline.get("query", {})
+
+    for metric in ("recall_at_k", "mrr"):
+        cur, base = cur_q.get(metric), base_q.get(metric)
+        if cur is not None and base is not None and cur < base - max_quality_drop:
+            failures.append(f"{metric} dropped from {base} to {cur}")
+
+    cur_p95 = cur_q.get("latency_ms", {}).get("p95")
+    base_p95 = base_q.get("latency_ms", {}).get("p95")
+    if cur_p95 is not None and base_p95:
+        limit = base_p95 * (1.0 + max_latency_increase)
+        if cur_p95 > limit:
+            failures.append(f"p95 latency rose from {base_p95}ms to {cur_p95}ms (limit {limit:.2f}ms)")
+
+    return failures
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--docs", type=int, default=100, help="Synthetic documents to generate")
+    parser.add_argument("--paragraphs", type=int, default=6, help="Paragraphs per synthetic document")
+    parser.add_argument("--seed", type=int, default=13)
+    parser.add_argument("--corpus-dir", type=Path, help="Use an existing corpus instead of a synthetic one")
+    parser.add_argument("--queries", type=Path, help="Labelled queries JSON (required with --corpus-dir)")
+    parser.add_argument("--max-queries", type=int, default=0, help="Limit the query set (0 = all)")
+    parser.add_argument("--k", type=int, default=4)
+    parser.add_argument("--warmup", type=int, default=3, help="Untimed queries before measuring")
+    parser.add_argument("--work-dir", type=Path, help="Scratch directory (default: a temp dir, removed afterwards)")
+    parser.add_argument("--output", type=Path, help="Write JSON results to this file")
+    parser.add_argument("--baseline", type=Path, help="Earlier report to compare against")
+    parser.add_argument("--max-quality-drop", type=float, default=0.02)
+    parser.add_argument("--max-latency-increase", type=float, default=0.25, help="Allowed p95 increase as a fraction")
+    args = parser.parse_args()
+
+    if args.corpus_dir and not args.queries:
+        parser.error("--corpus-dir requires --queries")
+
+    work_dir = args.work_dir or Path(tempfile.mkdtemp(prefix="devcell-kb-bench-"))
+    knowledge_dir = work_dir / "knowledgebase"
+    if knowledge_dir.exists():
+        shutil.rmtree(knowledge_dir)
+
+    # Point the knowledge service at the scratch dir before it is imported.
+    os.environ["KNOWLEDGE_DIR"] = str(knowledge_dir)
+    os.environ["KNOWLEDGE_CHROMA_DIR"] = str(work_dir / "chroma_store")
+    os.environ["KNOWLEDGE_EMBEDDING_CACHE_DIR"] = str(work_dir / "embedding_cache")
+    for sub in ("chroma_store", "embedding_cache"):
+        shutil.rmtree(work_dir / sub, ignore_errors=True)
+
+    try:
+        if args.corpus_dir:
+            shutil.copytree(args.corpus_dir, knowledge_dir, ignore=shutil.ignore_patterns(".manifest.json"))
+            queries = json.loads(args.queries.read_text(encoding="utf-8"))
+            corpus_desc: Dict[str, Any] = {"source": str(args.corpus_dir)}
+        else:
+            knowledge_dir.mkdir(parents=True, exist_ok=True)
+            queries = build_synthetic_corpus(knowledge_dir, args.docs, args.paragraphs, args.seed)
+            corpus_desc = {"source": "synthetic", "docs": args.docs, "paragraphs": args.paragraphs, "seed": args.seed}
+
+        if args.max_queries > 0:
+            queries = queries[: args.max_queries]
+
+        from app.services.knowledge.embedder import get_embed_model_key
+
+        indexing = run_indexing()
+        rss_after_index = _max_rss_mb()
+        query_stats = run_queries(queries, args.k, args.warmup)
+
+        report: Dict[str, Any] = {
+            "model": get_embed_model_key(),
+            "corpus": corpus_desc,
+            "indexing": indexing,
+            "query": query_stats,
+            "memory": {
+                "max_rss_mb_after_index": rss_after_index,
+                "max_rss_mb": _max_rss_mb(),
+            },
+        }
+    finally:
+        if not args.work_dir:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    failures: List[str] = []
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        failures = compare_to_baseline(report, baseline, args.max_quality_drop, args.max_latency_increase)
+        report["baseline"] = {"path": str(args.baseline), "regressions": failures}
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    print(text)
+
+    if failures:
+        for failure in failures:
+            print(f"[regression] {failure}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+# scripts/benchmark_list_serialization.py
+"""
+Microbenchmark list endpoint serialization: Pydantic models vs the fast path.
+
+Fills a scratch SQLite database with N tasks, standups, projects and users,
+then serves each listing through a throwaway FastAPI app in two ways:
+
+  - "model": store function returning Pydantic models, wrapped in the list
+    model and returned with response_model (the previous route behaviour:
+    per-row validation, then FastAPI's dump/validate/encode of the response)
+  - "fast": *_dicts store function returned as FastJSONResponse (orjson when
+    installed)
+
+Each variant is requested --repeat times through TestClient. The report
+gives the median latency, response size and whether both bodies decode to
+the same JSON. The real database is never touched: DEVCELL_DB_PATH points at
+a temporary file.
+
+Usage (from repo root):
+    python scripts/benchmark_list_serialization.py
+    python scripts/benchmark_list_serialization.py --rows 10000 --repeat 5 --output bench.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "backend")))
+
+STATUSES = ["todo", "in_progress", "done", "blocked"]
+
+
+def fill_database(rows: int) -> None:
+    from app.db import get_connection
+
+    now = datetime.now()
+    conn = get_connection()
+    cur = conn.cursor()
+    cur.executemany(
+        "INSERT INTO projects (name, description, owner, status, created_at) VALUES (?, ?, ?, ?, ?)",
+        [
+            (f"Project {i}", f"Synthetic project {i}", f"user{i % 50}", "active",
+             (now - timedelta(minutes=i)).isoformat())
+            for i in range(rows)
+        ],
+    )
+    cur.executemany(
+        """
+        INSERT INTO tasks (owner, title, description, status, project_id, progress,
+                           due_date, is_active, created_at, updated_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, 1, ?, ?)
+        """,
+        [
+            (
+                "bench",
+                f"Task {i}: analyse sample {i % 97}",
+                f"Document findings for sample {i}. " * 3,
+                STATUSES[i % 4],
+                (i % 40) + 1 if i % 3 else None,
+                (i * 7) % 100,
+                (date.today() + timedelta(days=i % 30)).isoformat() if i % 2 else None,
+                (now - timedelta(seconds=i)).isoformat(),
+                now.isoformat(),
+            )
+            for i in range(rows)
+        ],
+    )
+    today = datetime.utcnow().replace(hour=12, minute=0, second=0, microsecond=0)
+    cur.executemany(
+        "INSERT INTO standups (name, yesterday, today, blockers, created_at, project_id) VALUES (?, ?, ?, ?, ?, ?)",
+        [
+            (f"user{i % 50}", "Reviewed PRs", f"Working on item {i}", "" if i % 5 else "Waiting on lab",
+             (today - timedelta(seconds=i % 40000)).isoformat(timespec="seconds"), (i % 40) + 1)
+            for i in range(rows)
+        ],
+    )
+    cur.executemany(
+        """
+        INSERT INTO users (username, password_hash, role, created_at, display_name, is_active)
+        VALUES (?, 'x', 'user', ?, ?, 1)
+        """,
+        [
+            (f"bench-user-{i}", datetime.now(timezone.utc).isoformat(), f"User {i}")
+            for i in range(rows)
+        ],
+    )
+    conn.commit()
+    conn.close()
+
+
+def build_app():
+    from fastapi import FastAPI
+
+    from app.core.fast_json import FastJSONResponse
+    from app.schemas.project import ProjectList
+    from app.schemas.standup import StandupList
+    from app.schemas.task import TaskList
+    from app.schemas.user import UserList
+    from app.services.projects import list_project_dicts, list_projects
+    from app.services.standup_store import get_standups_for_date, list_standup_dicts_for_date
+    from app.services.task_store import list_task_dicts, list_tasks
+    from app.services.user_store import list_user_dicts, list_users
+
+    bench = FastAPI()
+    listings: Dict[str, tuple] = {
+        "tasks": (TaskList, lambda: list_tasks(owner="bench"), lambda: list_task_dicts(owner="bench")),
+        "standups": (
+            StandupList,
+            lambda: get_standups_for_date(datetime.utcnow().date()),
+            lambda: list_standup_dicts_for_date(datetime.utcnow().date()),
+        ),
+        "projects": (ProjectList, list_projects, list_project_dicts),
+        "users": (UserList, list_users, list_user_dicts),
+    }
+
+    def add_routes(name: str, list_model, model_fn: Callable, dict_fn: Callable) -> None:
+        @bench.get(f"/model/{name}", response_model=list_model)
+        def model_route():
+            return list_model(items=model_fn())
+
+        @bench.get(f"/fast/{name}", response_model=list_model)
+        def fast_route():
+            return FastJSONResponse({"items": dict_fn()})
+
+    for name, (list_model, model_fn, dict_fn) in listings.items():
+        add_routes(name, list_model, model_fn, dict_fn)
+
+    return bench, list(listings)
+
+
+def timed_get(client, url: str, repeat: int):
+    timings = []
+    response = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        response = client.get(url)
+        timings.append(time.perf_counter() - start)
+        response.raise_for_status()
+    return statistics.median(timings), response
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=10000, help="Rows per table")
+    parser.add_argument("--repeat", type=int, default=5, help="Requests per variant (median reported)")
+    parser.add_argument("--output", type=Path, help="Write JSON results to this file")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="devcell-list-bench-") as tmp:
+        os.environ["DEVCELL_DB_PATH"] = str(Path(tmp) / "bench.db")
+
+        from fastapi.testclient import TestClient
+
+        from app.core import fast_json
+        from app.db import init_db
+
+        init_db()
+        fill_database(args.rows)
+        bench, names = build_app()
+        client = TestClient(bench)
+
+        results: Dict[str, Any] = {}
+        for name in names:
+            model_s, model_resp = timed_get(client, f"/model/{name}", args.repeat)
+            fast_s, fast_resp = timed_get(client, f"/fast/{name}", args.repeat)
+            results[name] = {
+                "rows": len(fast_resp.json()["items"]),
+                "model_ms": round(model_s * 1000, 1),
+                "fast_ms": round(fast_s * 1000, 1),
+                "speedup": round(model_s / fast_s, 1) if fast_s else None,
+                "bytes": len(fast_resp.content),
+                "identical_json": model_resp.json() == fast_resp.json(),
+            }
+
+    report = {
+        "rows": args.rows,
+        "repeat": args.repeat,
+        "encoder": "orjson" if fast_json.orjson is not None else "json",
+        "listings": results,
+    }
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+# scripts/benchmark_loop_lag.py
+"""
+Measure event loop lag caused by SQLite calls in async code.
+
+Fills a scratch SQLite database with N standups, then runs the same workload
+on an event loop watched by app.core.loop_monitor.LoopLagMonitor, twice:
+
+  - "blocking": async handlers call the plain store functions directly (the
+    previous behaviour of the dashboard, summaries, auth and training routes)
+  - "async": the same handlers await the *_async wrappers, which run the
+    store function on the DB thread pool (app.db_async.run_db)
+
+Each round starts --concurrency handlers; every handler reads today's
+standups and inserts a small batch of tasks. With --lock-ms, a separate
+connection holds the database write lock for that long at the start of each
+round, as a long write from another worker would: blocking inserts then wait
+on the lock with the loop stuck.
+
+The report gives wall time and the monitor's p50/p99/max lag and stall count
+per variant. The async variant still shows some lag: building model rows in
+the DB threads is Python work that competes for the GIL. The real database
+is never touched: DEVCELL_DB_PATH points at a temporary file.
+
+Usage (from repo root):
+    python scripts/benchmark_loop_lag.py
+    python scripts/benchmark_loop_lag.py --rows 2000 --rounds 10 --lock-ms 300 --output lag.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "backend")))
+
+
+def fill_database(rows: int) -> None:
+    from app.db import get_connection
+
+    today = datetime.utcnow().replace(hour=12, minute=0, second=0, microsecond=0)
+    conn = get_connection()
+    conn.executemany(
+        "INSERT INTO standups (name, yesterday, today, blockers, created_at) VALUES (?, ?, ?, ?, ?)",
+        [
+            (f"user{i % 50}", "Reviewed PRs", f"Working on item {i}", "" if i % 5 else "Waiting on lab",
+             (today - timedelta(seconds=i % 40000)).isoformat(timespec="seconds"))
+            for i in range(rows)
+        ],
+    )
+    conn.commit()
+    conn.close()
+
+
+def hold_write_lock(lock_ms: float, held: threading.Event) -> None:
+    from app.db import get_connection
+
+    conn = get_connection()
+    conn.execute("BEGIN IMMEDIATE")
+    held.set()
+    time.sleep(lock_ms / 1000.0)
+    conn.rollback()
+    conn.close()
+
+
+async def run_variant(name: str, args) -> Dict[str, Any]:
+    from app.core.loop_monitor import LoopLagMonitor
+    from app.schemas.task import TaskCreate
+    from app.services import standup_store, task_store
+
+    items = [TaskCreate(title=f"Bench task {i}") for i in range(args.batch)]
+
+    async def handler() -> None:
+        if name == "blocking":
+            standup_store.get_today_standups()
+            task_store.add_tasks_bulk("bench", items)
+        else:
+            await standup_store.get_today_standups_async()
+            await task_store.add_tasks_bulk_async("bench", items)
+
+    monitor = LoopLagMonitor(interval=args.interval_ms / 1000.0, stall_ms=args.stall_ms)
+    monitor.start()
+    await asyncio.sleep(args.interval_ms / 1000.0 * 3)  # baseline samples
+
+    start = time.perf_counter()
+    for _ in range(args.rounds):
+        locker = None
+        if args.lock_ms:
+            held = threading.Event()
+            locker = threading.Thread(target=hold_write_lock, args=(args.lock_ms, held))
+            locker.start()
+            held.wait()
+        await asyncio.gather(*(handler() for _ in range(args.concurrency)))
+        # Let the monitor take a sample between rounds
+        await asyncio.sleep(args.interval_ms / 1000.0)
+        if locker is not None:
+            locker.join()
+    elapsed = time.perf_counter() - start
+
+    await monitor.stop()
+    stats = monitor.stats()
+    return {
+        "wall_ms": round(elapsed * 1000, 1),
+        "lag_p50_ms": stats["lag_ms"]["p50"],
+        "lag_p99_ms": stats["lag_ms"]["p99"],
+        "lag_max_ms": stats["lag_ms"]["max"],
+        "stalls": stats["stalls"],
+        "samples": stats["samples"],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=2000, help="Standups in the scratch database")
+    parser.add_argument("--rounds", type=int, default=10, help="Rounds per variant")
+    parser.add_argument("--concurrency", type=int, default=8, help="Handlers started per round")
+    parser.add_argument("--batch", type=int, default=20, help="Tasks inserted per handler")
+    parser.add_argument("--lock-ms", type=float, default=300.0, help="Hold the write lock this long per round (0 = off)")
+    parser.add_argument("--interval-ms", type=float, default=10.0, help="Monitor sampling interval")
+    parser.add_argument("--stall-ms", type=float, default=100.0, help="Lag counted as a stall")
+    parser.add_argument("--output", type=Path, help="Write JSON results to this file")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="devcell-loop-bench-") as tmp:
+        os.environ["DEVCELL_DB_PATH"] = str(Path(tmp) / "bench.db")
+
+        from app.db import init_db
+        from app.db_async import shutdown_db_executor
+
+        init_db()
+        fill_database(args.rows)
+
+        results: Dict[str, Any] = {}
+        for name in ("blocking", "async"):
+            results[name] = asyncio.run(run_variant(name, args))
+            shutdown_db_executor()
+
+    report = {
+        "rows": args.rows,
+        "rounds": args.rounds,
+        "concurrency": args.concurrency,
+        "lock_ms": args.lock_ms,
+        "interval_ms": args.interval_ms,
+        "variants": results,
+    }
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+# scripts/benchmark_sdlc_prompt_tokens.py
+"""
+Benchmark prompt size of the SDLC demo orchestrator per run.
+
+Runs every pipeline mode with both context policies ("full" and "bounded")
+against a canned responder instead of the LLM server. Each agent "replies"
+with a fixed-size markdown document, so prompt growth comes only from how
+context is passed between agents. For each run it reports the estimated
+prompt tokens per agent (same estimate as context_budget.py), the largest
+single prompt and the total.
+
+No LLM server is needed and the numbers are deterministic.
+
+Usage (from repo root):
+    python scripts/benchmark_sdlc_prompt_tokens.py
+    python scripts/benchmark_sdlc_prompt_tokens.py --response-tokens 1200 --input-tokens 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Any, Dict, List
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "backend")))
+
+from app.services.agents import sdlc_demo  # noqa: E402
+from app.services.agents.context_budget import CHARS_PER_TOKEN  # noqa: E402
+
+
+def _canned_text(label: str, tokens: int) -> str:
+    lines = [f"## {label}"]
+    i = 0
+    while sum(len(line) + 1 for line in lines) < tokens * CHARS_PER_TOKEN:
+        i += 1
+        lines.append(f"- {label} point {i}: details that a later agent may or may not need.")
+    return "\n".join(lines)
+
+
+def install_canned_responder(response_tokens: int) -> None:
+    async def fake_llm_chat(messages: List[dict], *args: Any, **kwargs: Any) -> str:
+        first_line = messages[0]["content"].splitlines()[0]
+        return _canned_text(first_line[:40], response_tokens)
+
+    sdlc_demo.llm_chat = fake_llm_chat
+
+
+async def run_benchmark(input_tokens: int) -> Dict[str, Any]:
+    orchestrator = sdlc_demo.SdlcMultiAgentOrchestrator()
+    user_input = _canned_text("Input", input_tokens)
+    runs: Dict[str, Any] = {}
+
+    for mode in sdlc_demo.PIPELINES:
+        runs[mode] = {}
+        for policy in ("full", "bounded"):
+            result = await orchestrator.run(
+                mode=mode,
+                user_input=user_input,
+                execution="sequential",
+                context_policy=policy,
+            )
+            per_agent = {e["agent"]: e["prompt_tokens"] for e in result["transcript"]}
+            runs[mode][policy] = {
+                "prompt_tokens_total": result["prompt_tokens"],
+                "prompt_tokens_max": max(per_agent.values()),
+                "per_agent": per_agent,
+            }
+
+        full = runs[mode]["full"]["prompt_tokens_total"]
+        bounded = runs[mode]["bounded"]["prompt_tokens_total"]
+        runs[mode]["reduction"] = round(1 - bounded / full, 3) if full else 0.0
+
+    return runs
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--response-tokens", type=int, default=800, help="Size of each canned agent reply")
+    parser.add_argument("--input-tokens", type=int, default=600, help="Size of the original request/diff")
+    parser.add_argument("--output", type=Path, help="Write JSON results to this file")
+    args = parser.parse_args()
+
+    install_canned_responder(args.response_tokens)
+    runs = asyncio.run(run_benchmark(args.input_tokens))
+
+    report = {
+        "settings": {
+            "response_tokens": args.response_tokens,
+            "input_tokens": args.input_tokens,
+            "context_token_budget": sdlc_demo.settings.SDLC_CONTEXT_TOKEN_BUDGET,
+            "summary_input_tokens": sdlc_demo.settings.SDLC_SUMMARY_INPUT_TOKENS,
+        },
+        "runs": runs,
+    }
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
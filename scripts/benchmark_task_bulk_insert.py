@@ -0,0 +1,109 @@
+# scripts/benchmark_task_bulk_insert.py
+"""
+Benchmark task creation: one add_task() call per task versus add_tasks_bulk().
+
+Writes a synthetic training seed file (same format as
+devcell-training/export/tasks_seed.json) and imports it into a scratch SQLite
+database twice:
+
+  - "per_task": the old path, add_task() per item (one connection and one
+    commit per task)
+  - "bulk": import_training_tasks(), which batches every item through
+    add_tasks_bulk() in a single transaction
+
+Reports wall time and tasks/s for each path as JSON. The real database is
+never touched: DEVCELL_DB_PATH points at a temporary file.
+
+Usage (from repo root):
+    python scripts/benchmark_task_bulk_insert.py
+    python scripts/benchmark_task_bulk_insert.py --items 10000 --output bench.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "backend")))
+
+STATUSES = ["todo", "in_progress", "done", "blocked"]
+
+
+def write_seed_file(path: Path, count: int) -> None:
+    items: List[Dict[str, Any]] = []
+    for i in range(count):
+        status = STATUSES[i % len(STATUSES)]
+        items.append(
+            {
+                "title": f"Training task {i}: analyse sample {i % 97}",
+                "description": f"Week {i % 12 + 1} exercise. Document findings for sample {i}.",
+                "status": status,
+                "project_name": "Malware Dev Training",
+                "tags": ["training", f"week-{i % 12 + 1}"],
+                "progress": 100 if status == "done" else (i * 7) % 100,
+                "is_active": True,
+            }
+        )
+    path.write_text(json.dumps({"items": items}), encoding="utf-8")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=10000, help="Number of seed tasks")
+    parser.add_argument("--output", type=Path, help="Write JSON results to this file")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="devcell-bulk-bench-") as tmp:
+        tmp_dir = Path(tmp)
+        os.environ["DEVCELL_DB_PATH"] = str(tmp_dir / "bench.db")
+
+        from app.db import init_db
+        from app.schemas.task import TaskCreate
+        from app.services.task_store import add_task
+        from app.services.training_import import import_training_tasks, load_training_seeds
+
+        init_db()
+        seed_path = tmp_dir / "tasks_seed.json"
+        write_seed_file(seed_path, args.items)
+
+        # Old path: one add_task() (connection + commit) per item
+        start = time.perf_counter()
+        for item in load_training_seeds(seed_path):
+            add_task(
+                "bench-per-task",
+                TaskCreate(
+                    title=item["title"],
+                    description=item["description"],
+                    status=item["status"],
+                    progress=item["progress"],
+                    is_active=item["is_active"],
+                ),
+            )
+        per_task_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        created = import_training_tasks("bench-bulk", path=seed_path)
+        bulk_s = time.perf_counter() - start
+        assert len(created) == args.items
+
+    report = {
+        "items": args.items,
+        "per_task": {"seconds": round(per_task_s, 3), "tasks_per_s": round(args.items / per_task_s, 1)},
+        "bulk": {"seconds": round(bulk_s, 3), "tasks_per_s": round(args.items / bulk_s, 1)},
+        "speedup": round(per_task_s / bulk_s, 1) if bulk_s else None,
+    }
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    print(text)
+
+
+if __name__ == "__main__":
+    main()